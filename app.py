@@ -1,6 +1,8 @@
-import csv
+import atexit
+import io
+import json
 import os
-from collections import deque
+import time
 from typing import Any, Dict
 
 from datetime import datetime
@@ -8,37 +10,65 @@ from modules.helpers import (
     get_chromedriver_log_path,
     get_latest_screenshot_path,
     get_log_path,
+    get_run_logs_directory,
+    read_log_since,
+    tail_log_lines,
 )
+from modules.history_store import ApplicationHistoryStore
 from modules.job_store import JobStore
 from modules.job_worker import JobWorker
 from werkzeug.utils import secure_filename
 
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import Flask, Response, jsonify, render_template, request, send_file, stream_with_context
 from flask_cors import CORS
 
 app = Flask(__name__)
 
 allowed_origin = os.getenv("ALLOWED_ORIGIN") or os.getenv("RENDER_EXTERNAL_URL") or "*"
-CORS(app, resources={r"/*": {"origins": allowed_origin}}, methods=["GET", "PUT", "POST", "OPTIONS"])
+CORS(app, resources={r"/*": {"origins": allowed_origin}}, methods=["GET", "PUT", "POST", "OPTIONS"], expose_headers=["X-Next-Cursor"])
 
 PATH = 'all excels/'
 JOBS_DB_PATH = os.getenv('JOBS_DB_PATH', os.path.join('data', 'jobs.db'))
 RESUME_UPLOAD_PATH = os.getenv('DEFAULT_RESUME_PATH', os.path.join('all resumes', 'uploaded', 'resume.pdf'))
 ALLOWED_RESUME_EXTENSIONS = {'.pdf', '.doc', '.docx'}
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+SSE_POLL_INTERVAL = float(os.getenv('SSE_POLL_INTERVAL', 1.0))
+SSE_MAX_DURATION = float(os.getenv('SSE_MAX_DURATION', 300))
+SSE_KEEPALIVE_INTERVAL = 15
+LOG_TAIL_LINES = 200
+TERMINAL_STATUSES = {'completed', 'failed'}
 LOG_PATH = get_log_path()
 CHROMEDRIVER_LOG_PATH = get_chromedriver_log_path()
 
 job_store = JobStore(JOBS_DB_PATH)
-job_worker = JobWorker(job_store, poll_interval=5)
+job_worker = JobWorker(
+    job_store,
+    poll_interval=5,
+    max_workers=int(os.getenv('JOB_WORKERS', 1)),
+    max_per_profile=int(os.getenv('JOB_MAX_PER_PROFILE', 1)),
+)
+# Wait for the slots: they are daemon threads, and only they put the stopped runs back in the queue.
+atexit.register(job_worker.shutdown, wait=True, requeue=True)
 
 
 def get_history_csv_path() -> str:
-    """Return absolute path to the applied jobs history CSV."""
+    """Return absolute path to the legacy applied jobs history CSV."""
     from config.settings import file_name
 
     return os.path.join(os.getcwd(), file_name)
 
 
+def get_history_db_path() -> str:
+    """Return absolute path to the applied jobs history database."""
+    from config.settings import history_db_path
+
+    return os.path.join(os.getcwd(), history_db_path)
+
+
+history_store = ApplicationHistoryStore(get_history_db_path(), legacy_csv_path=get_history_csv_path())
+
+
 def _ensure_resume_directory():
     os.makedirs(os.path.dirname(RESUME_UPLOAD_PATH), exist_ok=True)
 
@@ -63,6 +93,7 @@ def _serialize_job_run(job: Dict[str, Any]) -> Dict[str, Any]:
         'id': job.get('id'),
         'status': job.get('status'),
         'progress': job.get('progress', 0),
+        'stats': job.get('result') or {},
         'created_at': job.get('created_at'),
         'updated_at': job.get('updated_at'),
         'profile_name': payload.get('profileName'),
@@ -72,6 +103,67 @@ def _serialize_job_run(job: Dict[str, Any]) -> Dict[str, Any]:
         'parameters': payload.get('parameters', {}),
     }
     ##<
+
+
+def _parse_listing_args() -> Dict[str, Any]:
+    '''
+    Translate `?status=&after=<created_at,id>&limit=&view=summary` into `JobStore.list_jobs` arguments.
+    Raises `ValueError` on malformed values.
+    '''
+    statuses = [status.strip() for status in request.args.get('status', '').split(',') if status.strip()]
+
+    after = None
+    cursor = request.args.get('after')
+    if cursor:
+        created_at, separator, job_id = cursor.partition(',')
+        if not separator or not created_at or not job_id:
+            raise ValueError("'after' must be formatted as '<created_at>,<id>'")
+        after = (created_at, job_id)
+
+    limit_arg = request.args.get('limit', DEFAULT_PAGE_SIZE)
+    try:
+        limit = int(limit_arg)
+    except (TypeError, ValueError):
+        raise ValueError("'limit' must be an integer")
+    if limit < 1:
+        raise ValueError("'limit' must be positive")
+
+    return {
+        'statuses': statuses or None,
+        'after': after,
+        'limit': min(limit, MAX_PAGE_SIZE),
+        'summary': request.args.get('view') == 'summary',
+    }
+
+
+def _paginated_response(items: list, raw_jobs: list, limit: int):
+    '''
+    Return `items` as JSON, advertising the cursor for the next page in the `X-Next-Cursor` header.
+    '''
+    response = jsonify(items)
+    if len(raw_jobs) == limit:
+        last = raw_jobs[-1]
+        response.headers['X-Next-Cursor'] = f"{last['created_at']},{last['id']}"
+    return response
+
+
+def _sse(event: str, data: Any) -> str:
+    '''
+    Format one Server-Sent Events message.
+    '''
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _event_stream(generate) -> Response:
+    '''
+    Wrap an SSE generator in a non-buffered streaming response.
+    '''
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 ##> ------ Karthik Sarode : karthik.sarode23@gmail.com - UI for excel files ------
 @app.route('/')
 def home():
@@ -89,9 +181,41 @@ def view_job_run(run_id: str):
 @app.route('/job-runs', methods=['GET'])
 def list_job_runs():
     """Return current job runs with their latest status and progress."""
-    jobs = job_store.list_jobs()
+    try:
+        listing_args = _parse_listing_args()
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    jobs = job_store.list_jobs(**listing_args)
     job_runs = [_serialize_job_run(job) for job in jobs]
-    return jsonify(job_runs)
+    return _paginated_response(job_runs, jobs, listing_args['limit'])
+
+
+@app.route('/job-runs/stream', methods=['GET'])
+def stream_job_runs():
+    """Push the run list once, then only the runs whose status or progress changed."""
+    def generate():
+        yield f"retry: {int(SSE_POLL_INTERVAL * 3000)}\n\n"
+        known: Dict[str, Dict[str, Any]] = {}
+        started = last_sent = time.monotonic()
+        first = True
+        while time.monotonic() - started < SSE_MAX_DURATION:
+            runs = [_serialize_job_run(job) for job in job_store.list_jobs(limit=DEFAULT_PAGE_SIZE)]
+            if first:
+                yield _sse('snapshot', runs)
+                first = False
+                last_sent = time.monotonic()
+            else:
+                for run in runs:
+                    if known.get(run['id']) != run:
+                        yield _sse('run', run)
+                        last_sent = time.monotonic()
+            known = {run['id']: run for run in runs}
+            if time.monotonic() - last_sent >= SSE_KEEPALIVE_INTERVAL:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+            time.sleep(SSE_POLL_INTERVAL)
+
+    return _event_stream(generate)
 
 
 @app.route('/job-runs', methods=['POST'])
@@ -122,38 +246,127 @@ def get_job_run_details(run_id: str):
     return jsonify(run)
 
 
-@app.route('/job-runs/<run_id>/logs', methods=['GET'])
-def get_job_run_logs(run_id: str):
-    _ = _get_job_run(run_id)
-    if not _:
+@app.route('/job-runs/<run_id>/stream', methods=['GET'])
+def stream_job_run(run_id: str):
+    """
+    Push status/progress changes, appended log lines and new screenshots for one run.
+    * `?worker_since=` and `?chromedriver_since=` resume each log from the `offset` the page already has;
+      without them the stream starts at the end of the log, or at 0 for a log that does not exist yet.
+    * Every `log` event carries the `offset` to resume from.
+    """
+    if not _get_job_run(run_id):
         return jsonify({"error": "Job run not found"}), 404
 
-    if not os.path.exists(LOG_PATH):
-        return jsonify({"logs": [], "message": "Log file not found"})
+    log_offsets: Dict[str, int | None] = {}
+    for source in ('worker', 'chromedriver'):
+        try:
+            log_offsets[source] = max(int(request.args[f'{source}_since']), 0)
+        except (KeyError, ValueError):
+            log_offsets[source] = None
+
+    def generate():
+        yield f"retry: {int(SSE_POLL_INTERVAL * 3000)}\n\n"
+        previous_run = None
+        run_paths = _run_log_paths(run_id)
+        log_paths = {source: run_paths[source] for source in ('worker', 'chromedriver')}
+        previous_screenshot = None
+        started = last_sent = time.monotonic()
+        while time.monotonic() - started < SSE_MAX_DURATION:
+            run = _get_job_run(run_id)
+            if not run:
+                yield _sse('gone', {'id': run_id})
+                return
+            if run != previous_run:
+                yield _sse('run', run)
+                previous_run = run
+                last_sent = time.monotonic()
+
+            for source, path in log_paths.items():
+                try:
+                    lines, log_offsets[source], truncated = read_log_since(path, log_offsets[source])
+                except OSError:
+                    if log_offsets[source] is None:
+                        log_offsets[source] = 0
+                    continue
+                if lines:
+                    yield _sse('log', {'source': source, 'lines': lines, 'offset': log_offsets[source], 'truncated': truncated})
+                    last_sent = time.monotonic()
+
+            latest = get_latest_screenshot_path(run_paths['screenshots'])
+            if latest and latest != previous_screenshot:
+                previous_screenshot = latest
+                yield _sse('screenshot', {'name': os.path.basename(latest)})
+                last_sent = time.monotonic()
+
+            if run['status'] in TERMINAL_STATUSES:
+                return
+            if time.monotonic() - last_sent >= SSE_KEEPALIVE_INTERVAL:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+            time.sleep(SSE_POLL_INTERVAL)
+
+    return _event_stream(generate)
+
+
+def _run_log_paths(run_id: str) -> Dict[str, str | None]:
+    '''
+    Locate a run's bot log, ChromeDriver log and screenshots folder.
+    * Runs started by `JobWorker` write everything to `logs/runs/<run_id>/`, so the job id is the index
+    * Runs recorded before per-run folders existed fall back to the shared log files
+    '''
+    run_dir = get_run_logs_directory(run_id)
+    if os.path.isdir(run_dir):
+        return {
+            'worker': os.path.join(run_dir, 'log.txt'),
+            'chromedriver': os.path.join(run_dir, 'chromedriver.log'),
+            'screenshots': run_dir,
+        }
+    return {'worker': LOG_PATH, 'chromedriver': CHROMEDRIVER_LOG_PATH, 'screenshots': None}
+
+
+def _log_tail_response(path: str, missing_message: str):
+    '''
+    Serve a log file incrementally.
+    * Without `?since=`, returns the last `LOG_TAIL_LINES` lines.
+    * With `?since=<byte offset>`, returns only complete lines appended after that offset.
+    Both include the `offset` to pass as `since` on the next request.
+    '''
+    if not os.path.exists(path):
+        return jsonify({"logs": [], "message": missing_message})
 
+    since = request.args.get('since')
     try:
-        with open(LOG_PATH, 'r', encoding='utf-8') as file:
-            tail_lines = list(deque(file, maxlen=200))
-        return jsonify({"logs": tail_lines})
+        if since is None:
+            lines, offset = tail_log_lines(path, LOG_TAIL_LINES)
+            return jsonify({"logs": lines, "offset": offset})
+        try:
+            since_offset = int(since)
+        except ValueError:
+            return jsonify({"error": "'since' must be a byte offset"}), 400
+        if since_offset < 0:
+            return jsonify({"error": "'since' must be a byte offset"}), 400
+        lines, offset, truncated = read_log_since(path, since_offset, max_lines=LOG_TAIL_LINES)
+        return jsonify({"logs": lines, "offset": offset, "truncated": truncated})
     except Exception as exc:  # pragma: no cover - defensive logging
         return jsonify({"error": str(exc)}), 500
 
 
+@app.route('/job-runs/<run_id>/logs', methods=['GET'])
+def get_job_run_logs(run_id: str):
+    _ = _get_job_run(run_id)
+    if not _:
+        return jsonify({"error": "Job run not found"}), 404
+
+    return _log_tail_response(_run_log_paths(run_id)['worker'], "Log file not found")
+
+
 @app.route('/job-runs/<run_id>/chromedriver-logs', methods=['GET'])
 def get_job_run_chromedriver_logs(run_id: str):
     _ = _get_job_run(run_id)
     if not _:
         return jsonify({"error": "Job run not found"}), 404
 
-    if not os.path.exists(CHROMEDRIVER_LOG_PATH):
-        return jsonify({"logs": [], "message": "ChromeDriver log file not found"})
-
-    try:
-        with open(CHROMEDRIVER_LOG_PATH, 'r', encoding='utf-8') as file:
-            tail_lines = list(deque(file, maxlen=200))
-        return jsonify({"logs": tail_lines})
-    except Exception as exc:  # pragma: no cover - defensive logging
-        return jsonify({"error": str(exc)}), 500
+    return _log_tail_response(_run_log_paths(run_id)['chromedriver'], "ChromeDriver log file not found")
 
 
 @app.route('/job-runs/<run_id>/chromedriver-screenshot', methods=['GET'])
@@ -162,7 +375,7 @@ def get_job_run_chromedriver_screenshot(run_id: str):
     if not _:
         return jsonify({"error": "Job run not found"}), 404
 
-    latest = get_latest_screenshot_path()
+    latest = get_latest_screenshot_path(_run_log_paths(run_id)['screenshots'])
     if not latest:
         return jsonify({"message": "No ChromeDriver screenshots available yet"}), 404
 
@@ -195,46 +408,102 @@ def upload_resume():
         "filename": destination_filename,
     }), 201
 
+def _parse_history_args() -> Dict[str, Any]:
+    '''
+    Translate `?company=&title=&q=&sort=asc|desc&after=<date_applied,job_id>&limit=` into
+    `ApplicationHistoryStore.list_applications` arguments. Raises `ValueError` on malformed values.
+    '''
+    sort = request.args.get('sort', 'desc').lower()
+    if sort not in ('asc', 'desc'):
+        raise ValueError("'sort' must be 'asc' or 'desc'")
+
+    after = None
+    cursor = request.args.get('after')
+    if cursor:
+        # Dates never contain commas, Job IDs are numeric.
+        date_applied, separator, job_id = cursor.rpartition(',')
+        if not separator or not job_id:
+            raise ValueError("'after' must be formatted as '<date_applied>,<job_id>'")
+        after = (date_applied, job_id)
+
+    limit_arg = request.args.get('limit', DEFAULT_PAGE_SIZE)
+    try:
+        limit = int(limit_arg)
+    except (TypeError, ValueError):
+        raise ValueError("'limit' must be an integer")
+    if limit < 1:
+        raise ValueError("'limit' must be positive")
+
+    return {
+        'company': request.args.get('company', '').strip() or None,
+        'title': request.args.get('title', '').strip() or None,
+        'search': request.args.get('q', '').strip() or None,
+        'ascending': sort == 'asc',
+        'after': after,
+        'limit': min(limit, MAX_PAGE_SIZE),
+    }
+
+
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
+    Retrieves one page of applied jobs from the applications history database.
     
     Returns a JSON response containing a list of jobs, each with details such as 
     Job ID, Title, Company, HR Name, HR Link, Job Link, External Job link, and Date Applied.
+    Job descriptions and screening questions are never sent.
+
+    Supports `?company=`, `?title=` and `?q=` (full-text) filters, `?sort=asc|desc` by Date Applied
+    and `?limit=`. The cursor for the next page is in the `X-Next-Cursor` header, pass it back as `?after=`.
     
-    If the CSV file is not found, returns a 404 error with a relevant message.
+    Returns a 400 error for malformed parameters.
     If any other exception occurs, returns a 500 error with the exception message.
     '''
 
     try:
-        jobs = []
-        csv_path = get_history_csv_path()
-
-        if not os.path.exists(csv_path):
-            return jsonify(jobs)
-
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row['Job ID'],
-                    'Title': row['Title'],
-                    'Company': row['Company'],
-                    'HR_Name': row['HR Name'],
-                    'HR_Link': row['HR Link'],
-                    'Job_Link': row['Job Link'],
-                    'External_Job_link': row['External Job link'],
-                    'Date_Applied': row['Date Applied']
-                })
-        return jsonify(jobs)
+        history_args = _parse_history_args()
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+
+    try:
+        rows = history_store.list_applications(**history_args)
+        jobs = [
+            {
+                'Job_ID': row['Job ID'],
+                'Title': row['Title'],
+                'Company': row['Company'],
+                'HR_Name': row['HR Name'],
+                'HR_Link': row['HR Link'],
+                'Job_Link': row['Job Link'],
+                'External_Job_link': row['External Job link'],
+                'Date_Applied': row['Date Applied']
+            }
+            for row in rows
+        ]
+        response = jsonify(jobs)
+        if len(rows) == history_args['limit']:
+            last = rows[-1]
+            response.headers['X-Next-Cursor'] = f"{last['Date Applied']},{last['Job ID']}"
+        return response
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/applied-jobs/export', methods=['GET'])
+def export_applied_jobs():
+    """Download the whole applications history as a CSV file in the original layout."""
+    try:
+        buffer = io.StringIO()
+        history_store.export_csv(buffer)
+        response = Response(buffer.getvalue(), mimetype='text/csv')
+        response.headers['Content-Disposition'] = f'attachment; filename="{os.path.basename(get_history_csv_path())}"'
+        return response
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history database.
 
     Args:
         job_id (str): The Job ID of the job to be updated.
@@ -246,31 +515,10 @@ def update_applied_date(job_id):
         exception message.
     """
     try:
-        data = []
-        csv_path = get_history_csv_path()
-
-        if not os.path.exists(csv_path):
-            return jsonify({"error": f"CSV file not found at {csv_path}"}), 404
-
-        # Read current CSV content
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            field_names = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    found = True
-                data.append(row)
-
-        if not found:
+        updated = history_store.update_date_applied(job_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        if not updated:
             return jsonify({"error": f"Job ID {job_id} not found"}), 404
 
-        with open(csv_path, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=field_names)
-            writer.writeheader()
-            writer.writerows(data)
-
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
         print(f"Error updating applied date: {str(e)}")  # Debug log
@@ -303,8 +551,12 @@ def create_job():
 
 @app.route('/jobs', methods=['GET'])
 def list_jobs():
-    jobs = job_store.list_jobs()
-    return jsonify(jobs), 200
+    try:
+        listing_args = _parse_listing_args()
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    jobs = job_store.list_jobs(**listing_args)
+    return _paginated_response(jobs, jobs, listing_args['limit']), 200
 
 
 @app.route('/jobs/<job_id>', methods=['GET'])
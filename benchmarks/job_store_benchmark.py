@@ -0,0 +1,114 @@
+'''
+Benchmark JobStore status updates while dashboard-style readers poll concurrently.
+
+Usage:
+    python benchmarks/job_store_benchmark.py [--seconds 5] [--readers 4]
+
+Runs the same workload twice: once with the original JobStore (a new connection
+per call and read-then-write status updates) and once with the current one (pooled
+WAL connections and single-statement updates), and prints updates/sec for each.
+The difference is the combined effect of both changes.
+'''
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.job_store import JobStore
+
+
+class LegacyJobStore(JobStore):
+    """The original JobStore: a fresh rollback-journal connection per call, and updates that read the job before writing it."""
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, check_same_thread=False)
+
+    def list_jobs(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, status, progress, payload, result, error, created_at, updated_at FROM jobs"
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def update_status(
+        self,
+        job_id: str,
+        status: str,
+        progress: Optional[int] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        job = self.get_job(job_id)
+        if not job:
+            return
+        new_progress = progress if progress is not None else job.get("progress", 0)
+        now = datetime.utcnow().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = ?, progress = ?, result = ?, error = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (status, new_progress, json.dumps(result) if result is not None else job.get("result"), error, now, job_id),
+            )
+
+
+def run_workload(store: JobStore, seconds: float, readers: int) -> tuple[int, int]:
+    '''
+    Hammer `update_status` from one writer while `readers` threads call `list_jobs`.
+    * Returns `(updates, reads)` completed within `seconds`.
+    '''
+    job_ids = [store.create_job({"profileName": f"bench-{index}"}) for index in range(20)]
+    stop = threading.Event()
+    reads = [0] * readers
+
+    def reader(slot: int) -> None:
+        while not stop.is_set():
+            store.list_jobs()
+            reads[slot] += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,), daemon=True) for slot in range(readers)]
+    for thread in threads:
+        thread.start()
+
+    updates = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        store.update_status(job_ids[updates % len(job_ids)], status="running", progress=updates % 100)
+        updates += 1
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return updates, sum(reads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration of each run")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent reader threads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, store_class in (("before (original JobStore)", LegacyJobStore), ("after (pooled WAL, 1 statement)", JobStore)):
+            store = store_class(os.path.join(tmp, f"{store_class.__name__}.db"))
+            updates, reads = run_workload(store, args.seconds, args.readers)
+            store.close()
+            print(
+                f"{label:<34} {updates / args.seconds:>10.1f} updates/s  "
+                f"{reads / args.seconds:>10.1f} reads/s  ({args.readers} readers)"
+            )
+
+
+if __name__ == "__main__":
+    main()
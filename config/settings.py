@@ -58,11 +58,36 @@ generated_resume_path = "all resumes/" # (In Development)
 # >>>>>>>>>>> Global Settings <<<<<<<<<<<
 
 # Directory and name of the files where history of applied jobs is saved (Sentence after the last "/" will be considered as the file name).
-file_name = "all excels/all_applied_applications_history.csv"
+history_db_path = "all excels/applications_history.db"     # Applied jobs history database
+file_name = "all excels/all_applied_applications_history.csv"   # Old CSV history, imported into history_db_path the first time it's created. Download an up to date CSV from the dashboard (/applied-jobs/export)
 failed_file_name = "all excels/all_failed_applications_history.csv"
+answer_bank_db_path = "all excels/answer_bank.db"     # Answers to application questions learnt from submitted applications, reused for the same questions in later applications
+ai_cache_db_path = "all excels/ai_cache.db"     # AI responses saved for reuse, so the same job description isn't sent to the AI again
+ai_cache_max_entries = 5000         # Enter max AI responses to keep, least recently used ones are removed first. 0 disables the cache. (Only Non Negative Integers Eg: 0,1000,5000,....)
+batch_ai_questions = True          # True or False, Note: True or False are case-sensitive. If True, asks AI all unanswered questions of an Easy Apply page in one request, including select and radio questions, instead of one request per question
+ai_answer_cache_days = 30           # Enter number of days AI answers to application questions are reused for. Answers used in a submitted application are kept for good. 0 disables caching answers. (Only Non Negative Integers Eg: 0,7,30,....)
+
+# How long skipped jobs (bad words, clearance, experience too high, blacklisted company) and blacklisted companies are remembered, so later runs don't open them again.
+rejected_jobs_ttl_days = 30         # Enter number of days. 0 only remembers them during the current run. (Only Non Negative Integers Eg: 0,1,2,3,....)
+blacklisted_companies_ttl_days = 90 # Enter number of days. 0 only remembers them during the current run. (Only Non Negative Integers Eg: 0,1,2,3,....)
 logs_folder_path = "logs/"
 
-# Set the maximum amount of time allowed to wait between each click in secs
+# log.txt is compressed and rotated once it grows past this size, keeping the most recent backups.
+log_max_size_mb = 10                # Enter max size in MB before rotating. 0 disables rotation. (Only Non Negative Integers Eg: 0,1,2,3,....)
+log_backup_count = 5                # Enter number of compressed old logs to keep. (Only Non Negative Integers Eg: 0,1,2,3,....)
+
+# Download job details over HTTP with the browser's login instead of opening every job in the browser. The browser is then only used for jobs that pass the skip checks. Falls back to the browser for any job whose page can't be read. (Experimental)
+fetch_job_details_over_http = False # True or False, Note: True or False are case-sensitive
+http_fetch_workers = 4              # Enter how many job pages may download at once. (Only Positive Integers Eg: 1,2,3,....)
+http_fetch_interval_ms = 1000       # Enter minimum milliseconds between two downloads, to stay under LinkedIn's rate limits. (Only Non Negative Integers Eg: 0,500,1000,....)
+# While a job is being applied to, screen the next few downloaded jobs and start their AI skill extraction in the background. Only used when fetch_job_details_over_http is True.
+prescreen_jobs_ahead = 1            # Enter how many jobs to screen ahead. (Only Non Negative Integers Eg: 0,1,2,3,....)
+
+# Wait for the page to finish reacting after each click or typed text (until nothing on it changes and no network request completes for dom_quiet_ms), instead of sleeping fixed times. If False, the bot sleeps fixed times as before.
+event_driven_waits = True           # True or False, Note: True or False are case-sensitive
+dom_quiet_ms = 300                  # Enter milliseconds the page must stay unchanged to be considered loaded. (Only Non Negative Integers Eg: 0,300,500,....)
+
+# Set the maximum amount of time allowed to wait between each click in secs. This is a human-like random pause on top of waiting for the page, 0 doesn't pause at all (faster, but less human-like).
 click_gap = 1                       # Enter max allowed secs to wait approximately. (Only Non Negative Integers Eg: 0,1,2,3,....)
 
 # If you want to see Chrome running then set run_in_background as False (May reduce performance). 
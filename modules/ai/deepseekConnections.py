@@ -2,8 +2,10 @@
 from config.secrets import *
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai_cache import answer_cache_key, answer_cache_ttl, cached_ai_response, cached_answers, make_cache_key
 from modules.ai.prompts import *
 
+import json
 from pyautogui import confirm
 from openai import OpenAI
 from openai.types.model import Model
@@ -159,19 +161,21 @@ def deepseek_extract_skills(client: OpenAI, job_description: str, stream: bool =
         # DeepSeek API supports json_object response format
         custom_response_format = {"type": "json_object"}
         
-        # Call DeepSeek completion
-        result = deepseek_completion(
-            client=client,
-            messages=messages,
-            response_format=custom_response_format,
-            stream=stream
-        )
-        
-        # Ensure the result is a dictionary
-        if isinstance(result, str):
-            result = convert_to_json(result)
+        def extract() -> dict:
+            # Call DeepSeek completion
+            result = deepseek_completion(
+                client=client,
+                messages=messages,
+                response_format=custom_response_format,
+                stream=stream
+            )
             
-        return result
+            # Ensure the result is a dictionary
+            if isinstance(result, str):
+                result = convert_to_json(result)
+            return result
+            
+        return cached_ai_response(make_cache_key("skills", "deepseek", llm_model, prompt), extract)
     except Exception as e:
         critical_error_log("Error occurred while extracting skills with DeepSeek!", e)
         return {"error": str(e)}
@@ -221,16 +225,61 @@ def deepseek_answer_question(
         
         messages = [{"role": "user", "content": prompt}]
         
-        # Call DeepSeek completion
-        result = deepseek_completion(
-            client=client,
-            messages=messages,
-            temperature=0.1,  # Slight randomness for more natural responses
-            stream=stream
-        )
+        def answer() -> str:
+            # Call DeepSeek completion
+            return deepseek_completion(
+                client=client,
+                messages=messages,
+                temperature=0.1,  # Slight randomness for more natural responses
+                stream=stream
+            )
         
-        return result
+        ttl = answer_cache_ttl()
+        if ttl is None:
+            return answer()
+        key = answer_cache_key("deepseek", llm_model, question, question_type, options, job_description, user_information_all)
+        return cached_ai_response(key, answer, ttl)
     except Exception as e:
         critical_error_log("Error occurred while answering question with DeepSeek!", e)
         return {"error": str(e)}
+
+def deepseek_answer_questions(
+    client: OpenAI, 
+    questions: list[dict], job_description: str = None, user_information_all: str = None,
+    stream: bool = stream_output
+) -> dict[str, str]:
+    '''
+    Function to answer all questions of a form page in one request using DeepSeek AI.
+    * Takes in `client` of type `OpenAI` - The DeepSeek client
+    * Takes in `questions` - A list of `{"id", "question", "type", "options"}` dicts
+    * Takes in optional context parameters - job_description, user_information_all
+    * Takes in `stream` of type `bool` - Whether to stream the output
+    * Returns a `dict` of answers by question id
+    '''
+    try:
+        print_lg(f"Answering {len(questions)} questions using DeepSeek AI...")
+        
+        def answer(missing: list[dict]) -> dict[str, str]:
+            prompt = ai_answer_questions_prompt.format(user_information_all or "", json.dumps(missing, indent=2))
+            if job_description:
+                prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+            messages = [{"role": "user", "content": prompt}]
+            
+            # DeepSeek API supports json_object response format
+            result = deepseek_completion(
+                client=client,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=0.1,  # Slight randomness for more natural responses
+                stream=stream
+            )
+            if isinstance(result, str):
+                result = convert_to_json(result)
+            if not isinstance(result, dict): return {}
+            return {item["id"]: item.get("answer") for item in result.get("answers", []) if isinstance(item, dict) and "id" in item}
+        
+        return cached_answers("deepseek", llm_model, questions, job_description, user_information_all, answer)
+    except Exception as e:
+        critical_error_log("Error occurred while answering questions with DeepSeek!", e)
+        return {}
 ##< 
\ No newline at end of file
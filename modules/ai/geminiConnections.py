@@ -1,7 +1,9 @@
+import json
 import google.generativeai as genai
 from config.secrets import llm_model, llm_api_key
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai_cache import answer_cache_key, answer_cache_ttl, cached_ai_response, cached_answers, make_cache_key
 from modules.ai.prompts import *
 from pyautogui import confirm
 from typing import Literal
@@ -122,7 +124,7 @@ def gemini_extract_skills(model, job_description: str) -> list[str] | None:
     try:
         print_lg("Extracting skills from job description using Gemini...")
         prompt = extract_skills_prompt.format(job_description) + "\n\nImportant: Respond with only the JSON object, without any markdown formatting or other text."
-        return gemini_completion(model, prompt, is_json=True)
+        return cached_ai_response(make_cache_key("skills", "gemini", llm_model, prompt), lambda: gemini_completion(model, prompt, is_json=True))
     except Exception as e:
         critical_error_log("Error occurred while extracting skills with Gemini!", e)
         return {"error": str(e)}
@@ -155,7 +157,37 @@ def gemini_answer_question(
         if about_company:
             prompt += f"\n\nABOUT COMPANY:\n{about_company}"
 
-        return gemini_completion(model, prompt)
+        ttl = answer_cache_ttl()
+        if ttl is None:
+            return gemini_completion(model, prompt)
+        key = answer_cache_key("gemini", llm_model, question, question_type, options, job_description, user_information_all)
+        return cached_ai_response(key, lambda: gemini_completion(model, prompt), ttl)
     except Exception as e:
         critical_error_log("Error occurred while answering question with Gemini!", e)
         return {"error": str(e)}
+
+def gemini_answer_questions(
+    model,
+    questions: list[dict], job_description: str = None, user_information_all: str = None
+) -> dict[str, str]:
+    """
+    Answers all questions of a form page in one request using the Gemini API.
+    * Takes in `questions`, a list of `{"id", "question", "type", "options"}` dicts.
+    * Returns a `dict` of answers by question id.
+    """
+    try:
+        print_lg(f"Answering {len(questions)} questions using Gemini AI...")
+
+        def answer(missing: list[dict]) -> dict[str, str]:
+            prompt = ai_answer_questions_prompt.format(user_information_all or "", json.dumps(missing, indent=2))
+            if job_description:
+                prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+            prompt += "\n\nImportant: Respond with only the JSON object, without any markdown formatting or other text."
+            result = gemini_completion(model, prompt, is_json=True)
+            if not isinstance(result, dict): return {}
+            return {item["id"]: item.get("answer") for item in result.get("answers", []) if isinstance(item, dict) and "id" in item}
+
+        return cached_answers("gemini", llm_model, questions, job_description, user_information_all, answer)
+    except Exception as e:
+        critical_error_log("Error occurred while answering questions with Gemini!", e)
+        return {}
@@ -20,8 +20,10 @@ from config.questions import *
 from config.search import security_clearance, did_masters
 
 from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai_cache import answer_cache_key, answer_cache_ttl, cached_ai_response, cached_answers, make_cache_key
 from modules.ai.prompts import *
 
+import json
 from pyautogui import confirm
 from openai import OpenAI
 from openai.types.model import Model
@@ -191,12 +193,13 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     return result
 
 
-def ai_extract_skills(client: OpenAI, job_description: str, stream: bool = stream_output) -> dict | ValueError:
+def ai_extract_skills(client: OpenAI, job_description: str, stream: bool = stream_output, alert: bool = True) -> dict | ValueError:
     """
     Function to extract skills from job description using OpenAI API.
     * Takes in `client` of type `OpenAI`
     * Takes in `job_description` of type `str`
     * Takes in `stream` of type `bool` to indicate if it's a streaming call
+    * Takes in `alert` of type `bool`, `False` logs errors and returns them as `{"error": ...}` instead of showing an alert
     * Returns a `dict` object representing JSON response
     """
     print_lg("-- EXTRACTING SKILLS FROM JOB DESCRIPTION")
@@ -205,9 +208,13 @@ def ai_extract_skills(client: OpenAI, job_description: str, stream: bool = strea
 
         messages = [{"role": "user", "content": prompt}]
         ##> ------ Dheeraj Deshwal : dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Bug fix ------
-        return ai_completion(client, messages, response_format=extract_skills_response_format, stream=stream)
+        return cached_ai_response(make_cache_key("skills", "openai", llm_model, prompt),
+            lambda: ai_completion(client, messages, response_format=extract_skills_response_format, stream=stream))
     ##<
     except Exception as e:
+        if not alert:
+            print_lg("Error occurred while extracting skills from job description!", e)
+            return {"error": str(e)}
         ai_error_alert(f"Error occurred while extracting skills from job description. {apiCheckInstructions}", e)
 
 
@@ -245,15 +252,48 @@ def ai_answer_question(
             prompt += f"\nAbout the Company:\n{about_company}"
 
         messages = [{"role": "user", "content": prompt}]
-        print_lg("Prompt we are passing to AI: ", prompt)
-        response =  ai_completion(client, messages, stream=stream)
+        def answer() -> str:
+            print_lg("Prompt we are passing to AI: ", prompt)
+            return ai_completion(client, messages, stream=stream)
         # print_lg("Response from AI: ", response)
-        return response
+        ttl = answer_cache_ttl()
+        if ttl is None:
+            return answer()
+        key = answer_cache_key("openai", llm_model, question, question_type, options, job_description, user_information_all)
+        return cached_ai_response(key, answer, ttl)
     except Exception as e:
         ai_error_alert(f"Error occurred while answering question. {apiCheckInstructions}", e)
 ##<
 
 
+def ai_answer_questions(
+    client: OpenAI, 
+    questions: list[dict], job_description: str = None, user_information_all: str = None,
+    stream: bool = stream_output
+) -> dict[str, str]:
+    """
+    Function to answer all questions of a form page in one request, instead of one `ai_answer_question` call each.
+    * Takes in `client` of type `OpenAI`
+    * Takes in `questions`, a list of `{"id", "question", "type", "options"}` dicts. `options` are given for `single_select` questions
+    * Takes in optional `job_description` and `user_information_all` for context
+    * Returns a `dict` of answers by question id, without the questions AI didn't answer
+    """
+    print_lg(f"-- ANSWERING {len(questions)} QUESTIONS using AI")
+    try:
+        def answer(missing: list[dict]) -> dict[str, str]:
+            prompt = ai_answer_questions_prompt.format(user_information_all or "N/A", json.dumps(missing, indent=2))
+            if job_description and job_description != "Unknown":
+                prompt += f"\nJob Description:\n{job_description}"
+            messages = [{"role": "user", "content": prompt}]
+            response = ai_completion(client, messages, response_format=ai_answer_questions_response_format, stream=stream)
+            if not isinstance(response, dict): return {}
+            return {item["id"]: item.get("answer") for item in response.get("answers", []) if isinstance(item, dict) and "id" in item}
+        return cached_answers("openai", llm_model, questions, job_description, user_information_all, answer)
+    except Exception as e:
+        ai_error_alert(f"Error occurred while answering questions. {apiCheckInstructions}", e)
+        return {}
+
+
 def ai_gen_experience(
     client: OpenAI, 
     job_description: str, about_company: str, 
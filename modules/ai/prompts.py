@@ -126,4 +126,61 @@ Respond concisely based on the type of question:
 **QUESTION Strat from here:**  
 {}
 """
+
+# Structure of messages = `[{"role": "user", "content": ai_answer_questions_prompt}]`
+
+ai_answer_questions_prompt = """
+You are an intelligent AI assistant filling out a job application form and answer like human.
+Answer EVERY question in the list below. Respond concisely based on the type of question:
+
+1. If the question asks for **years of experience, duration, or numeric value**, answer **only a number** (e.g., "2", "5", "10").
+2. If the question is **a Yes/No question**, answer **only "Yes" or "No"**.
+3. If the question has **options**, answer with **exactly one of its options**, copied as is.
+4. If the question type is "text" and it requires a **short description**, give a **single-sentence answer**.
+5. If the question type is "textarea", provide a **well-structured and human-like answer and keep no of character <350**.
+6. Do **not** repeat the question in your answer.
+7. here is user information to answer the questions if needed:
+**User Information:** 
+{}
+
+Return ONLY a JSON object in the following format, with one answer for each question "id" and no additional commentary:
+{{
+    "answers": [
+        {{"id": "q0", "answer": "..."}}
+    ]
+}}
+
+**QUESTIONS:**
+{}
+"""
+"""
+Use `ai_answer_questions_prompt.format(user_information_all, questions_json)` to insert `user_information_all` and the questions as JSON.
+"""
+
+ai_answer_questions_response_format = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "Answer_Questions_Response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "answers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"id": {"type": "string"}, "answer": {"type": "string"}},
+                        "required": ["id", "answer"],
+                        "additionalProperties": False
+                    }
+                },
+            },
+            "required": ["answers"],
+            "additionalProperties": False
+        },
+    },
+}
+"""
+Response schema for `answer_questions` functions
+"""
 #<
\ No newline at end of file
@@ -0,0 +1,277 @@
+'''
+Persistent cache of AI responses, so the same job description (or question) seen again
+across search terms, sort orders and `run_non_stop` cycles doesn't pay for another LLM call.
+
+Entries are content-addressed: the key is a hash of the normalized input together with the
+provider and model that answered it, so switching either never serves a stale answer. The
+cache is bounded to `max_entries`, evicting the least recently used entries first. Entries
+can expire after a TTL, and promoted entries (answers that made it into a submitted
+application) never expire and are never evicted.
+'''
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import ai_cache_db_path, ai_cache_max_entries, ai_answer_cache_days
+from modules.helpers import print_lg
+from modules.sqlite_store import SQLiteStore
+
+_CREATE_CACHE_SQL = """
+CREATE TABLE IF NOT EXISTS ai_cache (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    expires_at REAL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    promoted INTEGER NOT NULL DEFAULT 0
+)
+"""
+_ADD_PROMOTED_COLUMN_SQL = "ALTER TABLE ai_cache ADD COLUMN promoted INTEGER NOT NULL DEFAULT 0"
+_DROP_LAST_USED_INDEX_SQL = "DROP INDEX IF EXISTS idx_ai_cache_last_used"
+_CREATE_EVICTION_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_ai_cache_eviction ON ai_cache (promoted, last_used)"
+
+_GET_SQL = "SELECT value, expires_at FROM ai_cache WHERE key = ?"
+_TOUCH_SQL = "UPDATE ai_cache SET last_used = ?, hits = hits + 1 WHERE key = ?"
+_DELETE_SQL = "DELETE FROM ai_cache WHERE key = ?"
+_PUT_SQL = """
+    INSERT INTO ai_cache (key, kind, value, created_at, last_used, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        value = excluded.value, created_at = excluded.created_at,
+        last_used = excluded.last_used, expires_at = excluded.expires_at
+"""
+_EVICT_SQL = """
+    DELETE FROM ai_cache WHERE key IN (
+        SELECT key FROM ai_cache WHERE promoted = 0 ORDER BY last_used
+        LIMIT max(0, (SELECT COUNT(*) FROM ai_cache WHERE promoted = 0) - ?)
+    )
+"""
+_PROMOTE_SQL = "UPDATE ai_cache SET promoted = 1, expires_at = NULL WHERE key = ?"
+_PURGE_EXPIRED_SQL = "DELETE FROM ai_cache WHERE expires_at IS NOT NULL AND expires_at <= ?"
+
+# Questions whose answer depends on the job being applied to, not only on the applicant.
+_JOB_SPECIFIC_QUESTION = re.compile(
+    r"\b(this|the|our) (role|position|job|opportunity|company|team|organization)\b|\bwhy (do|would|are) you\b|\binterest(ed)? in\b"
+)
+
+
+def normalize_text(text: str) -> str:
+    '''
+    Collapse whitespace and case, so re-rendered copies of the same text share one cache entry.
+    '''
+    return " ".join(text.split()).casefold()
+
+
+def make_cache_key(kind: str, provider: str, model: str, *parts: str) -> str:
+    '''
+    Content address of one AI request: a hash of its `kind`, the `provider` and `model` answering it and its normalized `parts`.
+    '''
+    digest = hashlib.sha256()
+    for part in (kind, provider.lower(), model, *parts):
+        digest.update(normalize_text(part).encode("utf-8"))
+        digest.update(b"\0")
+    return f"{kind}:{digest.hexdigest()}"
+
+
+class AIResponseCache(SQLiteStore):
+    """SQLite-backed, LRU-bounded cache of JSON-serializable AI responses."""
+
+    def __init__(self, db_path: str, max_entries: int = 5000, **options: Any) -> None:
+        '''
+        * `max_entries` is how many responses are kept, least recently used ones are evicted first.
+        '''
+        self.max_entries = max_entries
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._stats_lock = threading.Lock()
+        super().__init__(db_path, **options)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(_CREATE_CACHE_SQL)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ai_cache)")}
+            if "promoted" not in columns:
+                conn.execute(_ADD_PROMOTED_COLUMN_SQL)
+            conn.execute(_DROP_LAST_USED_INDEX_SQL)
+            conn.execute(_CREATE_EVICTION_INDEX_SQL)
+
+    def _count(self, counter: Counter, key: str) -> None:
+        with self._stats_lock:
+            counter[key.split(":", 1)[0]] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        '''
+        Return the cached response for `key` (marking it recently used), or `None` on a miss.
+        '''
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(_GET_SQL, (key,)).fetchone()
+            if row and row[1] is not None and row[1] <= now:
+                conn.execute(_DELETE_SQL, (key,))
+                row = None
+            if row:
+                conn.execute(_TOUCH_SQL, (now, key))
+        if row is None:
+            self._count(self.misses, key)
+            return None
+        self._count(self.hits, key)
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> None:
+        '''
+        Cache `value` under `key`, forever or for `ttl`, evicting the least recently used entries past `max_entries`.
+        * Promoted entries don't count towards `max_entries`.
+        '''
+        now = time.time()
+        expires_at = now + ttl.total_seconds() if ttl else None
+        with self._connect() as conn:
+            conn.execute(_PUT_SQL, (key, key.split(":", 1)[0], json.dumps(value), now, now, expires_at))
+            conn.execute(_EVICT_SQL, (self.max_entries,))
+
+    def promote(self, key: str) -> bool:
+        '''
+        Keep the entry under `key` for good: it stops expiring and is never evicted. Returns `False` if it isn't cached.
+        '''
+        with self._connect() as conn:
+            return conn.execute(_PROMOTE_SQL, (key,)).rowcount == 1
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute(_DELETE_SQL, (key,))
+
+    def purge_expired(self) -> int:
+        '''
+        Delete expired entries. Returns how many were deleted.
+        '''
+        with self._connect() as conn:
+            return conn.execute(_PURGE_EXPIRED_SQL, (time.time(),)).rowcount
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        '''
+        Hits and misses of this process, per kind of request.
+        '''
+        with self._stats_lock:
+            kinds = set(self.hits) | set(self.misses)
+            return {kind: {"hits": self.hits[kind], "misses": self.misses[kind]} for kind in sorted(kinds)}
+
+
+_shared_cache: Optional[AIResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_ai_cache() -> Optional[AIResponseCache]:
+    '''
+    The cache configured in `config/settings.py`, shared by every AI provider. `None` if it's disabled.
+    '''
+    global _shared_cache
+    if ai_cache_max_entries <= 0:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AIResponseCache(ai_cache_db_path, max_entries=ai_cache_max_entries)
+    return _shared_cache
+
+
+def is_job_specific(question: str, question_type: str) -> bool:
+    '''
+    Whether the answer to `question` depends on the job, like "Why do you want to join this team?". Free-form (textarea) answers always do.
+    '''
+    return question_type == "textarea" or bool(_JOB_SPECIFIC_QUESTION.search(question.lower()))
+
+
+def answer_cache_key(
+    provider: str, model: str, question: str, question_type: str, options: Optional[list] = None,
+    job_description: Optional[str] = None, user_information_all: Optional[str] = None,
+) -> str:
+    '''
+    Cache key of an AI answer: the normalized question, its type and options, and the applicant's information.
+    * Job specific questions (see `is_job_specific`) are also keyed by `job_description`, so they're only reused for the same job
+    '''
+    parts = [question, question_type, "\n".join(str(option) for option in options or []), user_information_all or ""]
+    if job_description and is_job_specific(question, question_type):
+        parts.append(job_description)
+    return make_cache_key("answer", provider, model, *parts)
+
+
+def answer_cache_ttl() -> Optional[timedelta]:
+    '''
+    How long AI answers are cached for, `None` if answers shouldn't be cached.
+    '''
+    return timedelta(days=ai_answer_cache_days) if ai_answer_cache_days > 0 else None
+
+
+def cached_answers(
+    provider: str, model: str, questions: List[Dict[str, Any]], job_description: Optional[str], user_information_all: Optional[str],
+    request: Callable[[List[Dict[str, Any]]], Dict[str, str]],
+) -> Dict[str, str]:
+    '''
+    Answers to a batch of `questions` (dicts with `id`, `question`, `type` and `options`) by id.
+    * Only the questions without a cached answer are asked, with `request(questions)`, which returns answers by id
+    * Each answer is cached on its own, under the same key `answer_cache_key` gives a question asked alone
+    '''
+    ttl = answer_cache_ttl()
+    cache = get_ai_cache() if ttl else None
+    if cache is None:
+        return request(questions)
+    keys = {
+        question["id"]: answer_cache_key(provider, model, question["question"], question["type"], question.get("options"), job_description, user_information_all)
+        for question in questions
+    }
+    answers: Dict[str, str] = {}
+    missing = []
+    for question in questions:
+        try:
+            cached = cache.get(keys[question["id"]])
+        except Exception as e:
+            print_lg("Failed to read the AI cache!", e)
+            cached = None
+        if isinstance(cached, str) and cached:
+            answers[question["id"]] = cached
+        else:
+            missing.append(question)
+    if answers:
+        print_lg(f"-- FOUND {len(answers)} ANSWERS IN AI CACHE")
+    if missing:
+        for question_id, answer in (request(missing) or {}).items():
+            if question_id not in keys or not isinstance(answer, str) or not answer:
+                continue
+            answers[question_id] = answer
+            try:
+                cache.put(keys[question_id], answer, ttl)
+            except Exception as e:
+                print_lg("Failed to save to the AI cache!", e)
+    return answers
+
+
+def cached_ai_response(key: str, request: Callable[[], Any], ttl: Optional[timedelta] = None) -> Any:
+    '''
+    Return the response cached under `key` (see `make_cache_key`), or make the AI request with `request()` and cache its response.
+    * Failed responses (`None`, `""` or a dict with an `"error"`) are returned but not cached
+    '''
+    cache = get_ai_cache()
+    if cache is None:
+        return request()
+    kind = key.split(":", 1)[0]
+    try:
+        cached = cache.get(key)
+    except Exception as e:
+        print_lg("Failed to read the AI cache!", e)
+        cached = None
+    if cached is not None:
+        print_lg(f"-- FOUND {kind.upper()} IN AI CACHE")
+        return cached
+    response = request()
+    if response not in (None, "") and not (isinstance(response, dict) and "error" in response):
+        try:
+            cache.put(key, response, ttl)
+        except Exception as e:
+            print_lg("Failed to save to the AI cache!", e)
+    return response
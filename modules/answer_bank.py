@@ -0,0 +1,212 @@
+'''
+Answers for Easy Apply questions, without a chain of `'x' in label` checks per field.
+
+`RuleMatcher` compiles a declarative table of `AnswerRule`s into one regular expression
+per question type, so a label is matched against every rule in a single regex search, and
+the first rule in table order wins. `AnswerBank` remembers the answers given in submitted
+applications to questions no rule covers, so the next job asking the same question is
+answered from the bank instead of the AI (or aborting).
+'''
+
+import hashlib
+import re
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from modules.ai_cache import is_job_specific, normalize_text
+from modules.sqlite_store import SQLiteStore
+
+# A condition is a word, or a tuple of alternative words, that must appear in the label.
+Condition = Union[str, Tuple[str, ...]]
+
+
+class AnswerRule(NamedTuple):
+    question_types: Tuple[str, ...]
+    conditions: Tuple[Condition, ...]
+    answer: str
+    '''Key of the answer in the values given to `RuleMatcher.answer`.'''
+    unless: Tuple[str, ...] = ()
+    '''Words that must not appear in the label.'''
+    do_actions: bool = False
+    '''Whether the field is an autocomplete, whose first suggestion has to be picked.'''
+
+
+TEXT = ("text",)
+SELECT = ("select",)
+RADIO = ("radio",)
+TEXTAREA = ("textarea",)
+SALARY = ("salary", "compensation", "ctc", "pay")
+CURRENT = ("current", "present")
+
+# Rules in the order they're tried. Labels are matched in lower case, as substrings.
+ANSWER_RULES: List[AnswerRule] = [
+    ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
+    AnswerRule(SELECT, (("email", "phone"),), "previous_answer"),
+    AnswerRule(SELECT, (("gender", "sex"),), "gender"),
+    AnswerRule(SELECT, ("disability",), "disability_status"),
+    AnswerRule(SELECT, ("proficiency",), "proficiency"),
+    AnswerRule(SELECT, ("country",), "country"),
+    AnswerRule(SELECT, ("state",), "state"),
+    AnswerRule(SELECT, ("city",), "city"),
+    AnswerRule(SELECT, ("location",), "work_location"),
+    ##<
+
+    AnswerRule(RADIO, (("citizenship", "employment eligibility"),), "us_citizenship"),
+    AnswerRule(RADIO, (("veteran", "protected"),), "veteran_status"),
+    AnswerRule(RADIO, (("disability", "handicapped"),), "disability_status"),
+
+    AnswerRule(TEXT, (("experience", "years"),), "years_of_experience"),
+    AnswerRule(TEXT, (("phone", "mobile"),), "phone_number"),
+    AnswerRule(TEXT, ("street",), "street"),
+    AnswerRule(TEXT, (("city", "location", "address"),), "city", do_actions=True),
+    AnswerRule(TEXT, ("signature",), "full_name"),
+    AnswerRule(TEXT, ("name", "full"), "full_name"),
+    AnswerRule(TEXT, ("name", "first"), "first_name", unless=("last",)),
+    AnswerRule(TEXT, ("name", "middle"), "middle_name", unless=("last",)),
+    AnswerRule(TEXT, ("name", "last"), "last_name", unless=("first",)),
+    AnswerRule(TEXT, ("name", "employer"), "recent_employer"),
+    AnswerRule(TEXT, ("name",), "full_name"),
+    AnswerRule(TEXT, ("notice", "month"), "notice_period_months"),
+    AnswerRule(TEXT, ("notice", "week"), "notice_period_weeks"),
+    AnswerRule(TEXT, ("notice",), "notice_period"),
+    AnswerRule(TEXT, (SALARY, CURRENT, "month"), "current_ctc_monthly"),
+    AnswerRule(TEXT, (SALARY, CURRENT, "lakh"), "current_ctc_lakhs"),
+    AnswerRule(TEXT, (SALARY, CURRENT), "current_ctc"),
+    AnswerRule(TEXT, (SALARY, "month"), "desired_salary_monthly"),
+    AnswerRule(TEXT, (SALARY, "lakh"), "desired_salary_lakhs"),
+    AnswerRule(TEXT, (SALARY,), "desired_salary"),
+    AnswerRule(TEXT, ("linkedin",), "linkedIn"),
+    AnswerRule(TEXT, (("website", "blog", "portfolio", "link"),), "website"),
+    AnswerRule(TEXT, ("scale of 1-10",), "confidence_level"),
+    AnswerRule(TEXT, ("headline",), "linkedin_headline"),
+    AnswerRule(TEXT, (("hear", "come across"), "this", ("job", "position")), "hear_about_us"),
+    AnswerRule(TEXT, (("state", "province"),), "state"),
+    AnswerRule(TEXT, (("zip", "postal", "code"),), "zipcode"),
+    AnswerRule(TEXT, ("country",), "country"),
+
+    AnswerRule(TEXTAREA, ("summary",), "linkedin_summary"),
+    AnswerRule(TEXTAREA, ("cover",), "cover_letter"),
+
+    # Common questions
+    AnswerRule(("select", "radio", "text"), (("sponsorship", "visa"),), "require_visa"),
+]
+
+
+def _condition_pattern(condition: Condition) -> str:
+    words = (condition,) if isinstance(condition, str) else condition
+    return f"(?=.*?(?:{'|'.join(re.escape(word) for word in words)}))"
+
+
+class RuleMatcher:
+    """Precompiled matcher of question labels against a table of `AnswerRule`s."""
+
+    def __init__(self, rules: Iterable[AnswerRule] = ANSWER_RULES) -> None:
+        '''
+        Compile `rules` into one regex per question type. Each rule becomes an alternative of
+        lookaheads anchored at the start of the label, so alternatives are tried in table order.
+        '''
+        self.rules = list(rules)
+        alternatives: Dict[str, List[str]] = {}
+        for index, rule in enumerate(self.rules):
+            pattern = "".join(_condition_pattern(condition) for condition in rule.conditions)
+            pattern += "".join(f"(?!.*?{re.escape(word)})" for word in rule.unless)
+            for question_type in rule.question_types:
+                alternatives.setdefault(question_type, []).append(f"{pattern}(?P<rule{index}>)")
+        self._patterns = {
+            question_type: re.compile(r"\A(?:" + "|".join(patterns) + ")", re.DOTALL)
+            for question_type, patterns in alternatives.items()
+        }
+
+    def match(self, question_type: str, label: str) -> Optional[AnswerRule]:
+        '''
+        The first rule for `question_type` whose conditions all hold for `label`, `None` if none does.
+        '''
+        pattern = self._patterns.get(question_type)
+        found = pattern.match(label.lower()) if pattern else None
+        return self.rules[int(found.lastgroup[4:])] if found else None
+
+    def answer(self, question_type: str, label: str, values: Dict[str, Any]) -> Tuple[Optional[str], Optional[AnswerRule]]:
+        '''
+        Answer `label` from `values`, keyed by `AnswerRule.answer`. Returns `(answer, rule)`, both `None` if no rule matched.
+        '''
+        rule = self.match(question_type, label)
+        return (values[rule.answer], rule) if rule else (None, None)
+
+
+_CREATE_BANK_SQL = """
+CREATE TABLE IF NOT EXISTS answer_bank (
+    key TEXT PRIMARY KEY,
+    question_type TEXT NOT NULL,
+    label TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    times_used INTEGER NOT NULL DEFAULT 1,
+    learned_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+_GET_ANSWER_SQL = "SELECT answer FROM answer_bank WHERE key = ?"
+_LEARN_SQL = """
+    INSERT INTO answer_bank (key, question_type, label, answer, learned_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        answer = excluded.answer, updated_at = excluded.updated_at, times_used = times_used + 1
+"""
+_LIST_ANSWERS_SQL = "SELECT question_type, label, answer, times_used FROM answer_bank ORDER BY updated_at DESC"
+_FORGET_SQL = "DELETE FROM answer_bank WHERE key = ?"
+
+
+def _bank_key(question_type: str, label: str) -> str:
+    return hashlib.sha256(f"{question_type}\0{normalize_text(label)}".encode("utf-8")).hexdigest()
+
+
+class AnswerBank(SQLiteStore):
+    """Persistent bank of questions answered in submitted applications, keyed by their normalized label and type."""
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(_CREATE_BANK_SQL)
+
+    def get(self, question_type: str, label: str) -> Optional[str]:
+        '''
+        The answer last given to this question, `None` if it was never answered.
+        * `label` is the question as recorded in `questions_list`, including its options for selects and radios.
+        '''
+        with self._connect() as conn:
+            row = conn.execute(_GET_ANSWER_SQL, (_bank_key(question_type, label),)).fetchone()
+        return row[0] if row else None
+
+    def learn(self, question_type: str, label: str, answer: str) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(_LEARN_SQL, (_bank_key(question_type, label), question_type, label, answer, now, now))
+
+    def learn_from(self, questions_list: Iterable[tuple], matcher: RuleMatcher) -> int:
+        '''
+        Learn the answers of a submitted application's `questions_list` (`(label, answer, type, previous answer)` tuples).
+        * Skips questions a rule in `matcher` answers, answers left as they were, and job specific questions
+        * Returns how many answers were learned
+        '''
+        learned = []
+        for label, answer, question_type, prev_answer in questions_list:
+            if question_type not in ("select", "radio", "text", "textarea") or not isinstance(answer, str):
+                continue
+            if not answer.strip() or answer == prev_answer or answer == "Unknown" or label.startswith("Unknown"):
+                continue
+            # Selects and radios are recorded as "label [ options ]", rules only look at the label.
+            question = label.split(" [ ", 1)[0]
+            if matcher.match(question_type, question) or is_job_specific(question, question_type):
+                continue
+            learned.append((question_type, label, answer))
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(_LEARN_SQL, [(_bank_key(*question[:2]), *question, now, now) for question in learned])
+        return len(learned)
+
+    def answers(self) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(_LIST_ANSWERS_SQL).fetchall()
+        return [dict(zip(("question_type", "label", "answer", "times_used"), row)) for row in rows]
+
+    def forget(self, question_type: str, label: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute(_FORGET_SQL, (_bank_key(question_type, label),)).rowcount == 1
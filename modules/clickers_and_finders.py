@@ -12,8 +12,9 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 '''
 
-from config.settings import click_gap, smooth_scroll
+from config.settings import click_gap, smooth_scroll, event_driven_waits, dom_quiet_ms
 from modules.helpers import buffer, print_lg, sleep
+from time import monotonic
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -22,6 +23,108 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.action_chains import ActionChains
 
+
+# Resolves once `selector` matches inside `root` (or the document), or, without a
+# selector, once the DOM hasn't changed and no network request has completed for
+# `quietMs`. Requests only show up once they complete, so one still in flight isn't
+# waited for. Resolves `false` if that doesn't happen within `timeout` ms.
+_WAIT_SCRIPT = '''
+const [selector, quietMs, timeout, root] = arguments;
+const done = arguments[arguments.length - 1];
+const scope = root || document;
+const observers = [];
+let finished = false, quietTimer = null, deadline = null;
+const finish = (result) => {
+    if (finished) return;
+    finished = true;
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    observers.forEach((observer) => observer.disconnect());
+    done(result);
+};
+const check = () => {
+    if (selector) {
+        if (scope.querySelector(selector)) finish(true);
+        return;
+    }
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+};
+
+deadline = setTimeout(() => finish(false), timeout);
+const mutations = new MutationObserver(check);
+mutations.observe(root || document.documentElement, {childList: true, subtree: true, characterData: true});
+observers.push(mutations);
+if (!selector && window.PerformanceObserver) {
+    try {
+        const requests = new PerformanceObserver(check);
+        requests.observe({type: 'resource'});
+        observers.push(requests);
+    } catch (error) {}
+}
+check();
+'''
+
+# Suggestion lists of LinkedIn's typeahead inputs.
+TYPEAHEAD_SUGGESTIONS = '[role="listbox"] [role="option"], .basic-typeahead__selectable, .search-typeahead-v2__hit'
+
+
+# Wait functions
+def wait_for_selector(driver: WebDriver, selector: str, time: float=5.0, root: WebElement | None=None) -> bool:
+    '''
+    Waits until an element matching the CSS `selector` is in the page (or in `root`), re-checking on every DOM change instead of polling.
+    - Returns `True` if it showed up within `time` seconds, else `False`.
+    '''
+    try:
+        return driver.execute_async_script(_WAIT_SCRIPT, selector, 0, int(time * 1000), root)
+    except Exception as e:
+        print_lg(f"Failed to wait for '{selector}'!", e)
+        return False
+
+def wait_for_dom_idle(driver: WebDriver, quiet: float=dom_quiet_ms/1000, time: float=3.0, root: WebElement | None=None) -> bool:
+    '''
+    Waits until the page (or `root`) has had no DOM changes and no network request has completed for `quiet` seconds.
+    - Requests are only seen once they complete, so a request still in flight isn't waited for, only the DOM changes it causes.
+    - Returns `True` if the page went quiet within `time` seconds, else `False`.
+    '''
+    try:
+        return driver.execute_async_script(_WAIT_SCRIPT, None, int(quiet * 1000), int(time * 1000), root)
+    except Exception as e:
+        print_lg("Failed to wait for the page to load!", e)
+        return False
+
+def pace(waited: float=0) -> None:
+    '''
+    The pacing policy: a human-like random pause of up to `click_gap` seconds. Doesn't wait if `click_gap = 0`.
+    - `waited` seconds already spent waiting for the page count towards the pause.
+    '''
+    buffer(click_gap, waited)
+
+def settle(driver: WebDriver, fixed_wait: float=0, root: WebElement | None=None) -> None:
+    '''
+    Waits for the page (or `root`) to finish reacting to the last action, then paces.
+    - If `event_driven_waits = True`, waits until the page is idle (see `wait_for_dom_idle`). The time that took counts towards the pace.
+    - Else sleeps the `fixed_wait` seconds this wait replaces.
+    - `driver` can also be an element, to wait for just that part of the page.
+    '''
+    if isinstance(driver, WebElement): driver, root = driver.parent, root or driver
+    if event_driven_waits:
+        started = monotonic()
+        if wait_for_dom_idle(driver, root=root): return pace(monotonic() - started)
+    elif fixed_wait: sleep(fixed_wait)
+    pace()
+
+def wait_for_suggestions(driver: WebDriver, fixed_wait: float=2.0, time: float=5.0) -> None:
+    '''
+    Waits for the suggestions of the typeahead input that was just typed in to show up and stop changing.
+    - Sleeps `fixed_wait` seconds instead if `event_driven_waits = False`.
+    '''
+    if not event_driven_waits: return sleep(fixed_wait)
+    if wait_for_selector(driver, TYPEAHEAD_SUGGESTIONS, time):
+        wait_for_dom_idle(driver)
+    else:
+        print_lg("Suggestions didn't show up in time!")
+
 # Click Functions
 def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=True, scroll: bool=True, scrollTop: bool=False) -> WebElement | bool:
     '''
@@ -38,7 +141,7 @@ def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=T
             if scroll:  scroll_to_view(driver, button, scrollTop)
             if click:
                 button.click()
-                buffer(click_gap)
+                settle(driver)
             return button
         except Exception as e:
             print_lg("Click Failed! Didn't find '"+text+"'")
@@ -58,7 +161,7 @@ def multi_sel(driver: WebDriver, texts: list, time: float=5.0) -> None:
             button = WebDriverWait(driver,time).until(EC.presence_of_element_located((By.XPATH, './/span[normalize-space(.)="'+text+'"]')))
             scroll_to_view(driver, button)
             button.click()
-            buffer(click_gap)
+            settle(driver)
         except Exception as e:
             print_lg("Click Failed! Didn't find '"+text+"'")
             # print_lg(e)
@@ -74,7 +177,7 @@ def multi_sel_noWait(driver: WebDriver, texts: list, actions: ActionChains = Non
             button = driver.find_element(By.XPATH, './/span[normalize-space(.)="'+text+'"]')
             scroll_to_view(driver, button)
             button.click()
-            buffer(click_gap)
+            settle(driver)
         except Exception as e:
             if actions: company_search_click(driver,actions,text)
             else:   print_lg("Click Failed! Didn't find '"+text+"'")
@@ -89,7 +192,7 @@ def boolean_button_click(driver: WebDriver, actions: ActionChains, text: str) ->
         button = list_container.find_element(By.XPATH, './/input[@role="switch"]')
         scroll_to_view(driver, button)
         actions.move_to_element(button).click().perform()
-        buffer(click_gap)
+        settle(driver)
     except Exception as e:
         print_lg("Click Failed! Didn't find '"+text+"'")
         # print_lg(e)
@@ -150,18 +253,18 @@ def company_search_click(driver: WebDriver, actions: ActionChains, companyName:
     search = driver.find_element(By.XPATH,"(.//input[@placeholder='Add a company'])[1]")
     search.send_keys(Keys.CONTROL + "a")
     search.send_keys(companyName)
-    buffer(3)
+    wait_for_suggestions(driver, 3)
     actions.send_keys(Keys.DOWN).perform()
     actions.send_keys(Keys.ENTER).perform()
     print_lg(f'Tried searching and adding "{companyName}"')
 
 def text_input(actions: ActionChains, textInputEle: WebElement | bool, value: str, textFieldName: str = "Text") -> None | Exception:
     if textInputEle:
-        sleep(1)
+        settle(textInputEle.parent, 1)
         # actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
         textInputEle.clear()
         textInputEle.send_keys(value.strip())
-        sleep(2)
+        wait_for_suggestions(textInputEle.parent)
         actions.send_keys(Keys.ENTER).perform()
     else:
         print_lg(f'{textFieldName} input was not given!')
\ No newline at end of file
@@ -0,0 +1,132 @@
+'''
+Read and fill an Easy Apply form page with one WebDriver round-trip each.
+
+`snapshot_form` serializes every question of the form into a list of plain dicts
+(kind, label, options, current value and the element to write to), so answers can be
+decided in Python without touching the browser. `write_form` then applies all the
+answers in a single batched script.
+'''
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from modules.helpers import print_lg
+
+
+# Reads every `div[data-test-form-element]` of the form, looking for the same
+# fields (and labels) as the bot used to find one `find_element` at a time.
+_FORM_SNAPSHOT_SCRIPT = '''
+const form = arguments[0];
+const text = (element) => element ? element.innerText.trim() : null;
+const hiddenOr = (element) => element ? element.querySelector('.visually-hidden') || element : null;
+const labelFor = (scope, input) => input.id ? scope.querySelector(`label[for="${CSS.escape(input.id)}"]`) : null;
+
+return Array.from(form.querySelectorAll('div[data-test-form-element]'), (question) => {
+    const select = question.querySelector('select');
+    if (select) {
+        const label = question.querySelector('label');
+        const selected = select.selectedOptions[0];
+        return {
+            kind: 'select',
+            label: label ? text(label.querySelector('span')) : null,
+            options: Array.from(select.options, (option) => ({text: option.text.trim(), value: option.value, selected: option.selected})),
+            value: selected ? selected.text.trim() : null,
+            element: select,
+        };
+    }
+    const radio = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+    if (radio) {
+        const inputs = Array.from(radio.querySelectorAll('input'));
+        return {
+            kind: 'radio',
+            label: text(hiddenOr(radio.querySelector('span[data-test-form-builder-radio-button-form-component__title]'))),
+            options: inputs.map((input) => ({text: text(labelFor(radio, input)), value: input.getAttribute('value'), selected: input.checked})),
+            value: null,
+            element: radio,
+        };
+    }
+    const input = question.querySelector('input[type="text"]');
+    if (input) {
+        return {kind: 'text', label: text(hiddenOr(question.querySelector('label[for]'))), options: [], value: input.value, element: input};
+    }
+    const textarea = question.querySelector('textarea');
+    if (textarea) {
+        return {kind: 'textarea', label: text(question.querySelector('label[for]')), options: [], value: textarea.value, element: textarea};
+    }
+    const checkbox = question.querySelector('input[type="checkbox"]');
+    if (checkbox) {
+        const answer = question.querySelector('label[for]');
+        return {
+            kind: 'checkbox',
+            label: text(question.querySelector('span[class="visually-hidden"]')),
+            options: [{text: text(answer), value: checkbox.getAttribute('value'), selected: checkbox.checked}],
+            value: checkbox.checked,
+            element: checkbox,
+        };
+    }
+    return {kind: 'unknown', label: text(question), options: [], value: null, element: question};
+});
+'''
+
+
+# Applies every write of a form page. Values are set through the element's native
+# setter and announced with `input`/`change` events, so the page's framework sees them.
+# Returns, per write, the field's value afterwards (or an `{error}`).
+_FORM_WRITE_SCRIPT = '''
+const writes = arguments[0];
+const fire = (element, ...types) => types.forEach((type) => element.dispatchEvent(new Event(type, {bubbles: true})));
+const setValue = (element, value) => {
+    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set.call(element, value);
+    fire(element, 'input', 'change');
+};
+
+return writes.map(({element, kind, value}) => {
+    try {
+        switch (kind) {
+            case 'select':
+                setValue(element, element.options[value].value);
+                return element.selectedOptions[0].text.trim();
+            case 'radio': {
+                const input = element.querySelectorAll('input')[value];
+                if (!input.checked) input.click();
+                return input.checked;
+            }
+            case 'checkbox':
+                if (element.checked !== value) element.click();
+                return element.checked;
+            default:
+                element.focus();
+                setValue(element, value);
+                element.blur();
+                return element.value;
+        }
+    } catch (error) {
+        return {error: String(error)};
+    }
+});
+'''
+
+
+def snapshot_form(driver: WebDriver, form: WebElement) -> list[dict]:
+    '''
+    Function to read every question of an Easy Apply form page with a single `execute_script`.
+    * Returns a dict per question with `kind` (`"select"`, `"radio"`, `"text"`, `"textarea"`, `"checkbox"` or `"unknown"`),
+      `label` (`None` if not found), `options` (dicts with `text`, `value` and `selected`), `value` and `element`
+    * `element` is what `write_form` writes to: the `select`, radio `fieldset`, `input`, `textarea` or the question itself
+    '''
+    return driver.execute_script(_FORM_SNAPSHOT_SCRIPT, form)
+
+
+def write_form(driver: WebDriver, writes: list[dict]) -> list:
+    '''
+    Function to fill a form page with a single `execute_script`.
+    * Takes dicts with `element` and `kind` from `snapshot_form`, and the `value` to write:
+      the option index of selects and radios, `True`/`False` for checkboxes, the text of text fields
+    * Returns the value of each field after writing, `None` for any write that failed
+    '''
+    if not writes: return []
+    results = driver.execute_script(_FORM_WRITE_SCRIPT, writes)
+    for write, result in zip(writes, results):
+        if isinstance(result, dict) and 'error' in result:
+            print_lg(f"Failed to fill {write['kind']} field!", result['error'])
+    return [None if isinstance(result, dict) else result for result in results]
@@ -32,7 +32,8 @@ except Exception:
         return button
 from pprint import pprint
 
-from config.settings import logs_folder_path
+from config.settings import logs_folder_path, log_max_size_mb, log_backup_count
+from modules.log_writer import open_log_writer
 
 
 
@@ -61,11 +62,31 @@ def make_directories(paths: list[str]) -> None:
             print(f'Error while creating directory "{path}": ', e)
 
 
-def get_screenshot_directory() -> str:
+RUN_LOGS_DIR_ENV = "JOB_LOGS_DIR"
+
+
+def get_logs_folder_path() -> str:
+    '''
+    Return the logs folder for this process.
+    * When launched by `JobWorker`, this is the run's own folder passed in `JOB_LOGS_DIR`
+    * Otherwise it's `logs_folder_path` from `config/settings.py`
+    '''
+    return os.getenv(RUN_LOGS_DIR_ENV) or logs_folder_path
+
+
+def get_run_logs_directory(job_id: str) -> str:
+    '''
+    Return the folder holding one job run's logs, ChromeDriver log and screenshots.
+    '''
+    return os.path.join(logs_folder_path, "runs", job_id).replace("//", "/")
+
+
+def get_screenshot_directory(logs_folder: str | None = None) -> str:
     '''
     Return the directory where ChromeDriver screenshots are stored, ensuring it exists.
+    * `logs_folder` defaults to `get_logs_folder_path()`
     '''
-    directory = os.path.join(logs_folder_path, "screenshots")
+    directory = os.path.join(logs_folder or get_logs_folder_path(), "screenshots")
     directory = directory.replace("//", "/")
     os.makedirs(directory, exist_ok=True)
     return directory
@@ -115,8 +136,10 @@ def find_default_profile_directory() -> str | None:
 def critical_error_log(possible_reason: str, stack_trace: Exception) -> None:
     '''
     Function to log and print critical errors along with datetime stamp
+    * Waits until they're written to log.txt, in case the process is about to be killed
     '''
     print_lg(possible_reason, stack_trace, datetime.now(), from_critical=True)
+    flush_logs()
 
 
 def _ensure_log_directory(path: str) -> None:
@@ -128,12 +151,13 @@ def _ensure_log_directory(path: str) -> None:
         os.makedirs(directory, exist_ok=True)
 
 
-def get_log_path():
+def get_log_path(logs_folder: str | None = None):
     '''
     Function to replace '//' with '/' for logs path and ensure directory exists.
+    * `logs_folder` defaults to `get_logs_folder_path()`
     '''
     try:
-        path = logs_folder_path+"/log.txt"
+        path = (logs_folder or get_logs_folder_path())+"/log.txt"
         path = path.replace("//","/")
         _ensure_log_directory(path)
         return path
@@ -151,21 +175,23 @@ def get_log_path():
         return fallback_path
 
 
-def get_chromedriver_log_path() -> str:
+def get_chromedriver_log_path(logs_folder: str | None = None) -> str:
     '''
     Return the expected ChromeDriver verbose log path and ensure the directory exists.
+    * `logs_folder` defaults to `get_logs_folder_path()`
     '''
-    path = os.path.join(logs_folder_path, "chromedriver.log")
+    path = os.path.join(logs_folder or get_logs_folder_path(), "chromedriver.log")
     path = path.replace("//", "/")
     _ensure_log_directory(path)
     return path
 
 
-def get_latest_screenshot_path() -> str | None:
+def get_latest_screenshot_path(logs_folder: str | None = None) -> str | None:
     '''
     Return the most recently created ChromeDriver screenshot path if available.
+    * `logs_folder` defaults to `get_logs_folder_path()`
     '''
-    directory = get_screenshot_directory()
+    directory = get_screenshot_directory(logs_folder)
     screenshots = [
         os.path.join(directory, name)
         for name in os.listdir(directory)
@@ -177,20 +203,89 @@ def get_latest_screenshot_path() -> str | None:
     return max(screenshots, key=os.path.getmtime)
 
 
+def tail_log_lines(path: str, max_lines: int = 200, block_size: int = 8192) -> tuple[list[str], int]:
+    '''
+    Function to read the last `max_lines` lines of a log file by seeking backward from EOF in blocks.
+    * Cost depends on `max_lines`, not on the size of the file
+    * Returns `(lines, end_offset)` where `end_offset` is the byte offset to resume from with `read_log_since`
+    '''
+    with open(path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        end_offset = file.tell()
+        position = end_offset
+        data = b""
+        while position > 0 and data.count(b"\n") <= max_lines:
+            step = min(block_size, position)
+            position -= step
+            file.seek(position)
+            data = file.read(step) + data
+    # Stop at the last complete line so the offset never points into a half-written line.
+    if position + len(data) == end_offset and not data.endswith(b"\n"):
+        complete, newline, partial = data.rpartition(b"\n")
+        data = complete + newline
+        end_offset -= len(partial)
+    lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
+    return lines[-max_lines:] if max_lines > 0 else [], end_offset
+
+
+def read_log_since(path: str, offset: int | None, max_bytes: int = 256 * 1024, max_lines: int = 200) -> tuple[list[str], int, bool]:
+    '''
+    Function to read complete lines appended to a log file after byte `offset`.
+    * `offset = None` starts at the current end of file without returning anything
+    * A file smaller than `offset` (rotated or truncated) is read again from the start
+    * If more than `max_bytes` were appended, only the last `max_lines` lines are returned
+    * Returns `(lines, next_offset, truncated)`
+    '''
+    size = os.path.getsize(path)
+    if offset is None:
+        return [], size, False
+    if size < offset:
+        offset = 0
+    if size == offset:
+        return [], offset, False
+    if size - offset > max_bytes:
+        lines, end_offset = tail_log_lines(path, max_lines)
+        return lines, end_offset, True
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        chunk = file.read(size - offset)
+    complete, newline, _ = chunk.rpartition(b"\n")
+    if not newline:
+        return [], offset, False
+    lines = (complete + newline).decode("utf-8", errors="replace").splitlines(keepends=True)
+    return lines, offset + len(complete) + 1, False
+
+
 __logs_file_path = get_log_path()
+__log_writer = open_log_writer(
+    __logs_file_path,
+    max_file_bytes=log_max_size_mb * 1024 * 1024,
+    backup_count=log_backup_count,
+)
 _logging_error_reported = False
 
 
+def flush_logs(timeout: float | None = 5.0) -> bool:
+    '''
+    Function to wait until every message passed to `print_lg` so far is written to log.txt.
+    * Happens automatically on exit, only needed before reading log.txt from the same process
+    '''
+    return __log_writer.flush(timeout)
+
+
 def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
     '''
     Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Messages are written to log.txt in the background by `modules.log_writer`, see `flush_logs()`
     '''
     try:
-        _ensure_log_directory(__logs_file_path)
         for message in msgs:
             pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+            __log_writer.write(str(message) + end)
+        # Surface a failed background write here, where it can be reported.
+        error = __log_writer.take_error()
+        if error:
+            raise error
     except Exception as e:
         # Avoid recursive logging attempts when the log file is locked or unavailable.
         global _logging_error_reported
@@ -198,7 +293,7 @@ def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bo
         if not _logging_error_reported:
             _logging_error_reported = True
             gui_alert(
-                f"log.txt in {logs_folder_path} is open or is occupied by another program! Please close it! {trail}",
+                f"log.txt in {get_logs_folder_path()} is open or is occupied by another program! Please close it! {trail}",
                 "Failed Logging",
             )
             # Print a simplified alert to stderr as a fallback without re-entering print_lg.
@@ -209,7 +304,7 @@ def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bo
 #>
 
 
-def buffer(speed: int=0) -> None:
+def buffer(speed: int=0, waited: float=0) -> None:
     '''
     Function to wait within a period of selected random range.
     * Will not wait if input `speed <= 0`
@@ -217,15 +312,18 @@ def buffer(speed: int=0) -> None:
       - `0.6 to 1.0 secs` if `1 <= speed < 2`
       - `1.0 to 1.8 secs` if `2 <= speed < 3`
       - `1.8 to speed secs` if `3 <= speed`
+    * `waited` secs already spent waiting count towards it, only the rest is slept
     '''
     if speed<=0:
         return
     elif speed <= 1 and speed < 2:
-        return sleep(randint(6,10)*0.1)
+        pause = randint(6,10)*0.1
     elif speed <= 2 and speed < 3:
-        return sleep(randint(10,18)*0.1)
+        pause = randint(10,18)*0.1
     else:
-        return sleep(randint(18,round(speed)*10)*0.1)
+        pause = randint(18,round(speed)*10)*0.1
+    if pause > waited:
+        sleep(pause - waited)
     
 
 def manual_login_retry(is_logged_in: callable, limit: int = 2) -> None:
@@ -0,0 +1,368 @@
+import csv
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from modules.sqlite_store import SQLiteStore
+
+
+# CSV header -> column, in the order the history CSV has always used.
+HISTORY_FIELDS = {
+    "Job ID": "job_id",
+    "Title": "title",
+    "Company": "company",
+    "Work Location": "work_location",
+    "Work Style": "work_style",
+    "About Job": "about_job",
+    "Experience required": "experience_required",
+    "Skills required": "skills_required",
+    "HR Name": "hr_name",
+    "HR Link": "hr_link",
+    "Resume": "resume",
+    "Re-posted": "reposted",
+    "Date Posted": "date_posted",
+    "Date Applied": "date_applied",
+    "Job Link": "job_link",
+    "External Job link": "external_job_link",
+    "Questions Found": "questions_found",
+    "Connect Request": "connect_request",
+}
+_COLUMNS = list(HISTORY_FIELDS.values())
+# Multi-kilobyte text columns. They're stored last in each row so listings that
+# skip them never have to walk their overflow pages.
+_HEAVY_COLUMNS = ["skills_required", "about_job", "questions_found"]
+# What the dashboard's history table shows.
+SUMMARY_FIELDS = ["Job ID", "Title", "Company", "HR Name", "HR Link", "Job Link", "External Job link", "Date Applied"]
+_SUMMARY_COLUMNS = ", ".join(HISTORY_FIELDS[header] for header in SUMMARY_FIELDS)
+_SEARCH_COLUMNS = ["title", "company", "skills_required", "about_job"]
+
+# Re-applying to a job replaces its previous record.
+_UPSERT_SQL = f"""
+    INSERT INTO applied_jobs ({", ".join(_COLUMNS)})
+    VALUES ({", ".join("?" for _ in _COLUMNS)})
+    ON CONFLICT (job_id) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])}
+"""
+_SELECT_JOB_SQL = f"SELECT {', '.join(_COLUMNS)} FROM applied_jobs WHERE job_id = ?"
+_HAS_JOB_SQL = "SELECT 1 FROM applied_jobs WHERE job_id = ?"
+_UPDATE_DATE_APPLIED_SQL = "UPDATE applied_jobs SET date_applied = ? WHERE job_id = ?"
+_UPDATE_SKILLS_SQL = "UPDATE applied_jobs SET skills_required = ? WHERE job_id = ?"
+
+# Decisions not to apply, remembered until `expires_at` so later runs and
+# parallel workers skip them without opening the job again.
+_REJECT_JOB_SQL = """
+    INSERT INTO rejected_jobs (job_id, company, reason, detail, rejected_at, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (job_id) DO UPDATE SET
+    company = excluded.company, reason = excluded.reason, detail = excluded.detail,
+    rejected_at = excluded.rejected_at, expires_at = excluded.expires_at
+"""
+_IS_REJECTED_SQL = "SELECT 1 FROM rejected_jobs WHERE job_id = ? AND expires_at > ?"
+_BLACKLIST_COMPANY_SQL = """
+    INSERT INTO blacklisted_companies (company, reason, detail, blacklisted_at, expires_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (company) DO UPDATE SET
+    reason = excluded.reason, detail = excluded.detail,
+    blacklisted_at = excluded.blacklisted_at, expires_at = excluded.expires_at
+"""
+
+# External-content FTS5 index: it stores only the index, not a second copy of
+# each description, and the triggers keep it in step with the table.
+_CREATE_FTS_SQL = f"""
+    CREATE VIRTUAL TABLE applied_jobs_fts USING fts5(
+        {", ".join(_SEARCH_COLUMNS)}, content='applied_jobs', content_rowid='rowid'
+    )
+"""
+_FTS_TRIGGERS_SQL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applied_jobs_fts_insert AFTER INSERT ON applied_jobs BEGIN
+        INSERT INTO applied_jobs_fts (rowid, {", ".join(_SEARCH_COLUMNS)})
+        VALUES (new.rowid, {", ".join(f"new.{column}" for column in _SEARCH_COLUMNS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applied_jobs_fts_delete AFTER DELETE ON applied_jobs BEGIN
+        INSERT INTO applied_jobs_fts (applied_jobs_fts, rowid, {", ".join(_SEARCH_COLUMNS)})
+        VALUES ('delete', old.rowid, {", ".join(f"old.{column}" for column in _SEARCH_COLUMNS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applied_jobs_fts_update
+    AFTER UPDATE OF {", ".join(_SEARCH_COLUMNS)} ON applied_jobs BEGIN
+        INSERT INTO applied_jobs_fts (applied_jobs_fts, rowid, {", ".join(_SEARCH_COLUMNS)})
+        VALUES ('delete', old.rowid, {", ".join(f"old.{column}" for column in _SEARCH_COLUMNS)});
+        INSERT INTO applied_jobs_fts (rowid, {", ".join(_SEARCH_COLUMNS)})
+        VALUES (new.rowid, {", ".join(f"new.{column}" for column in _SEARCH_COLUMNS)});
+    END
+    """,
+]
+
+# `PRAGMA user_version` once the legacy CSV has been imported, so it's only read once.
+_CSV_IMPORTED_VERSION = 1
+
+
+class ApplicationHistoryStore(SQLiteStore):
+    """SQLite-backed history of submitted applications, keyed by LinkedIn Job ID."""
+
+    def __init__(self, db_path: str, legacy_csv_path: Optional[str] = None, **options: Any) -> None:
+        '''
+        Open (or create) the history database at `db_path`.
+        * `legacy_csv_path` is the old applied jobs history CSV, imported the first time the database is created.
+        '''
+        self.legacy_csv_path = legacy_csv_path
+        self.full_text_search = True
+        super().__init__(db_path, **options)
+
+    def _init_db(self) -> None:
+        light_columns = [column for column in _COLUMNS[1:] if column not in _HEAVY_COLUMNS]
+        with self._connect() as conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS applied_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    {", ".join(f"{column} TEXT" for column in light_columns + _HEAVY_COLUMNS)}
+                )
+                """
+            )
+            # History pages newest-first by Date Applied, with Job ID as the tie-breaker.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_applied_jobs_date_applied ON applied_jobs (date_applied, job_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_applied_jobs_company ON applied_jobs (company)")
+            self._init_full_text_search(conn)
+            # AUTOINCREMENT so purged rowids are never reused behind a `KnownJobIndex` cursor.
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rejected_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL UNIQUE,
+                    company TEXT,
+                    reason TEXT NOT NULL,
+                    detail TEXT,
+                    rejected_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blacklisted_companies (
+                    company TEXT PRIMARY KEY,
+                    reason TEXT NOT NULL,
+                    detail TEXT,
+                    blacklisted_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL
+                )
+                """
+            )
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < _CSV_IMPORTED_VERSION:
+                if self.legacy_csv_path and os.path.exists(self.legacy_csv_path):
+                    with open(self.legacy_csv_path, "r", encoding="utf-8", newline="") as file:
+                        self._import_rows(conn, csv.DictReader(file))
+                conn.execute(f"PRAGMA user_version = {_CSV_IMPORTED_VERSION}")
+
+    def _init_full_text_search(self, conn: sqlite3.Connection) -> None:
+        '''
+        Create the FTS5 index over titles, companies, skills and descriptions.
+        * Falls back to `LIKE` matching when SQLite was built without FTS5
+        '''
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'applied_jobs_fts'").fetchone()
+        try:
+            if not exists:
+                conn.execute(_CREATE_FTS_SQL)
+                conn.execute("INSERT INTO applied_jobs_fts (applied_jobs_fts) VALUES ('rebuild')")
+            for trigger in _FTS_TRIGGERS_SQL:
+                conn.execute(trigger)
+        except sqlite3.OperationalError:
+            self.full_text_search = False
+
+    @staticmethod
+    def _row_values(get) -> List[Optional[str]]:
+        values = [get(header) for header in HISTORY_FIELDS]
+        values = [None if value is None else str(value) for value in values]
+        # Keep the pagination key non-null so row-value comparisons always match.
+        date_applied = _COLUMNS.index("date_applied")
+        values[date_applied] = values[date_applied] or ""
+        return values
+
+    def _import_rows(self, conn: sqlite3.Connection, rows: Iterable[Dict[str, str]]) -> int:
+        # "About Job" cells can exceed the csv module's default 128 KB field limit.
+        csv.field_size_limit(max(csv.field_size_limit(), 1000000))
+        count = 0
+        for row in rows:
+            if not row.get("Job ID"):
+                continue
+            conn.execute(_UPSERT_SQL, self._row_values(row.get))
+            count += 1
+        return count
+
+    def import_csv(self, path: str) -> int:
+        '''
+        Merge rows from a history CSV (same headers as the export) into the table. Returns how many rows were read.
+        '''
+        with open(path, "r", encoding="utf-8", newline="") as file, self._connect() as conn:
+            return self._import_rows(conn, csv.DictReader(file))
+
+    def export_csv(self, file: TextIO) -> int:
+        '''
+        Write the whole history to an open text `file` in the original CSV layout, oldest application first.
+        Returns how many rows were written.
+        '''
+        writer = csv.writer(file)
+        writer.writerow(HISTORY_FIELDS.keys())
+        count = 0
+        with self._connect() as conn:
+            for row in conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM applied_jobs ORDER BY rowid"):
+                writer.writerow(row)
+                count += 1
+        return count
+
+    def add_application(self, record: Dict[str, Any]) -> None:
+        '''
+        Insert or replace one application. `record` is keyed by the CSV headers in `HISTORY_FIELDS`.
+        '''
+        with self._connect() as conn:
+            conn.execute(_UPSERT_SQL, self._row_values(record.get))
+
+    def has_applied(self, job_id: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute(_HAS_JOB_SQL, (job_id,)).fetchone() is not None
+
+    def known_job_ids_since(self, cursor: Dict[str, int]) -> Tuple[List[str], Dict[str, int]]:
+        '''
+        Job IDs recorded after `cursor` (the last rowid seen per table), and the cursor to pass next time.
+        Used by `modules.job_index.KnownJobIndex`.
+        '''
+        job_ids: List[str] = []
+        next_cursor = dict(cursor)
+        with self._connect() as conn:
+            for table in ("applied_jobs", "rejected_jobs"):
+                rows = conn.execute(
+                    f"SELECT rowid, job_id FROM {table} WHERE rowid > ? ORDER BY rowid", (cursor.get(table, 0),)
+                ).fetchall()
+                if rows:
+                    next_cursor[table] = rows[-1][0]
+                job_ids.extend(job_id for _, job_id in rows)
+        return job_ids, next_cursor
+
+    def is_known(self, job_id: str) -> bool:
+        '''
+        Whether `job_id` was applied to, or rejected and the rejection hasn't expired.
+        '''
+        return self.has_applied(job_id) or self.is_rejected(job_id)
+
+    def reject_job(self, job_id: str, company: Optional[str], reason: str, ttl: timedelta, detail: Optional[str] = None) -> None:
+        '''
+        Remember not to apply to `job_id` for `ttl`, with the `reason` shown in logs and the failed jobs history.
+        '''
+        now = datetime.utcnow()
+        with self._connect() as conn:
+            conn.execute(_REJECT_JOB_SQL, (job_id, company, reason, detail, now.isoformat(), (now + ttl).isoformat()))
+
+    def is_rejected(self, job_id: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute(_IS_REJECTED_SQL, (job_id, datetime.utcnow().isoformat())).fetchone() is not None
+
+    def blacklist_company(self, company: str, reason: str, ttl: timedelta, detail: Optional[str] = None) -> None:
+        '''
+        Remember to skip every job from `company` for `ttl`.
+        '''
+        now = datetime.utcnow()
+        with self._connect() as conn:
+            conn.execute(_BLACKLIST_COMPANY_SQL, (company, reason, detail, now.isoformat(), (now + ttl).isoformat()))
+
+    def blacklisted_companies(self) -> Dict[str, str]:
+        '''
+        Companies whose blacklisting hasn't expired, mapped to the reason.
+        '''
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT company, reason FROM blacklisted_companies WHERE expires_at > ?",
+                (datetime.utcnow().isoformat(),),
+            ).fetchall()
+        return dict(rows)
+
+    def purge_expired(self) -> int:
+        '''
+        Delete expired rejections and blacklistings. Returns how many rows were removed.
+        '''
+        now = datetime.utcnow().isoformat()
+        with self._connect() as conn:
+            removed = conn.execute("DELETE FROM rejected_jobs WHERE expires_at <= ?", (now,)).rowcount
+            removed += conn.execute("DELETE FROM blacklisted_companies WHERE expires_at <= ?", (now,)).rowcount
+        return removed
+
+    def get_application(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(_SELECT_JOB_SQL, (job_id,)).fetchone()
+        if not row:
+            return None
+        return dict(zip(HISTORY_FIELDS.keys(), row))
+
+    def list_applications(
+        self,
+        company: Optional[str] = None,
+        title: Optional[str] = None,
+        search: Optional[str] = None,
+        ascending: bool = False,
+        after: Optional[Tuple[str, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        '''
+        Page through applications ordered by Date Applied, returning only `SUMMARY_FIELDS`.
+        * `company` and `title` are case-insensitive substring filters.
+        * `search` matches words in titles, companies, skills and job descriptions.
+        * `after` is the `(Date Applied, Job ID)` of the last application on the previous page.
+        * `limit` caps the number of applications returned, `None` returns every match.
+        '''
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("company", company), ("title", title)):
+            if value:
+                clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+                params.append(f"%{_escape_like(value)}%")
+        if search:
+            words = re.findall(r"\w+", search)
+            if self.full_text_search and words:
+                clauses.append("rowid IN (SELECT rowid FROM applied_jobs_fts WHERE applied_jobs_fts MATCH ?)")
+                params.append(" ".join(f'"{word}"*' for word in words))
+            elif words:
+                for word in words:
+                    clauses.append("(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in _SEARCH_COLUMNS) + ")")
+                    params.extend([f"%{_escape_like(word)}%"] * len(_SEARCH_COLUMNS))
+        if after:
+            clauses.append(f"(date_applied, job_id) {'>' if ascending else '<'} (?, ?)")
+            params.extend(after)
+        direction = "ASC" if ascending else "DESC"
+        query = f"SELECT {_SUMMARY_COLUMNS} FROM applied_jobs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY date_applied {direction}, job_id {direction}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [dict(zip(SUMMARY_FIELDS, row)) for row in rows]
+
+    def update_date_applied(self, job_id: str, date_applied: str) -> bool:
+        '''
+        Set `Date Applied` for one job. Returns `False` if the Job ID is not in the history.
+        '''
+        with self._connect() as conn:
+            cursor = conn.execute(_UPDATE_DATE_APPLIED_SQL, (date_applied, job_id))
+        return cursor.rowcount == 1
+
+    def update_skills(self, job_id: str, skills: Any) -> bool:
+        '''
+        Set `Skills required` for one job, once its AI extraction finishes. Returns `False` if the Job ID is not in the history.
+        '''
+        with self._connect() as conn:
+            cursor = conn.execute(_UPDATE_SKILLS_SQL, (None if skills is None else str(skills), job_id))
+        return cursor.rowcount == 1
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,229 @@
+'''
+Fetch LinkedIn job details over HTTP instead of opening each job in the browser.
+
+`JobDetailFetcher` copies the logged-in browser's cookies into a pooled `requests`
+session and downloads job pages concurrently, no faster than one request every
+`min_interval` seconds. `parse_job_page` extracts the same fields as
+`modules.scrapers.extract_job_details` from the saved HTML, so parsing can be
+exercised offline against saved pages, and `base_url` can point at a local stub server.
+'''
+
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from html import escape, unescape
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional
+
+from modules.helpers import print_lg
+
+LINKEDIN_URL = "https://www.linkedin.com"
+JOB_PAGE_PATH = "/jobs/view/{job_id}/"
+
+# Classes of the server-rendered job page, captured as `field: class`.
+_CAPTURED_CLASSES = {
+    "description": "show-more-less-html__markup",
+    "posted_text": "posted-time-ago__text",
+    "about_company": "jobs-company__box",
+    "hirer_card": "message-the-recruiter",
+}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_BLOCK_TAGS = {"p", "div", "li", "ul", "ol", "br", "h1", "h2", "h3", "h4", "h5", "h6", "section"}
+
+
+class _JobPageParser(HTMLParser):
+    """Collects the text and inner HTML of the elements in `_CAPTURED_CLASSES`, plus embedded `<code>` JSON."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.text: Dict[str, List[str]] = {}
+        self.html: Dict[str, List[str]] = {}
+        self.links: Dict[str, str] = {}
+        self.code_blocks: List[str] = []
+        self.applied = False
+        self._open: List[tuple[str, int]] = []
+        self._depth = 0
+        self._in_code = False
+
+    def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        if "jobs-s-apply__application-link" in classes:
+            self.applied = True
+        for field, _ in self._open:
+            self.html[field].append(self.get_starttag_text() or "")
+            if tag in _BLOCK_TAGS:
+                self.text[field].append("\n")
+            if tag == "a" and field not in self.links and attributes.get("href"):
+                self.links[field] = attributes["href"]
+        if tag == "code":
+            self._in_code = True
+            self.code_blocks.append("")
+        if tag in _VOID_TAGS:
+            return
+        self._depth += 1
+        for field, class_name in _CAPTURED_CLASSES.items():
+            if class_name in classes and field not in self.text:
+                self.text[field] = []
+                self.html[field] = []
+                self._open.append((field, self._depth))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "code":
+            self._in_code = False
+        if tag in _VOID_TAGS:
+            return
+        while self._open and self._open[-1][1] == self._depth:
+            self._open.pop()
+        self._depth -= 1
+        for field, _ in self._open:
+            self.html[field].append(f"</{tag}>")
+
+    def handle_data(self, data: str) -> None:
+        if self._in_code:
+            self.code_blocks[-1] += data
+        for field, _ in self._open:
+            self.text[field].append(data)
+            self.html[field].append(escape(data, quote=False))
+
+    def captured_text(self, field: str) -> Optional[str]:
+        if field not in self.text:
+            return None
+        text = re.sub(r"[ \t]+", " ", "".join(self.text[field]))
+        return re.sub(r"\n\s*\n+", "\n\n", text).strip()
+
+
+def _find_description(value: Any) -> Optional[str]:
+    '''
+    Search embedded JSON for a job posting's `"description": {"text": ...}`.
+    '''
+    if isinstance(value, dict):
+        description = value.get("description")
+        if isinstance(description, dict) and isinstance(description.get("text"), str):
+            return description["text"]
+        value = value.values()
+    if isinstance(value, (list, type({}.values()))):
+        for item in value:
+            found = _find_description(item)
+            if found:
+                return found
+    return None
+
+
+def parse_job_page(html: str) -> Dict[str, Any]:
+    '''
+    Extract job details from a job page's HTML.
+    * Reads the server-rendered markup, falling back to the JSON LinkedIn embeds in `<code>` blocks for the description
+    * Returns the same keys as `extract_job_details`, with `None` for anything not found
+    '''
+    parser = _JobPageParser()
+    parser.feed(html)
+    parser.close()
+
+    description = parser.captured_text("description")
+    description_html = "".join(parser.html["description"]).strip() if "description" in parser.html else None
+    if not description:
+        for block in parser.code_blocks:
+            try:
+                description = _find_description(json.loads(unescape(block)))
+            except ValueError:
+                continue
+            if description:
+                break
+
+    hirer_name = None
+    hirer_card = parser.captured_text("hirer_card")
+    if hirer_card:
+        # First line is the section heading ("Meet the hiring team"), then the hirer's name.
+        lines = [line.strip() for line in hirer_card.splitlines() if line.strip()]
+        hirer_name = lines[1] if len(lines) > 1 else None
+
+    return {
+        "settled": bool(description),
+        "description": description,
+        "description_html": description_html,
+        "about_company": parser.captured_text("about_company"),
+        "posted_text": parser.captured_text("posted_text"),
+        "hirer_name": hirer_name,
+        "hirer_link": parser.links.get("hirer_card"),
+        "applied": parser.applied,
+    }
+
+
+class JobDetailFetcher:
+    """Concurrent, rate-limited job page downloader sharing the browser's LinkedIn session."""
+
+    def __init__(
+        self,
+        cookies: Iterable[Dict[str, Any]] = (),
+        user_agent: Optional[str] = None,
+        base_url: str = LINKEDIN_URL,
+        max_workers: int = 4,
+        min_interval: float = 1.0,
+        timeout: float = 15.0,
+    ) -> None:
+        '''
+        * `cookies` are Selenium-style cookie dicts, as returned by `driver.get_cookies()`.
+        * `min_interval` is the minimum number of seconds between two requests, across all workers.
+        '''
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url = base_url.rstrip("/")
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, max_workers))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        self.session.headers["Accept"] = "text/html,application/xhtml+xml"
+        for cookie in cookies:
+            self.session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="JobDetailFetcher")
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    @classmethod
+    def from_driver(cls, driver, **options: Any) -> "JobDetailFetcher":
+        '''
+        Create a fetcher logged in as the browser `driver` is.
+        '''
+        user_agent = driver.execute_script("return navigator.userAgent")
+        return cls(driver.get_cookies(), user_agent, **options)
+
+    def _wait_for_turn(self) -> None:
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def fetch(self, job_id: str) -> Optional[Dict[str, Any]]:
+        '''
+        Download and parse one job page. Returns `None` if it couldn't be fetched or had no description.
+        '''
+        self._wait_for_turn()
+        url = self.base_url + JOB_PAGE_PATH.format(job_id=job_id)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            details = parse_job_page(response.text)
+        except Exception as e:
+            print_lg(f"Failed to fetch details of Job ID: {job_id} over HTTP!", e)
+            return None
+        return details if details["description"] else None
+
+    def submit(self, job_ids: Iterable[str]) -> Dict[str, "Future[Optional[Dict[str, Any]]]"]:
+        '''
+        Start fetching `job_ids` in the background. Returns a future per Job ID, in request order.
+        '''
+        return {job_id: self._executor.submit(self.fetch, job_id) for job_id in job_ids}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
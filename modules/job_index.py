@@ -0,0 +1,140 @@
+'''
+Prefilter for Job IDs the bot has already handled, so known jobs in a search listing are
+skipped from their `data-occludable-job-id` alone, before any scroll, click or wait.
+
+A bloom filter over every known Job ID answers "definitely new" without touching the
+database. Only a "maybe known" answer is confirmed with an exact primary-key lookup, so a
+false positive costs one query and can never skip a new job.
+
+The filter is saved next to the history database together with the database cursor it
+covers. Other processes (parallel workers) load it at startup and only read the rows
+added since, instead of rebuilding it from every Job ID.
+'''
+
+import hashlib
+import json
+import math
+import os
+import struct
+from typing import Any, Dict, Iterable, Optional, Protocol, Tuple
+
+_MAGIC = b"JOBBLOOM1\n"
+
+
+class KnownJobSource(Protocol):
+    def known_job_ids_since(self, cursor: Dict[str, int]) -> Tuple[Iterable[str], Dict[str, int]]: ...
+
+    def is_known(self, job_id: str) -> bool: ...
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, num_bits: int = 0, num_hashes: int = 0, bits: Optional[bytearray] = None) -> None:
+        '''
+        Size the filter for `capacity` items at `error_rate` false positives, unless `num_bits`/`num_hashes` are given.
+        '''
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.num_bits = num_bits or max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = num_hashes or max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        # Double hashing: k positions from two independent 64-bit hashes.
+        for index in range(self.num_hashes):
+            yield (first + index * second) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class KnownJobIndex:
+    """Bloom-filter prefilter in front of a `KnownJobSource` such as `ApplicationHistoryStore`."""
+
+    def __init__(self, source: KnownJobSource, path: str, capacity: int = 50000, error_rate: float = 0.001) -> None:
+        '''
+        Load the saved filter at `path` (or build a new one) and catch it up with `source`.
+        * `capacity` is the initial number of Job IDs the filter is sized for. It doubles when outgrown.
+        '''
+        self.source = source
+        self.path = path
+        self.error_rate = error_rate
+        self.cursor: Dict[str, int] = {}
+        self.bloom = self._load() or BloomFilter(capacity, error_rate)
+        self.refresh()
+
+    def _load(self) -> Optional[BloomFilter]:
+        try:
+            with open(self.path, "rb") as file:
+                if file.readline() != _MAGIC:
+                    return None
+                meta: Dict[str, Any] = json.loads(file.readline())
+                bits = bytearray(file.read())
+        except (OSError, ValueError):
+            return None
+        bloom = BloomFilter(meta["capacity"], num_bits=meta["num_bits"], num_hashes=meta["num_hashes"], bits=bits)
+        if len(bits) != (bloom.num_bits + 7) // 8:
+            return None
+        bloom.count = meta["count"]
+        self.cursor = meta["cursor"]
+        return bloom
+
+    def save(self) -> None:
+        '''
+        Atomically write the filter and its cursor so other processes can start from it.
+        '''
+        meta = {
+            "capacity": self.bloom.capacity,
+            "num_bits": self.bloom.num_bits,
+            "num_hashes": self.bloom.num_hashes,
+            "count": self.bloom.count,
+            "cursor": self.cursor,
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(_MAGIC)
+            file.write(json.dumps(meta).encode("utf-8") + b"\n")
+            file.write(self.bloom.bits)
+        os.replace(temp_path, self.path)
+
+    def refresh(self) -> int:
+        '''
+        Add Job IDs recorded in the source since the last refresh (by any process). Returns how many were added.
+        '''
+        job_ids, cursor = self.source.known_job_ids_since(self.cursor)
+        job_ids = list(job_ids)
+        if self.bloom.count + len(job_ids) > self.bloom.capacity:
+            self._rebuild(self.bloom.count + len(job_ids))
+        else:
+            self.cursor = cursor
+            for job_id in job_ids:
+                self.bloom.add(job_id)
+        return len(job_ids)
+
+    def _rebuild(self, needed: int) -> None:
+        '''
+        Replace an outgrown filter with one at least twice the size, built from every Job ID in the source.
+        '''
+        capacity = self.bloom.capacity
+        while capacity < needed * 2:
+            capacity *= 2
+        job_ids, self.cursor = self.source.known_job_ids_since({})
+        bloom = BloomFilter(capacity, self.error_rate)
+        for job_id in job_ids:
+            bloom.add(job_id)
+        self.bloom = bloom
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.bloom and self.source.is_known(job_id)
@@ -1,23 +1,95 @@
 import json
-import os
 import sqlite3
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from modules.sqlite_store import SQLiteStore
 
-class JobStore:
-    """SQLite-backed job persistence layer."""
 
-    def __init__(self, db_path: str) -> None:
-        self.db_path = db_path
-        directory = os.path.dirname(db_path)
-        if directory:
-            os.makedirs(directory, exist_ok=True)
-        self._init_db()
+_JOB_COLUMNS = "id, status, progress, payload, result, error, created_at, updated_at"
+
+_INSERT_JOB_SQL = """
+    INSERT INTO jobs (id, status, progress, payload, result, error, created_at, updated_at, profile)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SUMMARY_COLUMNS = "id, status, progress, error, created_at, updated_at"
+_SELECT_JOB_SQL = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?"
+_STATUS_COLUMNS = "id, status, progress, result, error, created_at, updated_at"
+
+# Optional fields fall back to the stored value via COALESCE so a progress tick
+# is one statement with no prior read. `error` is always overwritten so a
+# restarted job drops its previous failure message. Leaving `running` drops
+# the worker lease.
+_UPDATE_STATUS_SQL = f"""
+    UPDATE jobs
+    SET status = ?1, progress = COALESCE(?2, progress), result = COALESCE(?3, result), error = ?4, updated_at = ?5,
+        lease_owner = CASE WHEN ?1 = 'running' THEN lease_owner END,
+        lease_expires_at = CASE WHEN ?1 = 'running' THEN lease_expires_at END
+    WHERE id = ?6
+    RETURNING {_STATUS_COLUMNS}
+"""
+# JSON1 merge patch (RFC 7396): keys in the patch replace or are merged into
+# the stored payload, and null values remove keys.
+_UPDATE_PAYLOAD_SQL = f"""
+    UPDATE jobs
+    SET payload = json_patch(COALESCE(payload, '{{}}'), ?1), updated_at = ?2,
+        profile = COALESCE(json_extract(?1, '$.profileName'), profile)
+    WHERE id = ?3
+    RETURNING {_JOB_COLUMNS}
+"""
+
+# Claim the next queued job for a worker in one statement, so concurrent
+# processes sharing the database can never both win the same row. Profiles
+# at their concurrency cap are skipped, and the profile that was served least
+# recently goes first so one busy profile cannot starve the others.
+_CLAIM_JOB_SQL = f"""
+    UPDATE jobs
+    SET status = 'running', lease_owner = ?1, lease_expires_at = ?2, started_at = ?3, updated_at = ?3
+    WHERE status = 'queued' AND id = (
+        SELECT candidate.id FROM jobs AS candidate
+        WHERE candidate.status = 'queued'
+          AND (
+              SELECT COUNT(*) FROM jobs AS active
+              WHERE active.profile = candidate.profile AND active.status = 'running'
+          ) < ?4
+        ORDER BY
+            (SELECT MAX(served.started_at) FROM jobs AS served WHERE served.profile = candidate.profile),
+            candidate.created_at,
+            candidate.id
+        LIMIT 1
+    )
+    RETURNING {_JOB_COLUMNS}
+"""
+_RENEW_LEASE_SQL = """
+    UPDATE jobs
+    SET lease_expires_at = ?, progress = COALESCE(?, progress), result = COALESCE(?, result), updated_at = ?
+    WHERE id = ? AND lease_owner = ? AND status = 'running'
+"""
+_RELEASE_JOB_SQL = """
+    UPDATE jobs
+    SET status = 'queued', progress = 0, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+    WHERE id = ? AND lease_owner = ? AND status = 'running'
+"""
+# Rows left `running` without a lease predate leasing and can only be orphans.
+_REQUEUE_EXPIRED_SQL = """
+    UPDATE jobs
+    SET status = 'queued', progress = 0, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?1
+    WHERE status = 'running' AND (lease_expires_at IS NULL OR lease_expires_at < ?1)
+"""
 
-    def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+# Columns added after the original schema, applied to existing databases on startup.
+_MIGRATION_COLUMNS = {
+    "profile": "TEXT NOT NULL DEFAULT 'default'",
+    "lease_owner": "TEXT",
+    "lease_expires_at": "TEXT",
+    "started_at": "TEXT",
+}
+DEFAULT_PROFILE = "default"
+
+
+class JobStore(SQLiteStore):
+    """SQLite-backed job persistence layer."""
 
     def _init_db(self) -> None:
         with self._connect() as conn:
@@ -35,33 +107,73 @@ class JobStore:
                 )
                 """
             )
+            existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, definition in _MIGRATION_COLUMNS.items():
+                if column not in existing_columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+                    if column == "profile":
+                        conn.execute(
+                            "UPDATE jobs SET profile = COALESCE(json_extract(payload, '$.profileName'), ?)",
+                            (DEFAULT_PROFILE,),
+                        )
+            # Listings page newest-first, optionally filtered by status.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs (status, created_at, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at, id)")
+            # Claiming counts running jobs and finds the last start per profile.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_profile_status ON jobs (profile, status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_profile_started_at ON jobs (profile, started_at)")
 
     def create_job(self, payload: Dict[str, Any]) -> str:
         job_id = str(uuid4())
         now = datetime.utcnow().isoformat()
+        payload = payload or {}
+        profile = payload.get("profileName") if isinstance(payload, dict) else None
         with self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO jobs (id, status, progress, payload, result, error, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (job_id, "queued", 0, json.dumps(payload or {}), None, None, now, now),
+                _INSERT_JOB_SQL,
+                (job_id, "queued", 0, json.dumps(payload), None, None, now, now, profile or DEFAULT_PROFILE),
             )
         return job_id
 
-    def list_jobs(self) -> List[Dict[str, Any]]:
+    def list_jobs(
+        self,
+        statuses: Optional[List[str]] = None,
+        after: Optional[Tuple[str, str]] = None,
+        limit: Optional[int] = None,
+        summary: bool = False,
+    ) -> List[Dict[str, Any]]:
+        '''
+        List jobs newest first using keyset pagination.
+        * `statuses` restricts the listing to jobs in any of the given states.
+        * `after` is the `(created_at, id)` of the last job on the previous page.
+        * `limit` caps the number of jobs returned, `None` returns every match.
+        * `summary` skips loading and decoding `payload` and `result`.
+        '''
+        columns = _SUMMARY_COLUMNS if summary else _JOB_COLUMNS
+        clauses: List[str] = []
+        params: List[Any] = []
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if after:
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend(after)
+        query = f"SELECT {columns} FROM jobs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
         with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT id, status, progress, payload, result, error, created_at, updated_at FROM jobs"
-            ).fetchall()
-        return [self._row_to_dict(row) for row in rows]
+            rows = conn.execute(query, params).fetchall()
+        row_to_dict = self._summary_row_to_dict if summary else self._row_to_dict
+        return [row_to_dict(row) for row in rows]
 
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT id, status, progress, payload, result, error, created_at, updated_at FROM jobs WHERE id = ?",
-                (job_id,),
-            ).fetchone()
+            row = conn.execute(_SELECT_JOB_SQL, (job_id,)).fetchone()
         if not row:
             return None
         return self._row_to_dict(row)
@@ -73,36 +185,91 @@ class JobStore:
         progress: Optional[int] = None,
         result: Optional[Dict[str, Any]] = None,
         error: Optional[str] = None,
-    ) -> None:
-        job = self.get_job(job_id)
-        if not job:
-            return
-        new_progress = progress if progress is not None else job.get("progress", 0)
+    ) -> Optional[Dict[str, Any]]:
+        '''
+        Atomically set the status of a job in a single round-trip.
+        * `progress` and `result` keep their stored values when omitted.
+        * Returns the updated job without its payload, or `None` if the job does not exist.
+        '''
         now = datetime.utcnow().isoformat()
         with self._connect() as conn:
-            conn.execute(
-                """
-                UPDATE jobs
-                SET status = ?, progress = ?, result = ?, error = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (status, new_progress, json.dumps(result) if result is not None else job.get("result"), error, now, job_id),
-            )
+            row = conn.execute(
+                _UPDATE_STATUS_SQL,
+                (status, progress, json.dumps(result) if result is not None else None, error, now, job_id),
+            ).fetchone()
+        if not row:
+            return None
+        return self._status_row_to_dict(row)
 
     def update_payload(self, job_id: str, payload_updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        job = self.get_job(job_id)
-        if not job:
-            return None
-        existing_payload = job.get("payload", {})
-        merged_payload = {**existing_payload, **payload_updates}
+        '''
+        Merge `payload_updates` into the stored payload inside SQLite and return the updated job.
+        '''
         now = datetime.utcnow().isoformat()
         with self._connect() as conn:
-            conn.execute(
-                "UPDATE jobs SET payload = ?, updated_at = ? WHERE id = ?",
-                (json.dumps(merged_payload), now, job_id),
+            row = conn.execute(
+                _UPDATE_PAYLOAD_SQL,
+                (json.dumps(payload_updates or {}), now, job_id),
+            ).fetchone()
+        if not row:
+            return None
+        return self._row_to_dict(row)
+
+    def claim_next_job(self, owner: str, lease_seconds: float, max_per_profile: int = 1) -> Optional[Dict[str, Any]]:
+        '''
+        Atomically move the next eligible queued job to `running` under a lease held by `owner`.
+        * Returns the claimed job, or `None` if nothing is claimable right now.
+        '''
+        now = datetime.utcnow()
+        expires_at = (now + timedelta(seconds=lease_seconds)).isoformat()
+        with self._connect() as conn:
+            row = conn.execute(
+                _CLAIM_JOB_SQL,
+                (owner, expires_at, now.isoformat(), max_per_profile),
+            ).fetchone()
+        if not row:
+            return None
+        return self._row_to_dict(row)
+
+    def renew_lease(
+        self,
+        job_id: str,
+        owner: str,
+        lease_seconds: float,
+        progress: Optional[int] = None,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        '''
+        Heartbeat for a running job, optionally recording progress and run stats in the same statement.
+        * Returns `False` if `owner` no longer holds the lease (expired and reclaimed, or restarted).
+        '''
+        now = datetime.utcnow()
+        expires_at = (now + timedelta(seconds=lease_seconds)).isoformat()
+        encoded_result = json.dumps(result) if result is not None else None
+        with self._connect() as conn:
+            cursor = conn.execute(
+                _RENEW_LEASE_SQL,
+                (expires_at, progress, encoded_result, now.isoformat(), job_id, owner),
             )
-        job.update({"payload": merged_payload, "updated_at": now})
-        return job
+        return cursor.rowcount == 1
+
+    def release_job(self, job_id: str, owner: str) -> bool:
+        '''
+        Give a running job back to the queue if `owner` still holds its lease.
+        '''
+        now = datetime.utcnow().isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(_RELEASE_JOB_SQL, (now, job_id, owner))
+        return cursor.rowcount == 1
+
+    def requeue_expired_leases(self) -> int:
+        '''
+        Return running jobs whose worker stopped heartbeating to the queue. Returns how many were reclaimed.
+        '''
+        now = datetime.utcnow().isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(_REQUEUE_EXPIRED_SQL, (now,))
+        return cursor.rowcount
 
     def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
         (
@@ -125,3 +292,26 @@ class JobStore:
             "created_at": created_at,
             "updated_at": updated_at,
         }
+
+    def _status_row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job_id, status, progress, result, error, created_at, updated_at = row
+        return {
+            "id": job_id,
+            "status": status,
+            "progress": progress,
+            "result": json.loads(result) if result else None,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def _summary_row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job_id, status, progress, error, created_at, updated_at = row
+        return {
+            "id": job_id,
+            "status": status,
+            "progress": progress,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
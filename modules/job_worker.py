@@ -1,114 +1,296 @@
-import queue
+import os
+import socket
 import subprocess
 import sys
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set
+from uuid import uuid4
 
-from modules.helpers import print_lg
+from modules.helpers import RUN_LOGS_DIR_ENV, get_run_logs_directory, print_lg
 from modules.job_store import JobStore
+from modules.progress import PROGRESS_PATH_ENV, ProgressTail
 
 
 class JobWorker:
-    """Background worker that processes jobs outside request threads."""
+    """Pool of background workers that claim jobs from the shared job database."""
 
-    def __init__(self, store: JobStore, poll_interval: float = 0.1) -> None:
+    def __init__(
+        self,
+        store: JobStore,
+        poll_interval: float = 0.1,
+        max_workers: int = 1,
+        max_per_profile: int = 1,
+        slots_root: str = os.path.join("data", "worker-slots"),
+        lease_seconds: Optional[float] = None,
+        progress_interval: float = 2.0,
+    ) -> None:
         '''
-        Initialize the background worker with a job store and queue.
+        Initialize the worker pool on top of the `jobs` table, which acts as a durable queue.
+        * `max_workers` is how many `runAiBot.py` subprocesses may run at once in this process.
+        * `max_per_profile` caps concurrent runs of the same LinkedIn profile across every process sharing the database.
+        * `slots_root` holds each slot's private Chrome user-data directory when `max_workers > 1`.
+        * `lease_seconds` is how long a claimed job survives without a heartbeat before another worker may reclaim it.
+        * `progress_interval` is the minimum number of seconds between progress writes for a job.
         '''
         self.store = store
         self.poll_interval = poll_interval
-        self.jobs_queue: "queue.Queue[str]" = queue.Queue()
-        self.worker_thread: Optional[threading.Thread] = None
-        self._log_event("Initializing JobWorker and ensuring background thread is running")
-        self._ensure_worker_thread()
+        self.max_workers = max(1, max_workers)
+        self.max_per_profile = max(1, max_per_profile)
+        self.slots_root = slots_root
+        self.lease_seconds = lease_seconds if lease_seconds is not None else max(60.0, poll_interval * 6)
+        self.progress_interval = progress_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._condition = threading.Condition()
+        self._in_flight: Dict[str, subprocess.Popen] = {}
+        self._requeued: Set[str] = set()
+        self._stopping = False
+        self._requeue_on_stop = False
+        self._last_reclaim = 0.0
+        self.worker_threads: List[Optional[threading.Thread]] = [None] * self.max_workers
+        self._log_event(
+            f"Initializing JobWorker {self.worker_id} with {self.max_workers} slot(s), "
+            f"max {self.max_per_profile} run(s) per profile"
+        )
+        self._reclaim_expired_leases()
+        self._ensure_worker_threads()
 
     def enqueue(self, job_id: str) -> None:
         '''
-        Add a job to the internal queue for asynchronous processing.
+        Wake an idle slot to claim a job that is already persisted as `queued`.
         '''
-        self._ensure_worker_thread()
+        self._ensure_worker_threads()
         self._log_event(f"Enqueuing job_id={job_id}")
-        self.jobs_queue.put(job_id)
+        with self._condition:
+            self._condition.notify()
 
-    def _ensure_worker_thread(self) -> None:
+    def shutdown(self, wait: bool = True, requeue: bool = False) -> None:
         '''
-        Lazily start or restart the background worker thread if it stops.
+        Stop claiming work and wind down the pool.
+        * `requeue = True` terminates in-flight runs and hands them back to the queue.
+        * Otherwise in-flight runs are allowed to finish (drained) when `wait = True`.
         '''
-        if self.worker_thread and self.worker_thread.is_alive():
-            return
+        with self._condition:
+            self._stopping = True
+            self._requeue_on_stop = requeue
+            in_flight = dict(self._in_flight)
+            if requeue:
+                self._requeued.update(in_flight)
+            self._condition.notify_all()
+
+        if requeue:
+            for job_id, automation in in_flight.items():
+                self._log_event(f"Re-queuing in-flight job_id={job_id} (pid={automation.pid})")
+                self._terminate(automation)
 
-        self.worker_thread = threading.Thread(target=self._run, daemon=True)
-        self._log_event("Starting background worker thread")
-        self.worker_thread.start()
+        if wait:
+            for thread in self.worker_threads:
+                if thread and thread.is_alive() and thread is not threading.current_thread():
+                    thread.join()
+
+    def _reclaim_expired_leases(self) -> None:
+        '''
+        Put jobs whose worker died (no heartbeat within the lease) back in the queue.
+        '''
+        self._last_reclaim = time.monotonic()
+        reclaimed = self.store.requeue_expired_leases()
+        if reclaimed:
+            self._log_event(f"Reclaimed {reclaimed} job(s) with expired leases")
+
+    def _ensure_worker_threads(self) -> None:
+        '''
+        Lazily start or restart any background worker thread that has stopped.
+        '''
+        with self._condition:
+            if self._stopping:
+                return
+            for slot, thread in enumerate(self.worker_threads):
+                if thread and thread.is_alive():
+                    continue
+                thread = threading.Thread(target=self._run, args=(slot,), daemon=True, name=f"JobWorker-{slot}")
+                self.worker_threads[slot] = thread
+                self._log_event(f"Starting background worker thread for slot={slot}")
+                thread.start()
 
-    def _run(self) -> None:
+    def _run(self, slot: int) -> None:
         '''
-        Consume queued jobs in a background thread until shutdown.
+        Claim and run queued jobs in a background thread until shutdown.
         '''
-        while True:
-            job_id = self.jobs_queue.get()
-            if job_id is None:
-                break
-            self._log_event(f"Dequeued job_id={job_id} for processing")
+        while not self._stopping:
+            job = self.store.claim_next_job(self.worker_id, self.lease_seconds, self.max_per_profile)
+            if not job:
+                if time.monotonic() - self._last_reclaim >= self.lease_seconds:
+                    self._reclaim_expired_leases()
+                with self._condition:
+                    if not self._stopping:
+                        self._condition.wait(timeout=self.poll_interval)
+                continue
+
+            job_id = job["id"]
+            self._log_event(f"Claimed job_id={job_id} for processing on slot={slot}")
             ##> ------ OpenAI Assistant : openai-assistant@example.com - Bug fix ------
             try:
-                self._process(job_id)
+                self._process(job, slot)
             except Exception as exc:  # pragma: no cover - defensive fallback
                 self._log_event(f"Unhandled exception for job_id={job_id}: {exc}")
                 self.store.update_status(job_id, status="failed", error=str(exc))
-            finally:
-                self.jobs_queue.task_done()
             ##<
 
-    def _process(self, job_id: str) -> None:
+    def _slot_environment(self, job_id: str, slot: int, run_dir: Path, progress_path: Path) -> Dict[str, str]:
+        '''
+        Build the subprocess environment so each run logs into its own folder and
+        parallel slots never share a Chrome profile.
+        '''
+        env = dict(os.environ, JOB_ID=job_id, WORKER_SLOT=str(slot), PYTHONUNBUFFERED="1")
+        env[RUN_LOGS_DIR_ENV] = str(run_dir.resolve())
+        env[PROGRESS_PATH_ENV] = str(progress_path.resolve())
+        if self.max_workers > 1:
+            user_data_dir = Path(self.slots_root) / f"slot-{slot}" / "chrome-user-data"
+            user_data_dir.mkdir(parents=True, exist_ok=True)
+            env["CHROME_USER_DATA_DIR"] = str(user_data_dir.resolve())
+        return env
+
+    @staticmethod
+    def _progress_from(stats: Dict[str, Any]) -> int:
+        '''
+        Map the bot's reported completion `percent` onto the 5-95 range used while a run is active.
+        '''
+        try:
+            percent = float(stats.get("percent", 0))
+        except (TypeError, ValueError):
+            percent = 0.0
+        return int(min(95, max(5, 5 + percent * 0.9)))
+
+    def _process(self, job: Dict[str, Any], slot: int = 0) -> None:
         '''
-        Run the LinkedIn automation for the given job identifier.
+        Run the LinkedIn automation for a job this worker has claimed.
         '''
         ##> ------ OpenAI Assistant : openai-assistant@example.com - Feature ------
-        payload = self.store.get_job(job_id)
-        if not payload:
-            self._log_event(f"Job record not found for job_id={job_id}")
+        job_id = job["id"]
+        if self._stopping:
+            self._log_event(f"Worker is shutting down; returning job_id={job_id} to the queue")
+            self.store.release_job(job_id, self.worker_id)
             return
 
-        self._log_event(f"Launching automation for job_id={job_id}")
-        self.store.update_status(job_id, status="running", progress=5)
+        self._log_event(f"Launching automation for job_id={job_id} on slot={slot}")
         progress_value = 5
+        self.store.renew_lease(job_id, self.worker_id, self.lease_seconds, progress=progress_value)
+        lease_lost = False
+        stats: Dict[str, Any] = {}
+        automation: Optional[subprocess.Popen] = None
         try:
-            log_path = Path("logs") / "runai.log"
-            log_path.parent.mkdir(parents=True, exist_ok=True)
+            # Everything a run writes (bot log, console output, ChromeDriver log,
+            # screenshots, progress events) lives in its own folder keyed by job id.
+            run_dir = Path(get_run_logs_directory(job_id))
+            run_dir.mkdir(parents=True, exist_ok=True)
+            log_path = run_dir / "console.log"
+            progress_path = run_dir / "progress.jsonl"
+            progress_path.unlink(missing_ok=True)
+            progress_tail = ProgressTail(str(progress_path))
             timestamp = datetime.utcnow().isoformat() + "Z"
             with log_path.open("a", encoding="utf-8") as log_file:
-                log_file.write(f"\n---- {timestamp} job_id={job_id} ----\n")
+                log_file.write(f"\n---- {timestamp} job_id={job_id} slot={slot} ----\n")
+                log_file.flush()
                 automation = subprocess.Popen(
                     [sys.executable, "runAiBot.py"],
                     stdout=log_file,
                     stderr=log_file,
+                    env=self._slot_environment(job_id, slot, run_dir, progress_path),
                 )
+                with self._condition:
+                    self._in_flight[job_id] = automation
+                    stop_now = self._stopping and self._requeue_on_stop
+                    if stop_now:
+                        self._requeued.add(job_id)
+                if stop_now:
+                    self._terminate(automation)
                 self._log_event(
                     f"Started runAiBot.py for job_id={job_id} with pid={automation.pid}"
                 )
-                while automation.poll() is None:
-                    progress_value = min(progress_value + 1, 95)
-                    self.store.update_status(
-                        job_id, status="running", progress=progress_value
-                    )
-                    time.sleep(self.poll_interval)
-
-            if automation.returncode == 0:
-                self._log_event(f"Automation completed successfully for job_id={job_id}")
-                self.store.update_status(job_id, status="completed", progress=100)
+                heartbeat_interval = self.lease_seconds / 3
+                last_write = time.monotonic()
+                stats_changed = False
+                try:
+                    while automation.poll() is None:
+                        for event in progress_tail.read_new():
+                            stats.update(event)
+                            stats_changed = True
+                        since_write = time.monotonic() - last_write
+                        # Write only when the bot reported something new (at most every
+                        # progress_interval) or when the lease needs a heartbeat. A failed
+                        # renewal means the job was restarted or reclaimed elsewhere.
+                        if (stats_changed and since_write >= self.progress_interval) or since_write >= heartbeat_interval:
+                            progress_value = self._progress_from(stats)
+                            renewed = self.store.renew_lease(
+                                job_id,
+                                self.worker_id,
+                                self.lease_seconds,
+                                progress=progress_value,
+                                result=stats if stats_changed else None,
+                            )
+                            last_write = time.monotonic()
+                            stats_changed = False
+                            if not renewed:
+                                lease_lost = True
+                                self._log_event(f"Lost lease on job_id={job_id}; stopping pid={automation.pid}")
+                                self._terminate(automation)
+                                break
+                        time.sleep(self.poll_interval)
+                finally:
+                    with self._condition:
+                        self._in_flight.pop(job_id, None)
+                        requeued = job_id in self._requeued
+                        self._requeued.discard(job_id)
+
+            for event in progress_tail.read_new():
+                stats.update(event)
+            progress_path.unlink(missing_ok=True)
+
+            if lease_lost:
+                return
+            if requeued:
+                self._log_run_event(log_path, f"Automation for job_id={job_id} stopped for shutdown; returned to the queue")
+                self.store.release_job(job_id, self.worker_id)
+            elif automation.returncode == 0:
+                self._log_run_event(log_path, f"Automation completed successfully for job_id={job_id}")
+                self.store.update_status(job_id, status="completed", progress=100, result=stats or None)
             else:
                 error_message = f"Automation exited with code {automation.returncode}"
-                self._log_event(f"Automation failed for job_id={job_id}: {error_message}")
-                self.store.update_status(job_id, status="failed", error=error_message)
+                self._log_run_event(log_path, f"Automation failed for job_id={job_id}: {error_message}")
+                self.store.update_status(job_id, status="failed", result=stats or None, error=error_message)
         except Exception as exc:  # pragma: no cover - defensive logging only
             self._log_event(f"Exception while running automation for job_id={job_id}: {exc}")
+            # Don't leave the run (and its Chrome profile) going once the job is no longer tracked.
+            if automation is not None and automation.poll() is None:
+                self._terminate(automation)
             self.store.update_status(job_id, status="failed", error=str(exc))
         ##<
 
+    def _terminate(self, automation: subprocess.Popen, timeout: float = 10.0) -> None:
+        '''
+        Ask a running automation to stop, killing it if it does not exit within `timeout` seconds.
+        '''
+        try:
+            automation.terminate()
+            automation.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            automation.kill()
+        except Exception as exc:  # pragma: no cover - defensive logging only
+            self._log_event(f"Failed to stop pid={automation.pid}: {exc}")
+
+    def _log_run_event(self, log_path: Path, message: str) -> None:
+        '''
+        Record a lifecycle event both in the shared application log and in the run's own console log.
+        '''
+        self._log_event(message)
+        try:
+            with log_path.open("a", encoding="utf-8") as log_file:
+                log_file.write(f"[JobWorker] {message}\n")
+        except OSError:
+            pass
+
     def _log_event(self, message: str) -> None:
         '''
         Write lifecycle events to the shared application log.
@@ -0,0 +1,209 @@
+'''
+Background writer behind `print_lg`.
+
+Messages are handed to a queue and written by a single daemon thread that keeps the
+log file open, so the Selenium loop never waits on disk. The buffer is flushed once it
+holds `max_buffer_bytes` or `flush_interval` seconds after the oldest unflushed message.
+When the file grows past `max_file_bytes` it is rotated to `log.txt.1.gz`, `log.txt.2.gz`, ...
+keeping `backup_count` compressed copies. Everything still queued is written on exit.
+
+Only `atexit` flushes on exit, which doesn't run when the process is killed by a signal,
+so processes that can be terminated should flush from a signal handler (see `runAiBot.py`).
+Rotation renames the live file. Another process appending to the same file reopens it on
+its next write once it notices, but lines it writes in between can end up in the rotated
+copy or be lost, so processes sharing a log file should share one rotation policy and
+rotation is best left to the process that owns the file (each JobWorker run logs to its own folder).
+'''
+
+import atexit
+import gzip
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from typing import List, TextIO
+
+
+class _FlushRequest:
+    """Queue marker that asks the writer thread to flush and report back."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class BufferedLogWriter:
+    """Queue-backed, rotating append-only log file writer."""
+
+    def __init__(
+        self,
+        path: str,
+        max_buffer_bytes: int = 64 * 1024,
+        flush_interval: float = 0.5,
+        max_file_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        '''
+        * `max_file_bytes <= 0` disables rotation.
+        * `backup_count` is how many compressed rotations are kept, older ones are deleted.
+        '''
+        self.path = path
+        self.max_buffer_bytes = max_buffer_bytes
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = max(0, backup_count)
+        self._queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._file: TextIO | None = None
+        self._error: Exception | None = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def write(self, text: str) -> None:
+        '''
+        Queue `text` for writing. Never blocks on disk.
+        '''
+        if self._closed:
+            return
+        self._ensure_thread()
+        self._queue.put(text)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        '''
+        Write everything queued so far to disk. Returns `False` if that didn't finish within `timeout`.
+        '''
+        if self._closed or not self._thread:
+            return True
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        '''
+        Flush whatever is still queued and stop the writer thread. Registered with `atexit`.
+        '''
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def take_error(self) -> Exception | None:
+        '''
+        Return (and clear) the last error hit by the writer thread, so the caller can report it.
+        '''
+        error, self._error = self._error, None
+        return error
+
+    def _ensure_thread(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._closed or (self._thread and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name="BufferedLogWriter")
+            self._thread.start()
+
+    def _run(self) -> None:
+        pending: List[str] = []
+        pending_bytes = 0
+        deadline: float | None = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, str):
+                pending.append(item)
+                pending_bytes += len(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if pending_bytes < self.max_buffer_bytes:
+                    continue
+
+            if pending:
+                self._write(pending)
+                pending, pending_bytes = [], 0
+            deadline = None
+
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif item is _STOP:
+                self._close_file()
+                return
+
+    def _write(self, chunks: List[str]) -> None:
+        try:
+            if self._file is not None and self._was_rotated():
+                self._close_file()
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write("".join(chunks))
+            self._file.flush()
+            if self.max_file_bytes > 0 and self._file.tell() >= self.max_file_bytes:
+                self._rotate()
+        except Exception as e:
+            self._error = e
+            self._close_file()
+
+    def _rotate(self) -> None:
+        '''
+        Compress the current file into `<path>.1.gz`, shifting older copies up by one.
+        '''
+        self._close_file()
+        if self.backup_count == 0:
+            open(self.path, "w").close()
+            return
+        oldest = f"{self.path}.{self.backup_count}.gz"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}.gz"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}.gz")
+        # Move the file aside first so the live log restarts immediately,
+        # then compress the moved copy.
+        rotated = f"{self.path}.1"
+        os.replace(self.path, rotated)
+        with open(rotated, "rb") as source, gzip.open(rotated + ".gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(rotated)
+
+    def _was_rotated(self) -> bool:
+        '''
+        Whether the file this writer has open was moved away, by another process rotating it.
+        '''
+        try:
+            return not os.path.samestat(os.fstat(self._file.fileno()), os.stat(self.path))
+        except FileNotFoundError:
+            return True
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except Exception as e:
+            print(f"Failed to close log file {self.path}: {e}", file=sys.stderr)
+        self._file = None
+
+
+def open_log_writer(path: str, **options) -> BufferedLogWriter:
+    '''
+    Create a `BufferedLogWriter` that is flushed and closed when the interpreter exits.
+    '''
+    writer = BufferedLogWriter(path, **options)
+    atexit.register(writer.close)
+    return writer
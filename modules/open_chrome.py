@@ -17,8 +17,8 @@ import threading
 import time
 from datetime import datetime
 
-from modules.helpers import get_screenshot_directory, make_directories
-from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path
+from modules.helpers import get_chromedriver_log_path, get_screenshot_directory, make_directories
+from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, generated_resume_path
 from config.questions import default_resume_path
 if stealth_mode:
     import undetected_chromedriver as uc
@@ -75,11 +75,11 @@ def _start_screenshot_loop(driver):
 
 
 try:
-    chromedriver_log_file = os.path.join(logs_folder_path, "chromedriver.log")
+    chromedriver_log_file = get_chromedriver_log_path()
     make_directories([
         file_name,
         failed_file_name,
-        logs_folder_path+"/screenshots",
+        get_screenshot_directory(),
         default_resume_path,
         generated_resume_path+"/temp",
         chromedriver_log_file,
@@ -97,7 +97,8 @@ try:
     if safe_mode: 
         print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
     else:
-        profile_dir = find_default_profile_directory()
+        # Parallel worker slots each get their own user-data dir so Chrome instances don't collide.
+        profile_dir = os.getenv("CHROME_USER_DATA_DIR") or find_default_profile_directory()
         if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
         else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
     print_lg(f"Saving ChromeDriver verbose logs to: {chromedriver_log_file}")
@@ -0,0 +1,69 @@
+'''
+Structured progress channel between `runAiBot.py` and the `JobWorker` that launched it.
+
+The worker passes a JSON-lines file path through the `JOB_PROGRESS_PATH` environment
+variable. The bot appends one JSON object per event with `report_progress`, and the
+worker reads only the bytes appended since its last poll with `ProgressTail`.
+'''
+
+import json
+import os
+from typing import Any, Dict, List, TextIO
+
+PROGRESS_PATH_ENV = "JOB_PROGRESS_PATH"
+
+_progress_file: TextIO | None = None
+_progress_disabled = False
+
+
+def report_progress(**fields: Any) -> None:
+    '''
+    Append a progress event such as `applied=3, search_term="Python"`.
+    * Does nothing when the bot was not launched by `JobWorker` (no `JOB_PROGRESS_PATH`).
+    * Never raises, progress reporting must not interrupt applying.
+    '''
+    global _progress_file, _progress_disabled
+    if _progress_disabled:
+        return
+    try:
+        if _progress_file is None:
+            path = os.getenv(PROGRESS_PATH_ENV)
+            if not path:
+                _progress_disabled = True
+                return
+            _progress_file = open(path, "a", encoding="utf-8", buffering=1)
+        _progress_file.write(json.dumps(fields, default=str) + "\n")
+    except Exception:
+        _progress_disabled = True
+
+
+class ProgressTail:
+    """Incrementally read progress events appended to a JSON-lines file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.offset = 0
+        self._partial = b""
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        '''
+        Return events appended since the previous call. Incomplete trailing lines are kept for the next call.
+        '''
+        try:
+            with open(self.path, "rb") as file:
+                file.seek(self.offset)
+                chunk = file.read()
+        except FileNotFoundError:
+            return []
+        self.offset += len(chunk)
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        events = []
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                events.append(event)
+        return events
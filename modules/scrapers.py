@@ -0,0 +1,203 @@
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from modules.helpers import print_lg
+
+
+# Reads every job card in the search results in one round-trip. LinkedIn only
+# renders a card's contents once it's near the viewport, so empty cards are
+# scrolled into view and polled until they render (or `timeout` ms run out).
+_JOB_CARDS_SCRIPT = '''
+const timeout = arguments[0];
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + timeout;
+const pause = () => new Promise((resolve) => setTimeout(resolve, 50));
+
+(async () => {
+    const cards = [];
+    for (const item of document.querySelectorAll('li[data-occludable-job-id]')) {
+        let anchor = item.querySelector('a');
+        if (!anchor) {
+            item.scrollIntoView({block: 'center'});
+            while (!(anchor = item.querySelector('a')) && Date.now() < deadline) await pause();
+        }
+        const subtitle = item.querySelector('.artdeco-entity-lockup__subtitle');
+        const state = item.querySelector('.job-card-container__footer-job-state');
+        cards.push({
+            id: item.getAttribute('data-occludable-job-id'),
+            title: anchor ? anchor.innerText.split('\\n')[0].trim() : null,
+            subtitle: subtitle ? subtitle.innerText.trim() : null,
+            applied: !!state && state.innerText.trim() === 'Applied',
+            element: item,
+            anchor: anchor,
+        });
+    }
+    return cards;
+})().then(done, (error) => done({error: String(error)}));
+'''
+
+
+# Defines `showsJob(jobId)`, whether the job details pane shows `jobId`. LinkedIn
+# changes the URL as soon as a card is clicked, before the pane re-renders, so the
+# ID is read from the link on the pane's job title. Jobs opened on their own page
+# (`/jobs/view/<id>`) have no such link, their URL is checked instead.
+_SHOWS_JOB_FUNCTION = '''
+const showsJob = (jobId) => {
+    const link = document.querySelector([
+        '.job-details-jobs-unified-top-card__job-title a[href*="/jobs/view/"]',
+        '.jobs-unified-top-card__job-title a[href*="/jobs/view/"]',
+        '.jobs-search__job-details a[href*="/jobs/view/"]',
+    ].join(', '));
+    if (link) {
+        const match = link.getAttribute('href').match(/\\/jobs\\/view\\/(\\d+)/);
+        return !!match && match[1] === jobId;
+    }
+    return location.pathname.includes(`/jobs/view/${jobId}`);
+};
+'''
+
+
+# Reads everything the bot needs from the job details pane in one round-trip,
+# once it shows `jobId` and its description has stopped changing. Fields that
+# don't exist (usually the hirer card) come back as null without a fixed wait.
+_JOB_DETAILS_SCRIPT = _SHOWS_JOB_FUNCTION + '''
+const jobId = arguments[0];
+const timeout = arguments[1];
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + timeout;
+const pause = () => new Promise((resolve) => setTimeout(resolve, 100));
+const first = (selectors) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) return element;
+    }
+    return null;
+};
+
+(async () => {
+    let description = null;
+    let previous = null;
+    let settled = false;
+    while (Date.now() < deadline) {
+        description = document.querySelector('.jobs-box__html-content');
+        const text = description ? description.innerText : null;
+        // Only descriptions read while the pane shows the job count, never the previous job's.
+        const shown = showsJob(jobId);
+        if (shown && text && text === previous) {
+            settled = true;
+            break;
+        }
+        previous = shown ? text : null;
+        await pause();
+    }
+
+    // "About the company" can be lazy-loaded further down the pane.
+    let company = document.querySelector('.jobs-company__box');
+    if (!company && description) {
+        description.scrollIntoView({block: 'end'});
+        const companyDeadline = Math.min(deadline, Date.now() + 1500);
+        while (!(company = document.querySelector('.jobs-company__box')) && Date.now() < companyDeadline) await pause();
+    }
+
+    const topCard = first([
+        '.job-details-jobs-unified-top-card__primary-description-container',
+        '.job-details-jobs-unified-top-card__primary-description',
+        '.jobs-unified-top-card__primary-description',
+        '.jobs-details__main-content',
+    ]);
+    const posted = topCard
+        ? Array.from(topCard.querySelectorAll('span')).find((span) => span.textContent.replace(/\\s+/g, ' ').includes(' ago'))
+        : null;
+    const hirer = document.querySelector('.hirer-card__hirer-information');
+    const hirerLink = hirer ? hirer.querySelector('a') : null;
+    const hirerName = hirer ? hirer.querySelector('span') : null;
+    if (topCard) topCard.scrollIntoView({block: 'start'});
+
+    return {
+        shown: showsJob(jobId),
+        settled: settled,
+        description: description ? description.innerText : null,
+        description_html: description ? description.innerHTML : null,
+        about_company: company ? company.innerText : null,
+        posted_text: posted ? posted.innerText : null,
+        hirer_name: hirerName ? hirerName.innerText : null,
+        hirer_link: hirerLink ? hirerLink.href : null,
+        applied: !!document.querySelector('.jobs-s-apply__application-link'),
+    };
+})().then(done, (error) => done({error: String(error)}));
+'''
+
+
+# Resolves `true` as soon as the details pane shows `jobId`, `false` after `timeout` ms.
+_JOB_PANE_SCRIPT = _SHOWS_JOB_FUNCTION + '''
+const jobId = arguments[0];
+const timeout = arguments[1];
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + timeout;
+const poll = () => {
+    if (showsJob(jobId)) return done(true);
+    if (Date.now() >= deadline) return done(false);
+    setTimeout(poll, 100);
+};
+poll();
+'''
+
+
+def parse_card_subtitle(subtitle: str) -> tuple[str, str, str]:
+    '''
+    Function to split a job card subtitle like `"Acme · Austin, TX (Hybrid)"`.
+    * Returns `(company, work_location, work_style)`
+    '''
+    index = subtitle.find(' · ')
+    company = subtitle[:index]
+    work_location = subtitle[index+3:]
+    work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
+    work_location = work_location[:work_location.rfind('(')].strip()
+    return company, work_location, work_style
+
+
+def scrape_job_cards(driver: WebDriver, timeout: float = 5.0) -> list[dict]:
+    '''
+    Function to read every job card on the current search results page with a single `execute_async_script`.
+    * Returns a list of dicts with `id`, `title`, `company`, `work_location`, `work_style`, `applied`,
+      `element` (the `li` card) and `anchor` (its link, `None` if the card never rendered)
+    * Will spend a max of `timeout` seconds waiting for off-screen cards to render
+    '''
+    cards = driver.execute_async_script(_JOB_CARDS_SCRIPT, int(timeout * 1000))
+    if isinstance(cards, dict):
+        raise RuntimeError(f"Failed to scrape job cards: {cards.get('error')}")
+    for card in cards:
+        card['company'], card['work_location'], card['work_style'] = parse_card_subtitle(card['subtitle'] or '')
+        if card['anchor'] is None:
+            print_lg(f"Job card {card['id']} didn't render in time!")
+    return cards
+
+
+def wait_for_job_pane(driver: WebDriver, job_id: str, timeout: float = 5.0) -> bool:
+    '''
+    Function to wait until the job details pane shows `job_id`, going by its title link like `extract_job_details`.
+    * Returns `False` if it didn't within `timeout` seconds
+    '''
+    try:
+        return driver.execute_async_script(_JOB_PANE_SCRIPT, job_id, int(timeout * 1000))
+    except Exception as e:
+        print_lg(f"Failed to check if the details of Job ID: {job_id} are open!", e)
+        return False
+
+
+def extract_job_details(driver: WebDriver, job_id: str, timeout: float = 5.0) -> dict:
+    '''
+    Function to read the opened job's details pane with a single `execute_async_script`.
+    * Waits up to `timeout` seconds for the pane to show `job_id` (going by its title link, not the URL) and for its description to stop changing
+    * Returns a dict with `description`, `description_html`, `about_company`, `posted_text`, `hirer_name`
+      and `hirer_link`, each `None` when missing, `applied` if LinkedIn shows the job as applied,
+      and `settled = False` if the pane never settled
+    * Raises `RuntimeError` if the pane never showed `job_id`, rather than returning another job's details
+    '''
+    details = driver.execute_async_script(_JOB_DETAILS_SCRIPT, job_id, int(timeout * 1000))
+    if 'error' in details:
+        raise RuntimeError(f"Failed to extract job details: {details['error']}")
+    if not details.pop('shown'):
+        raise RuntimeError(f"Job details pane never showed Job ID: {job_id} in {timeout} seconds!")
+    if not details['settled']:
+        print_lg(f"Job details for Job ID: {job_id} didn't finish loading in {timeout} seconds!")
+    return details
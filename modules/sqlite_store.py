@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import threading
+from typing import List
+
+
+class SQLiteStore:
+    """Base for SQLite-backed stores: one tuned, pooled connection per thread."""
+
+    def __init__(self, db_path: str, busy_timeout: float = 5.0, cached_statements: int = 64) -> None:
+        '''
+        Open (or create) the database at `db_path` and create the store's schema.
+        * `busy_timeout` is how many seconds a connection waits on a locked database before failing.
+        * `cached_statements` is the per-connection prepared statement cache size.
+        '''
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        '''
+        Return this thread's pooled connection, opening and tuning it on first use.
+        '''
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        # WAL lets the dashboard keep reading while the worker writes, and
+        # NORMAL sync skips the per-commit fsync that WAL makes unnecessary.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        '''
+        Close every pooled connection. Threads transparently reconnect on next use.
+        '''
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def _init_db(self) -> None:
+        raise NotImplementedError
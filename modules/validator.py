@@ -200,10 +200,27 @@ def validate_settings() -> None | ValueError | TypeError:
     
     # check_string(generated_resume_path, "generated_resume_path", min_length=1)
 
+    check_string(history_db_path, "history_db_path", min_length=1)
     check_string(file_name, "file_name", min_length=1)
     check_string(failed_file_name, "failed_file_name", min_length=1)
+    check_string(answer_bank_db_path, "answer_bank_db_path", min_length=1)
+    check_string(ai_cache_db_path, "ai_cache_db_path", min_length=1)
+    check_int(ai_cache_max_entries, "ai_cache_max_entries", 0)
+    check_int(ai_answer_cache_days, "ai_answer_cache_days", 0)
+    check_boolean(batch_ai_questions, "batch_ai_questions")
+    check_int(rejected_jobs_ttl_days, "rejected_jobs_ttl_days", 0)
+    check_int(blacklisted_companies_ttl_days, "blacklisted_companies_ttl_days", 0)
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
+    check_int(log_max_size_mb, "log_max_size_mb", 0)
+    check_int(log_backup_count, "log_backup_count", 0)
 
+    check_boolean(fetch_job_details_over_http, "fetch_job_details_over_http")
+    check_int(http_fetch_workers, "http_fetch_workers", 1)
+    check_int(http_fetch_interval_ms, "http_fetch_interval_ms", 0)
+    check_int(prescreen_jobs_ahead, "prescreen_jobs_ahead", 0)
+
+    check_boolean(event_driven_waits, "event_driven_waits")
+    check_int(dom_quiet_ms, "dom_quiet_ms", 0)
     check_int(click_gap, "click_gap", 0)
 
     check_boolean(run_in_background, "run_in_background")
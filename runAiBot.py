@@ -17,41 +17,82 @@ version:    24.12.29.12.30
 import os
 import csv
 import re
+import sys
+import signal
 import pyautogui
 
 # Set CSV field size limit to prevent field size errors
 csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
 
 from random import choice, shuffle, randint
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for_futures
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support.select import Select
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException, WebDriverException
 
 from config.personals import *
 from config.questions import *
 from config.search import *
-from config.secrets import use_AI, username, password, ai_provider
+from config.secrets import use_AI, username, password, ai_provider, llm_model
 from config.settings import *
 
 from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
+from modules.progress import report_progress
+from modules.history_store import ApplicationHistoryStore
+from modules.job_index import KnownJobIndex
+from modules.scrapers import extract_job_details, scrape_job_cards, wait_for_job_pane
+from modules.form_fields import snapshot_form, write_form
+from modules.job_fetcher import JobDetailFetcher
+from modules.ai_cache import answer_cache_key, answer_cache_ttl, get_ai_cache
+from modules.answer_bank import AnswerBank, RuleMatcher
 
 if use_AI:
-    from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
-    from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
-    from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question
+    from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_answer_questions, ai_close_openai_client
+    from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question, deepseek_answer_questions
+    from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question, gemini_answer_questions
 
 from typing import Literal
 
 
 pyautogui.FAILSAFE = False
+
+history_store = ApplicationHistoryStore(history_db_path, legacy_csv_path=file_name)
+known_jobs = KnownJobIndex(history_store, os.path.splitext(history_db_path)[0] + ".bloom")
+# Screens jobs and extracts their skills with AI in the background, while the browser applies
+answer_bank = AnswerBank(answer_bank_db_path)
+answer_matcher = RuleMatcher()
+pipeline_pool = ThreadPoolExecutor(max_workers=2 * prescreen_jobs_ahead + 2, thread_name_prefix="JobPipeline")
+# Skill extractions of saved jobs, written to the history when they finish
+pending_skills: set[Future] = set()
+
+
+def remember_rejected_job(job_id: str, company: str, reason: str, detail: str | None = None) -> None:
+    '''
+    Function to persist a skipped job so later runs and parallel workers skip it from the listing
+    '''
+    if rejected_jobs_ttl_days <= 0: return
+    try:
+        history_store.reject_job(job_id, company, reason, timedelta(days=rejected_jobs_ttl_days), detail)
+    except Exception as e:
+        print_lg("Failed to save rejected job!", e)
+
+
+def remember_blacklisted_company(company: str, reason: str, detail: str | None = None) -> None:
+    '''
+    Function to persist a blacklisted company so later runs skip its jobs without opening them
+    '''
+    if blacklisted_companies_ttl_days <= 0: return
+    try:
+        history_store.blacklist_company(company, reason, timedelta(days=blacklisted_companies_ttl_days), detail)
+    except Exception as e:
+        print_lg("Failed to save blacklisted company!", e)
 # if use_resume_generator:    from resume_generator import is_logged_in_GPT, login_GPT, open_resume_chat, create_custom_resume
 
 
@@ -85,6 +126,7 @@ easy_applied_count = 0
 external_jobs_count = 0
 failed_count = 0
 skip_count = 0
+scanned_count = 0
 dailyEasyApplyLimitReached = False
 
 re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
@@ -101,7 +143,21 @@ notice_period_months = str(notice_period//30)
 notice_period_weeks = str(notice_period//7)
 notice_period = str(notice_period)
 
+# Answers of `modules.answer_bank.ANSWER_RULES`, besides "city", "work_location" and "previous_answer" that depend on the question
+answer_values = {
+    'years_of_experience': years_of_experience, 'phone_number': phone_number, 'street': street, 'state': state, 'zipcode': zipcode, 'country': country,
+    'full_name': full_name, 'first_name': first_name, 'middle_name': middle_name, 'last_name': last_name, 'recent_employer': recent_employer,
+    'notice_period_months': notice_period_months, 'notice_period_weeks': notice_period_weeks, 'notice_period': notice_period,
+    'current_ctc_monthly': current_ctc_monthly, 'current_ctc_lakhs': current_ctc_lakhs, 'current_ctc': current_ctc,
+    'desired_salary_monthly': desired_salary_monthly, 'desired_salary_lakhs': desired_salary_lakhs, 'desired_salary': desired_salary,
+    'linkedIn': linkedIn, 'website': website, 'confidence_level': confidence_level, 'linkedin_headline': linkedin_headline,
+    'hear_about_us': "https://github.com/GodsScion/Auto_job_applier_linkedIn",
+    'gender': gender, 'disability_status': disability_status, 'veteran_status': veteran_status, 'us_citizenship': us_citizenship,
+    'require_visa': require_visa, 'proficiency': 'Professional', 'linkedin_summary': linkedin_summary, 'cover_letter': cover_letter,
+}
+
 aiClient = None
+detail_fetcher = None
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None # TODO extract about company for AI
 ##<
@@ -166,23 +222,6 @@ def login_LN() -> None:
 
 
 
-def get_applied_job_ids() -> set[str]:
-    '''
-    Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
-    '''
-    job_ids: set[str] = set()
-    try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
-
-
-
 def set_search_location() -> None:
     '''
     Function to set search location
@@ -197,7 +236,7 @@ def set_search_location() -> None:
             actions.send_keys(Keys.TAB, Keys.TAB).perform()
             actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
             actions.send_keys(search_location.strip()).perform()
-            sleep(2)
+            wait_for_suggestions(driver)
             actions.send_keys(Keys.ENTER).perform()
             try_xp(driver, ".//button[@aria-label='Cancel']")
         except Exception as e:
@@ -215,40 +254,40 @@ def apply_filters() -> None:
         recommended_wait = 1 if click_gap < 1 else 0
 
         wait.until(EC.presence_of_element_located((By.XPATH, '//button[normalize-space()="All filters"]'))).click()
-        buffer(recommended_wait)
+        settle(driver, recommended_wait)
 
         wait_span_click(driver, sort_by)
         wait_span_click(driver, date_posted)
-        buffer(recommended_wait)
+        settle(driver, recommended_wait)
 
         multi_sel_noWait(driver, experience_level) 
         multi_sel_noWait(driver, companies, actions)
-        if experience_level or companies: buffer(recommended_wait)
+        if experience_level or companies: settle(driver, recommended_wait)
 
         multi_sel_noWait(driver, job_type)
         multi_sel_noWait(driver, on_site)
-        if job_type or on_site: buffer(recommended_wait)
+        if job_type or on_site: settle(driver, recommended_wait)
 
         if easy_apply_only: boolean_button_click(driver, actions, "Easy Apply")
         
         multi_sel_noWait(driver, location)
         multi_sel_noWait(driver, industry)
-        if location or industry: buffer(recommended_wait)
+        if location or industry: settle(driver, recommended_wait)
 
         multi_sel_noWait(driver, job_function)
         multi_sel_noWait(driver, job_titles)
-        if job_function or job_titles: buffer(recommended_wait)
+        if job_function or job_titles: settle(driver, recommended_wait)
 
         if under_10_applicants: boolean_button_click(driver, actions, "Under 10 applicants")
         if in_your_network: boolean_button_click(driver, actions, "In your network")
         if fair_chance_employer: boolean_button_click(driver, actions, "Fair Chance Employer")
 
         wait_span_click(driver, salary)
-        buffer(recommended_wait)
+        settle(driver, recommended_wait)
         
         multi_sel_noWait(driver, benefits)
         multi_sel_noWait(driver, commitments)
-        if benefits or commitments: buffer(recommended_wait)
+        if benefits or commitments: settle(driver, recommended_wait)
 
         show_results_button: WebElement = driver.find_element(By.XPATH, '//button[contains(@aria-label, "Apply current filters to show")]')
         show_results_button.click()
@@ -280,9 +319,35 @@ def get_page_info() -> tuple[WebElement | None, int | None]:
 
 
 
-def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+def open_job_card(card: dict) -> bool:
+    '''
+    Function to click a job `card` scraped by `scrape_job_cards` to open its details
+    * The results list re-renders cards as it scrolls, so the card is found again by its Job ID if its link went stale
+    * Returns `False` if the card couldn't be clicked
+    '''
+    try: 
+        scroll_to_view(driver, card['anchor'], True)
+        card['anchor'].click()
+    except Exception as e:
+        print_lg(f'Failed to click "{card["title"]} | {card["company"]}" job on details button. Job ID: {card["id"]}! Trying again...') 
+        # print_lg(e)
+        discard_job()
+        try:
+            job_card = driver.find_element(By.CSS_SELECTOR, f'li[data-occludable-job-id="{card["id"]}"]')
+            scroll_to_view(driver, job_card, True)
+            card['anchor'] = WebDriverWait(job_card, 5).until(lambda job_card: job_card.find_element(By.TAG_NAME, "a"))
+            card['anchor'].click()
+        except Exception as e:
+            print_lg(f'Failed to open "{card["title"]} | {card["company"]}" job. Job ID: {card["id"]}!', e)
+            return False
+    pace()
+    return True
+
+
+def get_job_main_details(card: dict, blacklisted_companies: set, rejected_jobs: set, click: bool = True) -> tuple[str, str, str, str, str, bool]:
     '''
     # Function to get job main details.
+    Takes in a job `card` scraped by `scrape_job_cards` and clicks it open (if `click = True`) unless it should be skipped.
     Returns a tuple of (job_id, title, company, work_location, work_style, skip)
     * job_id: Job ID
     * title: Job title
@@ -291,66 +356,57 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
     * work_style: Work style of this job (Remote, On-site, Hybrid)
     * skip: A boolean flag to skip this job
     '''
-    job_details_button = job.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
-    scroll_to_view(driver, job_details_button, True)
-    job_id = job.get_dom_attribute('data-occludable-job-id')
-    title = job_details_button.text
-    title = title[:title.find("\n")]
-    # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-    # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-    index = other_details.find(' · ')
-    company = other_details[:index]
-    work_location = other_details[index+3:]
-    work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
-    work_location = work_location[:work_location.rfind('(')].strip()
+    job_id = card['id']
+    title = card['title']
+    company = card['company']
+    work_location = card['work_location']
+    work_style = card['work_style']
+    job_details_button = card['anchor']
     
     # Skip if previously rejected due to blacklist or already applied
     skip = False
-    if company in blacklisted_companies:
+    if job_details_button is None:
+        print_lg(f'Skipping job that never loaded in the results list. Job ID: {job_id}!')
+        skip = True
+    elif company in blacklisted_companies:
         print_lg(f'Skipping "{title} | {company}" job (Blacklisted Company). Job ID: {job_id}!')
         skip = True
     elif job_id in rejected_jobs: 
         print_lg(f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!')
         skip = True
-    try:
-        if job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied":
-            skip = True
-            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-    except: pass
-    try: 
-        if not skip: job_details_button.click()
-    except Exception as e:
-        print_lg(f'Failed to click "{title} | {company}" job on details button. Job ID: {job_id}!') 
-        # print_lg(e)
-        discard_job()
-        job_details_button.click() # To pass the error outside
-    buffer(click_gap)
+    elif card['applied']:
+        skip = True
+        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
+    if not skip and click:
+        skip = not open_job_card(card)
     return (job_id,title,company,work_location,work_style,skip)
 
 
-# Function to check for Blacklisted words in About Company
-def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set) -> tuple[set, set, WebElement] | ValueError:
-    jobs_top_card = try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
-    about_company_org = find_by_class(driver, "jobs-company__box")
-    scroll_to_view(driver, about_company_org)
-    about_company_org = about_company_org.text
+# Function to find Blacklisted words in About Company
+def find_blacklisted_word(about_company_org: str, verbose: bool = True) -> str | None:
     about_company = about_company_org.lower()
-    skip_checking = False
     for word in about_company_good_words:
         if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
-    buffer(click_gap)
-    scroll_to_view(driver, jobs_top_card)
-    return rejected_jobs, blacklisted_companies, jobs_top_card
+            if verbose: print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
+            return None
+    for word in about_company_bad_words: 
+        if word.lower() in about_company: 
+            return word
+    return None
+
+
+# Function to check for Blacklisted words in About Company
+def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set, about_company_org: str | None) -> tuple[set, set] | ValueError:
+    if about_company_org is None:
+        raise LookupError("About Company section not found")
+    word = find_blacklisted_word(about_company_org)
+    if word:
+        rejected_jobs.add(job_id)
+        blacklisted_companies.add(company)
+        remember_rejected_job(job_id, company, "Found Blacklisted words in About Company", f'Contains "{word}"')
+        remember_blacklisted_company(company, "Found Blacklisted words in About Company", f'Contains "{word}"')
+        raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
+    return rejected_jobs, blacklisted_companies
 
 
 
@@ -365,7 +421,7 @@ def extract_years_of_experience(text: str) -> int:
 
 
 
-def get_job_description(
+def get_job_description(details: dict
 ) -> tuple[
     str | Literal['Unknown'],
     int | Literal['Unknown'],
@@ -375,7 +431,7 @@ def get_job_description(
     ]:
     '''
     # Job Description
-    Function to extract job description from About the Job.
+    Function to screen the job description (About the Job) read by `extract_job_details`.
     ### Returns:
     - `jobDescription: str | 'Unknown'`
     - `experience_required: int | 'Unknown'`
@@ -389,11 +445,12 @@ def get_job_description(
         ##<
         experience_required = "Unknown"
         found_masters = 0
-        jobDescription = find_by_class(driver, "jobs-box__html-content").text
-        jobDescriptionLow = jobDescription.lower()
         skip = False
         skipReason = None
         skipMessage = None
+        if not details['description']: raise LookupError("About the Job section not found")
+        jobDescription = details['description']
+        jobDescriptionLow = jobDescription.lower()
         for word in bad_words:
             if word.lower() in jobDescriptionLow:
                 skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
@@ -424,6 +481,74 @@ def get_job_description(
         
 
 
+# Function to extract skills required from About Job using AI
+# Runs in `pipeline_pool`, so it doesn't stream (chunks would interleave with the main thread's logs)
+# and logs errors instead of opening an alert from a background thread.
+def extract_skills(description: str) -> str:
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    try:
+        if ai_provider.lower() == "openai":
+            skills = ai_extract_skills(aiClient, description, stream=False, alert=False)
+        elif ai_provider.lower() == "deepseek":
+            skills = deepseek_extract_skills(aiClient, description, stream=False)
+        elif ai_provider.lower() == "gemini":
+            skills = gemini_extract_skills(aiClient, description)
+        else:
+            skills = "In Development"
+        print_lg(f"Extracted skills using {ai_provider} AI")
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        skills = "Error extracting skills"
+    ##<
+    return skills
+
+
+def screen_job(details: dict) -> dict:
+    '''
+    Function to screen a job's `details` without touching the browser, so it can also run ahead in `pipeline_pool`.
+    * Returns the results of `get_job_description` as a dict with `description`, `experience_required`, `skip`, `reason` and `message`
+    * If the job passed and AI is on, also starts extracting its skills in `pipeline_pool`, returned as the `skills` future (else `None`)
+    '''
+    description, experience_required, skip, reason, message = get_job_description(details)
+    skills = None
+    if use_AI and not skip and description != "Unknown" and not (details['about_company'] and find_blacklisted_word(details['about_company'], verbose=False)):
+        skills = pipeline_pool.submit(extract_skills, description)
+    return {'description': description, 'experience_required': experience_required, 'skip': skip, 'reason': reason, 'message': message, 'skills': skills}
+
+
+def prescreen_job(fetch: Future) -> tuple[dict | None, dict | None]:
+    '''
+    Function run in `pipeline_pool` to screen a job before the browser gets to it.
+    * Waits for its details being downloaded by `detail_fetcher` and screens them with `screen_job`
+    * Returns `(details, screening)`, both `None` if the details couldn't be downloaded
+    '''
+    details = fetch.result()
+    if details is None: return None, None
+    return details, screen_job(details)
+
+
+def save_skills_when_done(job_id: str, skills: Future) -> None:
+    '''
+    Function to write a saved job's `Skills required` to the history once its AI extraction finishes, without waiting for it
+    '''
+    def save(done: Future) -> None:
+        pending_skills.discard(done)
+        if done.cancelled(): return
+        try:
+            history_store.update_skills(job_id, done.result())
+        except Exception as e:
+            print_lg(f"Failed to save extracted skills of Job ID: {job_id}!", e)
+    pending_skills.add(skills)
+    skills.add_done_callback(save)
+
+
+def cancel_skills(screening: dict | None) -> None:
+    '''
+    Function to cancel the AI skill extraction of a skipped job if it hasn't started yet
+    '''
+    if screening and screening['skills']: screening['skills'].cancel()
+
+
 # Function to upload resume
 def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
     try:
@@ -431,295 +556,254 @@ def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
         return True, os.path.basename(default_resume_path)
     except: return False, "Previous resume"
 
-# Function to answer common questions for Easy Apply
-def answer_common_questions(label: str, answer: str) -> str:
-    if 'sponsorship' in label or 'visa' in label: answer = require_visa
-    return answer
+# AI answers used in the application being filled, promoted in the AI cache once it's submitted
+ai_answer_keys: set[str] = set()
+# Question types as the AI answering functions name them
+AI_QUESTION_TYPES = {"select": "single_select", "radio": "single_select", "text": "text", "textarea": "textarea"}
+
+# Function to answer a question with AI for Easy Apply
+def ask_ai(label_org: str, question_type: Literal['text', 'textarea'], job_description: str | None) -> str:
+    if not (use_AI and aiClient):
+        abort_on_unrecognized(label_org)
+        return ""
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    answer = ""
+    try:
+        if ai_provider.lower() == "openai":
+            answer = ai_answer_question(aiClient, label_org, question_type=question_type, job_description=job_description, user_information_all=user_information_all)
+        elif ai_provider.lower() == "deepseek":
+            answer = deepseek_answer_question(aiClient, label_org, options=None, question_type=question_type, job_description=job_description, about_company=None, user_information_all=user_information_all)
+        elif ai_provider.lower() == "gemini":
+            answer = gemini_answer_question(aiClient, label_org, options=None, question_type=question_type, job_description=job_description, about_company=None, user_information_all=user_information_all)
+        else:
+            abort_on_unrecognized(label_org)
+        if answer and isinstance(answer, str) and len(answer) > 0:
+            print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
+            if answer_cache_ttl(): ai_answer_keys.add(answer_cache_key(ai_provider.lower(), llm_model, label_org, question_type, None, job_description, user_information_all))
+        else:
+            abort_on_unrecognized(label_org)
+    except Exception as e:
+        print_lg("Failed to get AI answer!", e)
+        abort_on_unrecognized(label_org)
+    ##<
+    return answer if isinstance(answer, str) else ""
+
+
+def promote_ai_answers() -> None:
+    '''
+    Function to keep the AI answers used in a submitted application in the AI cache for good
+    '''
+    cache = get_ai_cache()
+    try:
+        if cache:
+            for key in ai_answer_keys: cache.promote(key)
+    except Exception as e:
+        print_lg("Failed to promote AI answers in the AI cache!", e)
+    ai_answer_keys.clear()
+
+
+# Function to answer a question from the rules in `modules.answer_bank`, or else from the answers learnt in previous applications
+def answer_from_rules(question_type: str, label: str, bank_label: str, work_location: str, prev_answer: str | None = None) -> tuple[str | None, bool]:
+    '''
+    * `bank_label` is the question as it's saved in `questions_list`
+    * Returns `(answer, do_actions)`, `answer` is `None` if neither a rule nor the bank has one
+    '''
+    values = answer_values | {'city': current_city if current_city else work_location, 'work_location': work_location, 'previous_answer': prev_answer}
+    answer, rule = answer_matcher.answer(question_type, label, values)
+    if rule: return answer, rule.do_actions
+    answer = answer_bank.get(question_type, bank_label)
+    if answer is not None: print_lg(f'Answered "{bank_label}" from previous applications: "{answer}"')
+    return answer, False
+
+
+def learn_answers(questions_list: set | None) -> None:
+    '''
+    Function to save the answers of a submitted application to questions no rule covers, to answer them the same next time
+    '''
+    if not questions_list: return
+    try:
+        learned = answer_bank.learn_from(questions_list, answer_matcher)
+        if learned: print_lg(f"Learnt answers to {learned} new questions")
+    except Exception as e:
+        print_lg("Failed to save answers to the answer bank!", e)
+
+
+# Function to read the questions of the current Easy Apply page
+def read_questions(modal: WebElement) -> list[dict]:
+    '''
+    Function to read every question on the current Easy Apply page before answering any, with one `snapshot_form` call.
+    * Returns dicts with `type` (`"select"`, `"radio"`, `"text"`, `"textarea"`, `"checkbox"` or `"unknown"`), `label_org`, `label` (lower case),
+      `options` (option texts of selects and radios), `prev_answer`, `field` (the element to fill) and `record_label`, the question as it's saved in `questions_list`
+    '''
+    questions = []
+    for field in snapshot_form(driver, modal):
+        question_type, options = field['kind'], field['options']
+        label_org = field['label'] or "Unknown"
+        optionsText = [option['text'] or "Unknown" for option in options]
+        prev_answer = field['value']
+        if question_type == "select":
+            options_record = '"List of phone country codes"'
+            if label_org.lower() != "phone country code":
+                options_record = "".join([f' "{option}",' for option in optionsText])
+            record_label = f'{label_org} [ {options_record} ]'
+        elif question_type == "radio":
+            record_label = label_org + ' [ '
+            for text, option in zip(optionsText, options):
+                option_record = f'"{text}"<{option["value"]}>' # Saving option as "label <value>"
+                if option['selected']: prev_answer = option_record
+                record_label += f' {option_record},'
+            record_label += " ]"
+        elif question_type in ("text", "textarea"):
+            record_label = label_org.lower()
+        elif question_type == "checkbox":
+            # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
+            record_label = f'{label_org.lower()} ([X] {optionsText[0]})'
+        else:
+            label_org = field['label'] or "Unknown question"
+            record_label = label_org
+        questions.append({'type': question_type, 'label_org': label_org, 'label': label_org.lower(), 'options': optionsText, 'prev_answer': prev_answer,
+                          'field': field['element'], 'record_label': record_label})
+    return questions
+
+
+# Function to answer all unresolved questions of an Easy Apply page with one AI request
+def ask_ai_batch(questions: list[dict], job_description: str | None) -> list[str | None]:
+    '''
+    * Selects and radios are asked to pick one of their `options`
+    * Returns the answers in the order of `questions`, `None` for any the AI didn't answer
+    '''
+    batch = [{'id': f"q{index}", 'question': question['label_org'], 'type': AI_QUESTION_TYPES[question['type']], 'options': question['options'] or None}
+             for index, question in enumerate(questions)]
+    print_lg(f"Asking AI {len(batch)} questions in one request...")
+    try:
+        if ai_provider.lower() == "openai":
+            answers = ai_answer_questions(aiClient, batch, job_description=job_description, user_information_all=user_information_all)
+        elif ai_provider.lower() == "deepseek":
+            answers = deepseek_answer_questions(aiClient, batch, job_description=job_description, user_information_all=user_information_all)
+        elif ai_provider.lower() == "gemini":
+            answers = gemini_answer_questions(aiClient, batch, job_description=job_description, user_information_all=user_information_all)
+        else:
+            answers = {}
+    except Exception as e:
+        print_lg("Failed to get AI answers!", e)
+        answers = {}
+    results = []
+    for question in batch:
+        answer = (answers or {}).get(question['id'])
+        if answer and isinstance(answer, str):
+            print_lg(f'AI Answered received for question "{question["question"]}" \nhere is answer: "{answer}"')
+            if answer_cache_ttl(): ai_answer_keys.add(answer_cache_key(ai_provider.lower(), llm_model, question['question'], question['type'], question['options'], job_description, user_information_all))
+            results.append(answer)
+        else:
+            results.append(None)
+    return results
 
 
 # Function to answer the questions for Easy Apply
 def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: str | None = None ) -> set:
     # Get all questions from the page
-     
-    all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
-    # all_questions = modal.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-element")
-    # all_list_questions = modal.find_elements(By.XPATH, ".//div[@data-test-text-entity-list-form-component]")
-    # all_single_line_questions = modal.find_elements(By.XPATH, ".//div[@data-test-single-line-text-form-component]")
-    # all_questions = all_questions + all_list_questions + all_single_line_questions
-
-    for Question in all_questions:
-        handled_question = False
-        # Check if it's a select Question
-        select = try_xp(Question, ".//select", False)
-        if select:
-            handled_question = True
-            label_org = "Unknown"
-            try:
-                label = Question.find_element(By.TAG_NAME, "label")
-                label_org = label.find_element(By.TAG_NAME, "span").text
-            except: pass
-            answer = 'Yes'
-            label = label_org.lower()
-            select = Select(select)
-            selected_option = select.first_selected_option.text
-            optionsText = []
-            options = '"List of phone country codes"'
-            if label != "phone country code":
-                optionsText = [option.text for option in select.options]
-                options = "".join([f' "{option}",' for option in optionsText])
-            prev_answer = selected_option
-            if overwrite_previous_answers or selected_option == "Select an option":
-                ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
-                if 'email' in label or 'phone' in label: 
-                    answer = prev_answer
-                elif 'gender' in label or 'sex' in label: 
-                    answer = gender
-                elif 'disability' in label: 
-                    answer = disability_status
-                elif 'proficiency' in label: 
-                    answer = 'Professional'
-                # Add location handling
-                elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
-                    if 'country' in label:
-                        answer = country 
-                    elif 'state' in label:
-                        answer = state
-                    elif 'city' in label:
-                        answer = current_city if current_city else work_location
-                    else:
-                        answer = work_location
-                else: 
-                    answer = answer_common_questions(label,answer)
-                try: 
-                    select.select_by_visible_text(answer)
-                except NoSuchElementException as e:
-                    # Define similar phrases for common answers
-                    possible_answer_phrases = []
-                    if answer == 'Decline':
-                        possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
-                    elif 'yes' in answer.lower():
-                        possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
-                    elif 'no' in answer.lower():
-                        possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
-                    else:
-                        # Try partial matching for any answer
-                        possible_answer_phrases = [answer]
-                        # Add lowercase and uppercase variants
-                        possible_answer_phrases.append(answer.lower())
-                        possible_answer_phrases.append(answer.upper())
-                        # Try without special characters
-                        possible_answer_phrases.append(''.join(c for c in answer if c.isalnum()))
-                    ##<
-                    foundOption = False
-                    for phrase in possible_answer_phrases:
-                        for option in optionsText:
-                            # Check if phrase is in option or option is in phrase (bidirectional matching)
-                            if phrase.lower() in option.lower() or option.lower() in phrase.lower():
-                                select.select_by_visible_text(option)
-                                answer = option
-                                foundOption = True
-                                break
-                    if not foundOption:
-                        print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}"')
-                        abort_on_unrecognized(f'{label_org} [ {options} ]')
-            questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
+    questions = read_questions(modal)
+
+    # Answer from the rules and answers of previous applications first
+    unresolved = []
+    for question in questions:
+        question['answer'], question['do_actions'] = question['prev_answer'], False
+        if question['type'] == "select":
+            question['fill'] = overwrite_previous_answers or question['prev_answer'] == "Select an option"
+        elif question['type'] == "radio":
+            question['fill'] = overwrite_previous_answers or question['prev_answer'] is None
+        elif question['type'] in ("text", "textarea"):
+            question['fill'] = not question['prev_answer'] or overwrite_previous_answers
+        elif question['type'] == "checkbox":
+            question['fill'] = not question['prev_answer']
             continue
-        
-        # Check if it's a radio Question
-        radio = try_xp(Question, './/fieldset[@data-test-form-builder-radio-button-form-component="true"]', False)
-        if radio:
-            handled_question = True
-            prev_answer = None
-            label = try_xp(radio, './/span[@data-test-form-builder-radio-button-form-component__title]', False)
-            try: label = find_by_class(label, "visually-hidden", 2.0)
-            except: pass
-            label_org = label.text if label else "Unknown"
-            answer = 'Yes'
-            label = label_org.lower()
-
-            label_org += ' [ '
-            options = radio.find_elements(By.TAG_NAME, 'input')
-            options_labels = []
-            
-            for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
-                options_labels.append( f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>' ) # Saving option as "label <value>"
-                if option.is_selected(): prev_answer = options_labels[-1]
-                label_org += f' {options_labels[-1]},'
-
-            if overwrite_previous_answers or prev_answer is None:
-                if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
-                elif 'veteran' in label or 'protected' in label: answer = veteran_status
-                elif 'disability' in label or 'handicapped' in label: 
-                    answer = disability_status
-                else: answer = answer_common_questions(label,answer)
-                foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
-                if foundOption:
-                    actions.move_to_element(foundOption).click().perform()
-                else:
-                    possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
-                    abort_on_unrecognized(f'{label_org} ]')
-            else: answer = prev_answer
-            questions_list.add((label_org+" ]", answer, "radio", prev_answer))
-            continue
-        
-        # Check if it's a text question
-        text = try_xp(Question, ".//input[@type='text']", False)
-        if text:
-            handled_question = True
-            do_actions = False
-            label = try_xp(Question, ".//label[@for]", False)
-            try: label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
-            answer = "" # years_of_experience
-            label = label_org.lower()
-
-            prev_answer = text.get_attribute("value")
-            if not prev_answer or overwrite_previous_answers:
-                if 'experience' in label or 'years' in label: answer = years_of_experience
-                elif 'phone' in label or 'mobile' in label: answer = phone_number
-                elif 'street' in label: answer = street
-                elif 'city' in label or 'location' in label or 'address' in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif 'name' in label:
-                    if 'full' in label: answer = full_name
-                    elif 'first' in label and 'last' not in label: answer = first_name
-                    elif 'middle' in label and 'last' not in label: answer = middle_name
-                    elif 'last' in label and 'first' not in label: answer = last_name
-                    elif 'employer' in label: answer = recent_employer
-                    else: answer = full_name
-                elif 'notice' in label:
-                    if 'month' in label:
-                        answer = notice_period_months
-                    elif 'week' in label:
-                        answer = notice_period_weeks
-                    else: answer = notice_period
-                elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'pay' in label: 
-                    if 'current' in label or 'present' in label:
-                        if 'month' in label:
-                            answer = current_ctc_monthly
-                        elif 'lakh' in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if 'month' in label:
-                            answer = desired_salary_monthly
-                        elif 'lakh' in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif 'linkedin' in label: answer = linkedIn
-                elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
-                elif 'scale of 1-10' in label: answer = confidence_level
-                elif 'headline' in label: answer = linkedin_headline
-                elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
-                elif 'state' in label or 'province' in label: answer = state
-                elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
-                elif 'country' in label: answer = country
-                else: answer = answer_common_questions(label,answer)
-                ##> ------ Yang Li : MARKYangL - Feature ------
-                if answer == "":
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="text", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                abort_on_unrecognized(label_org)
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                abort_on_unrecognized(label_org)
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            abort_on_unrecognized(label_org)
-                    else:
-                        abort_on_unrecognized(label_org)
-                ##<
-                text.clear()
-                text.send_keys(answer)
-                if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
-            continue
-
-        # Check if it's a textarea question
-        text_area = try_xp(Question, ".//textarea", False)
-        if text_area:
-            handled_question = True
-            label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = ""
-            prev_answer = text_area.get_attribute("value")
-            if not prev_answer or overwrite_previous_answers:
-                if 'summary' in label: answer = linkedin_summary
-                elif 'cover' in label: answer = cover_letter
-                if answer == "":
-                ##> ------ Yang Li : MARKYangL - Feature ------
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                abort_on_unrecognized(label_org)
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                abort_on_unrecognized(label_org)
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            abort_on_unrecognized(label_org)
-                    else:
-                        abort_on_unrecognized(label_org)
-            text_area.clear()
-            text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
+        else:
+            question['fill'] = False
+        if not question['fill']: continue
+        question['answer'], question['do_actions'] = answer_from_rules(question['type'], question['label'], question['record_label'], work_location, question['prev_answer'])
+        if question['answer'] is None or (question['type'] in ("text", "textarea") and question['answer'] == ""):
+            unresolved.append(question)
+
+    # Then ask AI the rest, all in one request if batching
+    if unresolved and batch_ai_questions and use_AI and aiClient:
+        for question, answer in zip(unresolved, ask_ai_batch(unresolved, job_description)):
+            if answer is not None: question['answer'] = answer
+    for question in unresolved:
+        if question['answer']: continue
+        if question['type'] in ("select", "radio"): question['answer'] = 'Yes'
+        else: question['answer'] = ask_ai(question['label_org'], question['type'], job_description)
+
+    # Fill every field in one batched write, except autocompletes which need real key presses
+    writes, typed = [], []
+    for question in questions:
+        label_org, answer = question['label_org'], question['answer']
+        if not question['fill']: continue
+        if question['type'] == "select":
+            optionsText = question['options']
+            if answer in optionsText:
+                writes.append({'element': question['field'], 'kind': "select", 'value': optionsText.index(answer), 'question': question})
+                continue
+            ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
+            # Define similar phrases for common answers
+            possible_answer_phrases = []
+            if answer == 'Decline':
+                possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
+            elif 'yes' in answer.lower():
+                possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
+            elif 'no' in answer.lower():
+                possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
+            else:
+                # Try partial matching for any answer
+                possible_answer_phrases = [answer]
+                # Add lowercase and uppercase variants
+                possible_answer_phrases.append(answer.lower())
+                possible_answer_phrases.append(answer.upper())
+                # Try without special characters
+                possible_answer_phrases.append(''.join(c for c in answer if c.isalnum()))
             ##<
-            continue
-
-        # Check if it's a checkbox question
-        checkbox = try_xp(Question, ".//input[@type='checkbox']", False)
-        if checkbox:
-            handled_question = True
-            label = try_xp(Question, ".//span[@class='visually-hidden']", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = try_xp(Question, ".//label[@for]", False)  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
-            answer = answer.text if answer else "Unknown"
-            prev_answer = checkbox.is_selected()
-            checked = prev_answer
-            if not prev_answer:
-                try:
-                    actions.move_to_element(checkbox).click().perform()
-                    checked = True
-                except Exception as e:
-                    print_lg("Checkbox click failed!", e)
-                    pass
-            questions_list.add((f'{label} ([X] {answer})', checked, "checkbox", prev_answer))
-            continue
-
-        if not handled_question:
-            summary = Question.text.strip() if Question.text else "Unknown question"
-            abort_on_unrecognized(summary)
+            # Check if phrase is in option or option is in phrase (bidirectional matching)
+            foundOption = next((index for phrase in possible_answer_phrases for index, option in enumerate(optionsText)
+                                if phrase.lower() in option.lower() or option.lower() in phrase.lower()), None)
+            if foundOption is not None:
+                question['answer'] = optionsText[foundOption]
+                writes.append({'element': question['field'], 'kind': "select", 'value': foundOption, 'question': question})
+            else:
+                print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}"')
+                abort_on_unrecognized(question['record_label'])
+
+        elif question['type'] == "radio":
+            foundOption = next((index for index, option in enumerate(question['options']) if " ".join(option.split()) == answer), None)
+            if foundOption is not None:
+                writes.append({'element': question['field'], 'kind': "radio", 'value': foundOption, 'question': question})
+            else:
+                abort_on_unrecognized(question['record_label'])
+
+        elif question['type'] in ("text", "textarea"):
+            if question['do_actions']: typed.append(question)
+            else: writes.append({'element': question['field'], 'kind': question['type'], 'value': answer, 'question': question})
+
+        elif question['type'] == "checkbox":
+            writes.append({'element': question['field'], 'kind': "checkbox", 'value': True, 'question': question})
+
+    for write, value in zip(writes, write_form(driver, [{key: write[key] for key in ('element', 'kind', 'value')} for write in writes])):
+        if value is not None and write['kind'] in ("text", "textarea", "checkbox"): write['question']['answer'] = value
+    for question in typed:
+        text = question['field']
+        text.clear()
+        text.send_keys(question['answer'])
+        wait_for_suggestions(driver)
+        actions.send_keys(Keys.ARROW_DOWN)
+        actions.send_keys(Keys.ENTER).perform()
+        question['answer'] = text.get_attribute("value")
+
+    for question in questions:
+        answer, prev_answer = question['answer'], question['prev_answer']
+        if question['type'] == "select":
+            questions_list.add((question['record_label'], answer if question['fill'] else 'Yes', "select", prev_answer))
+        elif question['type'] in ("radio", "text", "textarea", "checkbox"):
+            questions_list.add((question['record_label'], answer, question['type'], prev_answer))
+        else:
+            abort_on_unrecognized(question['label_org'])
 
 
     # Select todays date
@@ -802,7 +886,7 @@ def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
     - Returns screenshot name as String
     '''
     screenshot_name = "{} - {} - {}.png".format( job_id, failedAt, str(datetime.now()) )
-    path = logs_folder_path+"/screenshots/"+screenshot_name.replace(":",".")
+    path = get_screenshot_directory()+"/"+screenshot_name.replace(":",".")
     # special_chars = {'*', '"', '\\', '<', '>', ':', '|', '?'}
     # for char in special_chars:  path = path.replace(char, '-')
     driver.save_screenshot(path.replace("//","/"))
@@ -816,22 +900,17 @@ def submitted_jobs(job_id: str, title: str, company: str, work_location: str, wo
                    reposted: bool, date_listed: datetime | Literal['Unknown'], date_applied:  datetime | Literal['Pending'], job_link: str, application_link: str, 
                    questions_list: set | None, connect_request: Literal['In Development']) -> None:
     '''
-    Function to create or update the Applied jobs CSV file, once the application is submitted successfully
+    Function to save a successfully submitted application to the applied jobs history database
     '''
     try:
-        with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
-                            'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills), 
-                                'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted), 
-                                'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link), 
-                                'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(questions_list), 'Connect Request':truncate_for_csv(connect_request)})
-        csv_file.close()
+        history_store.add_application({'Job ID':job_id, 'Title':title, 'Company':company, 'Work Location':work_location, 'Work Style':work_style, 
+                            'About Job':description, 'Experience required': experience_required, 'Skills required':skills, 
+                                'HR Name':hr_name, 'HR Link':hr_link, 'Resume':resume, 'Re-posted':reposted, 
+                                'Date Posted':date_listed, 'Date Applied':date_applied, 'Job Link':job_link, 
+                                'External Job link':application_link, 'Questions Found':questions_list, 'Connect Request':connect_request})
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
-        pyautogui.alert("Failed to update the excel of applied jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        pyautogui.alert("Failed to update the applied jobs history!\nProbably because of 1 of the following reasons:\n1. The database is locked by another program for too long\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
 
 
 
@@ -845,16 +924,29 @@ def discard_job() -> None:
 
 
 
+def report_run_progress(search_index: int, total_terms: int, current_count: int, **fields) -> None:
+    '''
+    Function to report run counters to the JobWorker that launched this bot (no-op otherwise)
+    * `percent` is how far through the current cycle's search terms we are
+    '''
+    term_fraction = min(current_count, switch_number) / switch_number if switch_number else 1
+    percent = round(100 * (search_index + term_fraction) / total_terms, 1) if total_terms else 100
+    report_progress(
+        percent=percent, scanned=scanned_count, easy_applied=easy_applied_count, external=external_jobs_count,
+        applied=easy_applied_count + external_jobs_count, skipped=skip_count, failed=failed_count, **fields
+    )
+
+
 # Function to apply to jobs
 def apply_to_jobs(search_terms: list[str]) -> None:
-    applied_jobs = get_applied_job_ids()
     rejected_jobs = set()
-    blacklisted_companies = set()
-    global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
+    blacklisted_companies = set(history_store.blacklisted_companies())
+    known_jobs.refresh()
+    global current_city, failed_count, skip_count, scanned_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
     current_city = current_city.strip()
 
     if randomize_search_order:  shuffle(search_terms)
-    for searchTerm in search_terms:
+    for search_index, searchTerm in enumerate(search_terms):
         driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
         print_lg("\n________________________________________________________________________________________________________________________\n")
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
@@ -862,33 +954,68 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         apply_filters()
 
         current_count = 0
+        report_run_progress(search_index, len(search_terms), current_count, search_term=searchTerm, page=None)
         try:
             while current_count < switch_number:
                 # Wait until job listings are loaded
                 wait.until(EC.presence_of_all_elements_located((By.XPATH, "//li[@data-occludable-job-id]")))
 
                 pagination_element, current_page = get_page_info()
-
-                # Find all job listings in current page
-                buffer(3)
-                job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
+                report_run_progress(search_index, len(search_terms), current_count, page=current_page)
+
+                # Read all job listings in current page in one go
+                settle(driver, 3)
+                job_listings = scrape_job_cards(driver)
+                prefetched_details = {}
+                if detail_fetcher:
+                    prefetched_details = detail_fetcher.submit(
+                        job['id'] for job in job_listings
+                        if job['anchor'] is not None and not job['applied'] and job['company'] not in blacklisted_companies
+                        and job['id'] not in rejected_jobs and job['id'] not in known_jobs
+                    )
+                upcoming = list(prefetched_details)
+                prescreened: dict[str, Future] = {}
 
             
                 for job in job_listings:
                     if keep_screen_awake: pyautogui.press('shiftright')
                     if current_count >= switch_number: break
                     print_lg("\n-@-\n")
+                    scanned_count += 1
+                    report_run_progress(search_index, len(search_terms), current_count)
+
+                    # Skip known jobs from the scraped card, before scrolling to or clicking it
+                    if job['id'] in rejected_jobs or job['id'] in known_jobs:
+                        print_lg(f'Skipping already applied or rejected "{job["title"]} | {job["company"]}" job. Job ID: {job["id"]}!')
+                        continue
 
-                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
+                    # Details downloaded over HTTP let rejected jobs be skipped without opening them.
+                    # This job and the next `prescreen_jobs_ahead` are screened in the background, so
+                    # the next job's AI skill extraction overlaps with applying to this one.
+                    details, screening = None, None
+                    if job['id'] in prefetched_details:
+                        position = upcoming.index(job['id'])
+                        for job_id_ahead in upcoming[position:position + 1 + prescreen_jobs_ahead]:
+                            if job_id_ahead not in prescreened:
+                                prescreened[job_id_ahead] = pipeline_pool.submit(prescreen_job, prefetched_details[job_id_ahead])
+                        details, screening = prescreened.pop(job['id']).result()
+                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs, click=details is None)
                     
-                    if skip: continue
+                    if skip:
+                        cancel_skills(screening)
+                        continue
+                    job_opened = details is None
                     # Redundant fail safe check for applied jobs!
                     try:
-                        if job_id in applied_jobs or find_by_class(driver, "jobs-s-apply__application-link", 2):
-                            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-                            continue
+                        if details is None: details = extract_job_details(driver, job_id)
                     except Exception as e:
-                        print_lg(f'Trying to Apply to "{title} | {company}" job. Job ID: {job_id}')
+                        print_lg(f'Failed to read details of "{title} | {company}" job. Job ID: {job_id}!', e)
+                        details = {'description': None, 'about_company': None, 'posted_text': None, 'hirer_name': None, 'hirer_link': None, 'applied': False}
+                    if history_store.has_applied(job_id) or details['applied']:
+                        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
+                        cancel_skills(screening)
+                        continue
+                    print_lg(f'Trying to Apply to "{title} | {company}" job. Job ID: {job_id}')
 
                     job_link = "https://www.linkedin.com/jobs/view/"+job_id
                     application_link = "Easy Applied"
@@ -901,26 +1028,27 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     resume = "Pending"
                     reposted = False
                     questions_list = None
+                    ai_answer_keys.clear()
                     screenshot_name = "Not Available"
 
                     try:
-                        rejected_jobs, blacklisted_companies, jobs_top_card = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies)
+                        rejected_jobs, blacklisted_companies = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies,details['about_company'])
                     except ValueError as e:
                         print_lg(e, 'Skipping this job!\n')
+                        cancel_skills(screening)
                         failed_job(job_id, job_link, resume, date_listed, "Found Blacklisted words in About Company", e, "Skipped", screenshot_name)
                         skip_count += 1
                         continue
                     except Exception as e:
-                        print_lg("Failed to scroll to About Company!")
+                        print_lg("Failed to find About Company!")
                         # print_lg(e)
 
 
 
                     # Hiring Manager info
-                    try:
-                        hr_info_card = WebDriverWait(driver,2).until(EC.presence_of_element_located((By.CLASS_NAME, "hirer-card__hirer-information")))
-                        hr_link = hr_info_card.find_element(By.TAG_NAME, "a").get_attribute("href")
-                        hr_name = hr_info_card.find_element(By.TAG_NAME, "span").text
+                    if details['hirer_link'] and details['hirer_name'] is not None:
+                        hr_link = details['hirer_link']
+                        hr_name = details['hirer_name']
                         # if connect_hr:
                         #     driver.switch_to.new_window('tab')
                         #     driver.get(hr_link)
@@ -937,16 +1065,16 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         #     message_box = driver.find_element(By.XPATH, "//div[@aria-label='Write a message…']")
                         #     message_box.send_keys()
                         #     try_xp(driver, "//button[normalize-space()='Send']")        
-                    except Exception as e:
+                    else:
                         print_lg(f'HR info was not given for "{title}" with Job ID: {job_id}!')
-                        # print_lg(e)
 
 
                     # Calculation of date posted
                     try:
                         # try: time_posted_text = find_by_class(driver, "jobs-unified-top-card__posted-date", 2).text
                         # except: 
-                        time_posted_text = jobs_top_card.find_element(By.XPATH, './/span[contains(normalize-space(), " ago")]').text
+                        time_posted_text = details['posted_text']
+                        if not time_posted_text: raise LookupError("Posted date not found")
                         print("Time Posted: " + time_posted_text)
                         if time_posted_text.__contains__("Reposted"):
                             reposted = True
@@ -956,31 +1084,26 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         print_lg("Failed to calculate the date posted!",e)
 
 
-                    description, experience_required, skip, reason, message = get_job_description()
+                    if screening is None: screening = screen_job(details)
+                    description, experience_required, skip, reason, message = (screening[key] for key in ('description', 'experience_required', 'skip', 'reason', 'message'))
                     if skip:
                         print_lg(message)
                         failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
                         rejected_jobs.add(job_id)
+                        remember_rejected_job(job_id, company, reason)
                         skip_count += 1
                         continue
 
-                    
-                    if use_AI and description != "Unknown":
-                        ##> ------ Yang Li : MARKYangL - Feature ------
-                        try:
-                            if ai_provider.lower() == "openai":
-                                skills = ai_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "deepseek":
-                                skills = deepseek_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "gemini":
-                                skills = gemini_extract_skills(aiClient, description)
-                            else:
-                                skills = "In Development"
-                            print_lg(f"Extracted skills using {ai_provider} AI")
-                        except Exception as e:
-                            print_lg("Failed to extract skills:", e)
-                            skills = "Error extracting skills"
-                        ##<
+                    if not job_opened and not open_job_card(job):
+                        cancel_skills(screening)
+                        continue
+                    # Never look for the apply button while the pane still shows another job
+                    if not wait_for_job_pane(driver, job_id):
+                        print_lg(f'Details of "{title} | {company}" job never opened. Skipping Job ID: {job_id}!')
+                        cancel_skills(screening)
+                        failed_job(job_id, job_link, resume, date_listed, "Job details didn't open", "Details pane never showed this job", "Skipped", screenshot_name)
+                        failed_count += 1
+                        continue
 
                     uploaded = False
                     # Case 1: Easy Apply Button
@@ -1014,7 +1137,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                     except NoSuchElementException:  next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
                                     try: next_button.click()
                                     except ElementClickInterceptedException: break    # Happens when it tries to click Next button in About Company photos section
-                                    buffer(click_gap)
+                                    settle(driver, root=modal)
 
                             except NoSuchElementException: errored = "nose"
                             finally:
@@ -1052,6 +1175,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             critical_error_log("Somewhere in Easy Apply process",e)
                             failed_job(job_id, job_link, resume, date_listed, "Problem in Easy Applying", e, application_link, screenshot_name)
                             failed_count += 1
+                            cancel_skills(screening)
                             discard_job()
                             continue
                     else:
@@ -1060,19 +1184,30 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         if dailyEasyApplyLimitReached:
                             print_lg("\n###############  Daily application limit for Easy Apply is reached!  ###############\n")
                             return
-                        if skip: continue
+                        if skip:
+                            cancel_skills(screening)
+                            continue
 
+                    # AI skill extraction runs in the background, its result is saved whenever it arrives
+                    if screening['skills']: skills = screening['skills'].result() if screening['skills'].done() else "Pending"
                     submitted_jobs(job_id, title, company, work_location, work_style, description, experience_required, skills, hr_name, hr_link, resume, reposted, date_listed, date_applied, job_link, application_link, questions_list, connect_request)
+                    if screening['skills'] and skills == "Pending": save_skills_when_done(job_id, screening['skills'])
                     if uploaded:   useNewResume = False
+                    promote_ai_answers()
+                    learn_answers(questions_list)
 
                     print_lg(f'Successfully saved "{title} | {company}" job. Job ID: {job_id} info')
+                    known_jobs.refresh()
                     current_count += 1
                     if application_link == "Easy Applied": easy_applied_count += 1
                     else:   external_jobs_count += 1
-                    applied_jobs.add(job_id)
 
 
 
+                # Jobs screened ahead but never reached on this page
+                for pending in prescreened.values():
+                    if not pending.cancel(): pending.add_done_callback(lambda done: cancel_skills(done.result()[1]))
+
                 # Switching to next page
                 if pagination_element == None:
                     print_lg("Couldn't find pagination element, probably at the end page of results!")
@@ -1106,6 +1241,7 @@ def run(total_runs: int) -> int:
     print_lg("\n########################################################################################################################\n")
     print_lg(f"Date and Time: {datetime.now()}")
     print_lg(f"Cycle number: {total_runs}")
+    report_progress(cycle=total_runs)
     print_lg(f"Currently looking for jobs posted within '{date_posted}' and sorting them by '{sort_by}'")
     apply_to_jobs(search_terms)
     print_lg("########################################################################################################################\n")
@@ -1124,10 +1260,11 @@ linkedIn_tab = False
 
 def main() -> None:
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, tabs_count, useNewResume, aiClient, detail_fetcher
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
+        history_store.purge_expired()
         
         if not os.path.exists(default_resume_path):
             pyautogui.alert(text='Your default resume "{}" is missing! Please update it\'s folder path "default_resume_path" in config.py\n\nOR\n\nAdd a resume with exact name and path (check for spelling mistakes including cases).\n\n\nFor now the bot will continue using your previous upload from LinkedIn!'.format(default_resume_path), title="Missing Resume", button="OK")
@@ -1140,6 +1277,12 @@ def main() -> None:
         
         linkedIn_tab = driver.current_window_handle
 
+        if fetch_job_details_over_http:
+            try:
+                detail_fetcher = JobDetailFetcher.from_driver(driver, max_workers=http_fetch_workers, min_interval=http_fetch_interval_ms/1000)
+            except Exception as e:
+                print_lg("Failed to start fetching job details over HTTP! Will read them in the browser instead.", e)
+
         # # Login to ChatGPT in a new tab for resume customization
         # if use_resume_generator:
         #     try:
@@ -1192,6 +1335,19 @@ def main() -> None:
         critical_error_log("In Applier Main", e)
         pyautogui.alert(e,alert_title)
     finally:
+        try:
+            known_jobs.save()
+        except Exception as e:
+            print_lg("Failed to save the known jobs index!", e)
+        if detail_fetcher: detail_fetcher.close()
+        if pending_skills:
+            print_lg(f"Waiting for AI to extract skills of {len(pending_skills)} saved jobs...")
+            wait_for_futures(list(pending_skills), timeout=60)
+        pipeline_pool.shutdown(wait=False, cancel_futures=True)
+        report_progress(
+            percent=100, scanned=scanned_count, easy_applied=easy_applied_count, external=external_jobs_count,
+            applied=easy_applied_count + external_jobs_count, skipped=skip_count, failed=failed_count, search_term=None, page=None
+        )
         print_lg("\n\nTotal runs:                     {}".format(total_runs))
         print_lg("Jobs Easy Applied:              {}".format(easy_applied_count))
         print_lg("External job links collected:   {}".format(external_jobs_count))
@@ -1199,6 +1355,9 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        if use_AI and get_ai_cache():
+            for kind, counts in get_ai_cache().stats().items():
+                print_lg(f"AI cache for {kind}:".ljust(32) + f"{counts['hits']} hits, {counts['misses']} misses")
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
         quote = choice([
             "You're one step closer than before.", 
@@ -1243,5 +1402,16 @@ def main() -> None:
             critical_error_log("When quitting...", e)
 
 
+def stop_on_sigterm(signum: int, frame) -> None:
+    '''
+    Function to stop when the JobWorker terminates this run, writing out buffered logs first
+    * `atexit` doesn't run on SIGTERM, so without this the last lines logged (usually why the run was stopped) would be lost
+    '''
+    print_lg("Received SIGTERM, stopping...")
+    flush_logs()
+    sys.exit(128 + signum)
+
+
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
     main()
@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+
+from modules import ai_cache
+from modules.ai_cache import AIResponseCache, answer_cache_key, cached_ai_response, cached_answers, make_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AIResponseCache(str(tmp_path / "ai_cache.db"), max_entries=3)
+
+
+def test_keys_ignore_whitespace_and_case_but_not_the_model():
+    key = make_cache_key("skills", "OpenAI", "gpt-4o", "Python  developer\n")
+
+    assert key == make_cache_key("skills", "openai", "gpt-4o", "python developer")
+    assert key != make_cache_key("skills", "openai", "gpt-4o-mini", "python developer")
+    assert key.startswith("skills:")
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    for name in "abc":
+        cache.put(f"answer:{name}", name)
+    assert cache.get("answer:a") == "a"
+
+    cache.put("answer:d", "d")
+
+    assert cache.get("answer:b") is None
+    assert [cache.get(f"answer:{name}") for name in "acd"] == ["a", "c", "d"]
+
+
+def test_expired_entries_miss_and_are_purged(cache):
+    cache.put("skills:old", ["python"], timedelta(seconds=-1))
+    cache.put("skills:new", ["sql"], timedelta(days=1))
+
+    assert cache.purge_expired() == 1
+    assert cache.get("skills:old") is None
+    assert cache.get("skills:new") == ["sql"]
+    assert cache.stats() == {"skills": {"hits": 1, "misses": 1}}
+
+
+def test_cached_ai_response_caches_only_successful_responses(cache, monkeypatch):
+    monkeypatch.setattr(ai_cache, "get_ai_cache", lambda: cache)
+    calls = []
+
+    def request(response):
+        def call():
+            calls.append(response)
+            return response
+        return call
+
+    assert cached_ai_response("skills:ok", request({"skills": ["go"]})) == {"skills": ["go"]}
+    assert cached_ai_response("skills:ok", request({"skills": ["rust"]})) == {"skills": ["go"]}
+    for failed in (None, "", {"error": "rate limited"}):
+        assert cached_ai_response("skills:failed", request(failed)) == failed
+    assert calls == [{"skills": ["go"]}, None, "", {"error": "rate limited"}]
+
+
+def test_job_specific_answers_are_keyed_by_job():
+    generic = ("openai", "m", "Years of Python?", "text", None)
+    specific = ("openai", "m", "Why do you want to join this team?", "text", None)
+
+    assert answer_cache_key(*generic, "Job A") == answer_cache_key(*generic, "Job B")
+    assert answer_cache_key(*specific, "Job A") != answer_cache_key(*specific, "Job B")
+
+def test_promoted_entries_are_never_evicted_or_expired(cache):
+    cache.put("answer:kept", "kept", timedelta(seconds=-1))
+    assert cache.promote("answer:kept")
+    for name in "abcd":
+        cache.put(f"answer:{name}", name)
+
+    assert cache.get("answer:kept") == "kept"
+    assert cache.get("answer:a") is None
+    assert not cache.promote("answer:missing")
+
+def test_schema_migration_keeps_existing_entries(tmp_path):
+    path = str(tmp_path / "ai_cache.db")
+    old = AIResponseCache(path)
+    with old._connect() as conn:
+        conn.execute("DROP TABLE ai_cache")
+        conn.execute(
+            "CREATE TABLE ai_cache (key TEXT PRIMARY KEY, kind TEXT NOT NULL, value TEXT NOT NULL, created_at REAL NOT NULL, "
+            "last_used REAL NOT NULL, expires_at REAL, hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("INSERT INTO ai_cache (key, kind, value, created_at, last_used) VALUES ('skills:x', 'skills', '[\"go\"]', 0, 0)")
+    old.close()
+
+    migrated = AIResponseCache(path)
+
+    assert migrated.get("skills:x") == ["go"]
+    assert migrated.promote("skills:x")
+
+
+def test_cached_answers_only_asks_the_missing_questions(cache, monkeypatch):
+    monkeypatch.setattr(ai_cache, "get_ai_cache", lambda: cache)
+    monkeypatch.setattr(ai_cache, "answer_cache_ttl", lambda: timedelta(days=1))
+    questions = [
+        {"id": "q1", "question": "Years of Python?", "type": "text", "options": None},
+        {"id": "q2", "question": "Willing to relocate?", "type": "single_select", "options": ["Yes", "No"]},
+    ]
+    cache.put(answer_cache_key("openai", "m", "Years of Python?", "text", None, "Job A", "me"), "5")
+    asked = []
+
+    def request(missing):
+        asked.append([question["id"] for question in missing])
+        return {"q2": "Yes", "unknown": "ignored"}
+
+    assert cached_answers("openai", "m", questions, "Job A", "me", request) == {"q1": "5", "q2": "Yes"}
+    assert cached_answers("openai", "m", questions, "Job B", "me", request) == {"q1": "5", "q2": "Yes"}
+    assert asked == [["q2"]]
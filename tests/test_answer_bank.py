@@ -0,0 +1,78 @@
+import pytest
+
+from modules.answer_bank import AnswerBank, AnswerRule, RuleMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return RuleMatcher()
+
+
+@pytest.mark.parametrize("label, answer", [
+    ("Full name", "full_name"),
+    ("First name", "first_name"),
+    ("First and last name", "full_name"),
+    ("Middle name", "middle_name"),
+    ("Last name", "last_name"),
+    ("Name of your most recent employer", "recent_employer"),
+    ("Name", "full_name"),
+    ("Signature", "full_name"),
+    ("Current CTC per month", "current_ctc_monthly"),
+    ("Current salary in lakhs", "current_ctc_lakhs"),
+    ("What is your present compensation?", "current_ctc"),
+    ("Expected salary per month", "desired_salary_monthly"),
+    ("Expected CTC in lakhs", "desired_salary_lakhs"),
+    ("Desired pay", "desired_salary"),
+    ("Notice period in months", "notice_period_months"),
+    ("Notice period in weeks", "notice_period_weeks"),
+    ("Notice period", "notice_period"),
+    ("Years of experience with Python", "years_of_experience"),
+    ("Do you require visa sponsorship?", "require_visa"),
+])
+def test_text_rules_match_in_table_order(matcher, label, answer):
+    assert matcher.match("text", label).answer == answer
+
+
+def test_rules_only_apply_to_their_question_types(matcher):
+    assert matcher.match("select", "Cover letter") is None
+    assert matcher.match("textarea", "Cover letter").answer == "cover_letter"
+    assert matcher.match("radio", "Are you a veteran?").answer == "veteran_status"
+    assert matcher.match("checkbox", "Name") is None
+
+
+def test_unmatched_label_returns_none(matcher):
+    assert matcher.match("text", "Favourite colour") is None
+    assert matcher.answer("text", "Favourite colour", {}) == (None, None)
+
+
+def test_answer_reads_values_and_do_actions(matcher):
+    answer, rule = matcher.answer("text", "Current city", {"city": "Austin"})
+
+    assert answer == "Austin"
+    assert rule.do_actions
+
+
+def test_custom_rules_and_labels_are_matched_literally():
+    matcher = RuleMatcher([AnswerRule(("text",), ("c++",), "cpp"), AnswerRule(("text",), (("a.b", "zz"),), "dots")])
+
+    assert matcher.match("text", "Years of C++").answer == "cpp"
+    assert matcher.match("text", "aXb") is None
+    assert matcher.match("text", "a.b").answer == "dots"
+
+
+def test_bank_learns_only_answers_no_rule_covers(tmp_path, matcher):
+    bank = AnswerBank(str(tmp_path / "bank.db"))
+    questions_list = {
+        ("favourite colour", "Blue", "text", ""),
+        ("first name", "Ada", "text", ""),
+        ("why do you want to join this team?", "Because", "text", ""),
+        ("shift [  \"Day\", \"Night\", ]", "Night", "select", "Select an option"),
+        ("unchanged", "Same", "text", "Same"),
+    }
+
+    assert bank.learn_from(questions_list, matcher) == 2
+    assert bank.get("text", "Favourite  Colour") == "Blue"
+    assert bank.get("select", "shift [  \"Day\", \"Night\", ]") == "Night"
+    assert bank.get("text", "first name") is None
+    assert bank.forget("text", "favourite colour")
+    assert bank.get("text", "favourite colour") is None
@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from modules import form_fields
+from modules.form_fields import snapshot_form, write_form
+
+
+class FakeDriver:
+    """Records `execute_script` calls and returns canned results, one per call."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        return self.results.pop(0)
+
+
+def test_snapshot_form_reads_the_form_in_one_call():
+    questions = [{"kind": "text", "label": "City", "options": [], "value": "", "element": "input"}]
+    driver = FakeDriver(questions)
+
+    assert snapshot_form(driver, "form") == questions
+    assert driver.calls == [(form_fields._FORM_SNAPSHOT_SCRIPT, ("form",))]
+
+
+def test_write_form_without_writes_skips_the_browser():
+    driver = FakeDriver()
+
+    assert write_form(driver, []) == []
+    assert driver.calls == []
+
+
+def test_write_form_batches_writes_and_maps_errors_to_none(monkeypatch):
+    logged = []
+    monkeypatch.setattr(form_fields, "print_lg", lambda *messages: logged.append(messages))
+    writes = [
+        {"element": "select", "kind": "select", "value": 1},
+        {"element": "fieldset", "kind": "radio", "value": 5},
+        {"element": "checkbox", "kind": "checkbox", "value": True},
+        {"element": "input", "kind": "text", "value": "Austin"},
+    ]
+    driver = FakeDriver(["Yes", {"error": "TypeError: input is undefined"}, True, "Austin"])
+
+    assert write_form(driver, writes) == ["Yes", None, True, "Austin"]
+    assert driver.calls == [(form_fields._FORM_WRITE_SCRIPT, (writes,))]
+    assert logged == [("Failed to fill radio field!", "TypeError: input is undefined")]
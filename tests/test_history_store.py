@@ -0,0 +1,170 @@
+import csv
+from datetime import datetime, timedelta
+
+import pytest
+
+from modules import history_store
+from modules.history_store import HISTORY_FIELDS, SUMMARY_FIELDS, ApplicationHistoryStore
+
+
+def make_record(job_id, date_applied, **fields):
+    record = {header: None for header in HISTORY_FIELDS}
+    record.update({"Job ID": job_id, "Title": f"Title {job_id}", "Company": "Acme", "Date Applied": date_applied})
+    record.update(fields)
+    return record
+
+
+def write_csv(path, records):
+    with path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(HISTORY_FIELDS))
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def test_legacy_csv_is_imported_only_once(tmp_path):
+    csv_path = tmp_path / "all_applied_applications_history.csv"
+    write_csv(csv_path, [make_record("1", "2024-01-01"), make_record("2", "2024-01-02"), make_record("", "2024-01-03")])
+    db_path = tmp_path / "history.db"
+
+    store = ApplicationHistoryStore(str(db_path), legacy_csv_path=str(csv_path))
+    assert [job["Job ID"] for job in store.list_applications()] == ["2", "1"]
+    store.add_application(make_record("3", "2024-01-03"))
+    store.close()
+
+    write_csv(csv_path, [make_record("4", "2024-01-04")])
+    reopened = ApplicationHistoryStore(str(db_path), legacy_csv_path=str(csv_path))
+    assert [job["Job ID"] for job in reopened.list_applications()] == ["3", "2", "1"]
+
+
+def test_reapplying_replaces_the_record(tmp_path):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    store.add_application(make_record("1", "2024-01-01", Title="Old"))
+    store.add_application(make_record("1", "2024-02-01", Title="New"))
+
+    assert store.has_applied("1")
+    assert store.get_application("1")["Title"] == "New"
+    assert len(store.list_applications()) == 1
+
+
+def test_export_csv_round_trips_the_history(tmp_path):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    store.add_application(make_record("1", "2024-01-01", **{"About Job": "Line one\nline, two"}))
+    store.add_application(make_record("2", "Pending"))
+
+    with (tmp_path / "export.csv").open("w", encoding="utf-8", newline="") as file:
+        assert store.export_csv(file) == 2
+    copy = ApplicationHistoryStore(str(tmp_path / "copy.db"))
+    assert copy.import_csv(str(tmp_path / "export.csv")) == 2
+
+    # CSV has no nulls, so empty columns come back as empty strings.
+    assert copy.get_application("1") == {key: value or "" for key, value in store.get_application("1").items()}
+    assert copy.get_application("2")["Date Applied"] == "Pending"
+
+
+def test_list_applications_pages_with_keyset_cursor(tmp_path):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    # Two applications share a date, so the Job ID has to break the tie.
+    for job_id, date in [("a", "2024-01-01"), ("b", "2024-01-02"), ("c", "2024-01-02"), ("d", "2024-01-03"), ("e", "")]:
+        store.add_application(make_record(job_id, date))
+
+    seen = []
+    after = None
+    while True:
+        page = store.list_applications(after=after, limit=2)
+        if not page:
+            break
+        assert set(page[0]) == set(SUMMARY_FIELDS)
+        seen.extend(job["Job ID"] for job in page)
+        after = (page[-1]["Date Applied"], page[-1]["Job ID"])
+    assert seen == ["d", "c", "b", "a", "e"]
+
+    ascending = store.list_applications(ascending=True, after=("2024-01-02", "b"))
+    assert [job["Job ID"] for job in ascending] == ["c", "d"]
+
+
+def test_list_applications_filters_escape_like_wildcards(tmp_path):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    store.add_application(make_record("1", "2024-01-01", Company="100% Remote"))
+    store.add_application(make_record("2", "2024-01-02", Company="1000 Remote"))
+
+    assert [job["Job ID"] for job in store.list_applications(company="0% r")] == ["1"]
+
+
+
+@pytest.fixture(params=[True, False], ids=["fts5", "like"])
+def searchable_store(request, tmp_path):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    if not request.param:
+        store.full_text_search = False
+    elif not store.full_text_search:
+        pytest.skip("SQLite was built without FTS5")
+    store.add_application(make_record("1", "2024-01-01", Title="Senior C++ Engineer", **{"About Job": "Remote, low-latency trading"}))
+    store.add_application(make_record("2", "2024-01-02", Title="Python Developer", **{"Skills required": "['Django', 'SQL']"}))
+    store.add_application(make_record("3", "2024-01-03", Title="Data Engineering Lead", Company="O'Reilly"))
+    return store
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("engineer", ["3", "1"]),
+    ('C++ "remote" (trading)', ["1"]),
+    ("django", ["2"]),
+    ("o'reilly", ["3"]),
+    ("NOT python OR", []),
+    ('"*() -', ["3", "2", "1"]),
+])
+def test_search_handles_punctuation_with_and_without_fts(searchable_store, query, expected):
+    assert [job["Job ID"] for job in searchable_store.list_applications(search=query)] == expected
+
+
+class FrozenClock:
+    """Stands in for `datetime` in `modules.history_store`, so expiries can be crossed without waiting."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def utcnow(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    frozen = FrozenClock(datetime(2024, 1, 1))
+    monkeypatch.setattr(history_store, "datetime", frozen)
+    return frozen
+
+
+def test_rejections_expire_after_their_ttl(tmp_path, clock):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    store.reject_job("1", "Acme", "bad words", timedelta(days=7), detail="clearance")
+    store.add_application(make_record("2", "2024-01-01"))
+
+    assert store.is_rejected("1") and store.is_known("1") and store.is_known("2")
+    assert not store.is_known("3")
+
+    clock.now += timedelta(days=7)
+    assert not store.is_rejected("1")
+    assert not store.is_known("1") and store.is_known("2")
+
+
+def test_rejecting_again_renews_the_expiry(tmp_path, clock):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    store.reject_job("1", "Acme", "bad words", timedelta(days=1))
+    clock.now += timedelta(hours=23)
+    store.reject_job("1", "Acme", "experience too high", timedelta(days=1))
+
+    clock.now += timedelta(hours=2)
+    assert store.is_rejected("1")
+
+
+def test_blacklisted_companies_expire_and_are_purged(tmp_path, clock):
+    store = ApplicationHistoryStore(str(tmp_path / "history.db"))
+    store.blacklist_company("Acme", "bad words in about company", timedelta(days=30))
+    store.blacklist_company("Initech", "blacklisted", timedelta(days=1))
+    store.reject_job("1", "Acme", "bad words", timedelta(days=1))
+    assert store.blacklisted_companies() == {"Acme": "bad words in about company", "Initech": "blacklisted"}
+
+    clock.now += timedelta(days=2)
+    assert store.blacklisted_companies() == {"Acme": "bad words in about company"}
+    assert store.purge_expired() == 2
+    assert store.purge_expired() == 0
+    assert store.blacklisted_companies() == {"Acme": "bad words in about company"}
@@ -0,0 +1,147 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from modules.job_fetcher import parse_job_page
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_parse_job_page_reads_server_rendered_markup():
+    details = parse_job_page((FIXTURES / "job_page.html").read_text(encoding="utf-8"))
+
+    assert details["settled"]
+    assert details["description"].splitlines()[0] == "We are looking for a Senior Python Developer & mentor."
+    assert "5+ years of Python" in details["description"]
+    assert "Experience with SQL\nand Selenium" in details["description"]
+    assert details["description_html"].startswith("<p>We are looking for a <strong>Senior Python Developer</strong> &amp; mentor.</p>")
+    assert '<img src="team.png" alt="Team">' in details["description_html"]
+    assert details["posted_text"] == "Reposted 3 days ago"
+    assert details["about_company"] == "About the company\n\nAcme builds rockets."
+    assert details["hirer_name"] == "Jane Doe"
+    assert details["hirer_link"] == "https://www.linkedin.com/in/jane-doe"
+    assert not details["applied"]
+
+
+def test_parse_job_page_falls_back_to_embedded_json():
+    details = parse_job_page((FIXTURES / "job_page_json_only.html").read_text(encoding="utf-8"))
+
+    assert details["description"] == "Description from embedded JSON"
+    assert details["description_html"] is None
+    assert details["applied"]
+    assert details["hirer_name"] is None
+
+
+def test_parse_job_page_without_details():
+    details = parse_job_page("<html><body><p>Sign in to see this job</p></body></html>")
+
+    assert not details["settled"]
+    assert all(details[key] is None for key in ("description", "about_company", "posted_text", "hirer_name", "hirer_link"))
+
+
+@pytest.fixture
+def job_server():
+    """Serves the fixture pages at `/jobs/view/<job_id>/`, like LinkedIn would, and records each request."""
+    pytest.importorskip("requests")
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append((time.monotonic(), self.path, self.headers.get("Cookie"), self.headers.get("User-Agent")))
+            job_id = self.path.strip("/").split("/")[-1]
+            if job_id == "slow":
+                time.sleep(1)
+            page = FIXTURES / {"1": "job_page.html", "2": "job_page_json_only.html"}.get(job_id, "missing.html")
+            if job_id == "empty":
+                body, status = b"<html><body></body></html>", 200
+            elif page.exists():
+                body, status = page.read_bytes(), 200
+            else:
+                body, status = b"Not found", 404
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except OSError:
+                pass  # The client gave up on a slow response.
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests_seen
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def make_fetcher(base_url, **options):
+    from modules.job_fetcher import JobDetailFetcher
+
+    options.setdefault("min_interval", 0)
+    return JobDetailFetcher(
+        [{"name": "li_at", "value": "session-token", "domain": "127.0.0.1"}],
+        "TestBrowser/1.0",
+        base_url=base_url + "/",
+        **options,
+    )
+
+
+def test_fetch_parses_the_served_page_with_the_browser_session(job_server):
+    base_url, requests_seen = job_server
+    fetcher = make_fetcher(base_url)
+    try:
+        details = fetcher.fetch("1")
+    finally:
+        fetcher.close()
+
+    assert details == parse_job_page((FIXTURES / "job_page.html").read_text(encoding="utf-8"))
+    [(_, path, cookie, user_agent)] = requests_seen
+    assert (path, cookie, user_agent) == ("/jobs/view/1/", "li_at=session-token", "TestBrowser/1.0")
+
+
+@pytest.mark.parametrize("job_id", ["404", "empty", "slow"], ids=["not-found", "no-description", "timeout"])
+def test_fetch_returns_none_when_the_page_is_unusable(job_server, job_id):
+    base_url, _ = job_server
+    fetcher = make_fetcher(base_url, timeout=0.2)
+    try:
+        assert fetcher.fetch(job_id) is None
+    finally:
+        fetcher.close()
+
+
+def test_submit_returns_a_future_per_job_in_request_order(job_server):
+    base_url, _ = job_server
+    fetcher = make_fetcher(base_url, max_workers=3)
+    try:
+        futures = fetcher.submit(["2", "404", "1"])
+        assert list(futures) == ["2", "404", "1"]
+        results = {job_id: future.result(timeout=5) for job_id, future in futures.items()}
+    finally:
+        fetcher.close()
+
+    assert results["2"]["description"] == "Description from embedded JSON"
+    assert results["404"] is None
+    assert results["1"]["hirer_name"] == "Jane Doe"
+
+
+def test_requests_are_spaced_by_min_interval_across_workers(job_server):
+    base_url, requests_seen = job_server
+    fetcher = make_fetcher(base_url, max_workers=4, min_interval=0.2)
+    try:
+        for future in fetcher.submit(["1", "2", "1", "2"]).values():
+            future.result(timeout=5)
+    finally:
+        fetcher.close()
+
+    times = sorted(seen[0] for seen in requests_seen)
+    assert len(times) == 4
+    # Small allowance for the server thread picking up each request.
+    assert all(later - earlier >= 0.15 for earlier, later in zip(times, times[1:]))
@@ -0,0 +1,88 @@
+import random
+
+from modules.job_index import BloomFilter, KnownJobIndex
+
+
+class FakeSource:
+    """In-memory `KnownJobSource` whose cursor is the number of Job IDs already read."""
+
+    def __init__(self, job_ids=()):
+        self.job_ids = list(job_ids)
+        self.lookups = 0
+
+    def known_job_ids_since(self, cursor):
+        start = cursor.get("jobs", 0)
+        return self.job_ids[start:], {"jobs": len(self.job_ids)}
+
+    def is_known(self, job_id):
+        self.lookups += 1
+        return job_id in self.job_ids
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    job_ids = [str(random.randrange(10**9, 10**10)) for _ in range(1000)]
+    for job_id in job_ids:
+        bloom.add(job_id)
+
+    assert all(job_id in bloom for job_id in job_ids)
+
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(1000, 0.01)
+    for index in range(1000):
+        bloom.add(f"known-{index}")
+
+    false_positives = sum(f"new-{index}" in bloom for index in range(10000))
+
+    assert false_positives < 300
+
+
+def test_index_confirms_bloom_hits_with_the_source(tmp_path):
+    source = FakeSource(["1", "2", "3"])
+    index = KnownJobIndex(source, str(tmp_path / "known.bloom"), capacity=100)
+
+    assert "2" in index
+    assert "4" not in index
+
+
+def test_refresh_picks_up_new_ids(tmp_path):
+    source = FakeSource(["1"])
+    index = KnownJobIndex(source, str(tmp_path / "known.bloom"), capacity=100)
+    source.job_ids.append("2")
+
+    assert index.refresh() == 1
+    assert "2" in index
+
+
+def test_outgrown_filter_is_rebuilt_from_every_id(tmp_path):
+    source = FakeSource([str(job_id) for job_id in range(10)])
+    index = KnownJobIndex(source, str(tmp_path / "known.bloom"), capacity=16)
+    source.job_ids.extend(str(job_id) for job_id in range(10, 100))
+
+    index.refresh()
+
+    assert index.bloom.capacity >= 200
+    assert all(str(job_id) in index for job_id in range(100))
+    assert index.cursor == {"jobs": 100}
+
+
+def test_saved_filter_is_loaded_with_its_cursor(tmp_path):
+    path = str(tmp_path / "known.bloom")
+    source = FakeSource(["1", "2"])
+    KnownJobIndex(source, path, capacity=100).save()
+    source.job_ids.append("3")
+
+    loaded = KnownJobIndex(source, path, capacity=100)
+
+    assert loaded.cursor == {"jobs": 3}
+    assert all(job_id in loaded.bloom for job_id in ("1", "2", "3"))
+
+
+def test_corrupt_filter_file_is_ignored(tmp_path):
+    path = tmp_path / "known.bloom"
+    path.write_bytes(b"not a bloom filter")
+
+    index = KnownJobIndex(FakeSource(["1"]), str(path), capacity=100)
+
+    assert "1" in index
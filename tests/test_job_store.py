@@ -0,0 +1,118 @@
+import threading
+
+from modules.job_store import JobStore
+
+
+def make_store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+def test_connection_is_pooled_per_thread(tmp_path):
+    store = make_store(tmp_path)
+    main_connection = store._connect()
+    other_connections = []
+    thread = threading.Thread(target=lambda: other_connections.append(store._connect()))
+    thread.start()
+    thread.join()
+
+    assert store._connect() is main_connection
+    assert other_connections[0] is not main_connection
+
+
+def test_connections_use_wal(tmp_path):
+    store = make_store(tmp_path)
+
+    assert store._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_close_reconnects_on_next_use(tmp_path):
+    store = make_store(tmp_path)
+    job_id = store.create_job({"profileName": "alice"})
+    connection = store._connect()
+
+    store.close()
+
+    assert store._connect() is not connection
+    assert store.get_job(job_id)["payload"] == {"profileName": "alice"}
+
+
+def test_claim_respects_per_profile_cap(tmp_path):
+    store = make_store(tmp_path)
+    first = store.create_job({"profileName": "alice"})
+    second = store.create_job({"profileName": "alice"})
+    other = store.create_job({"profileName": "bob"})
+
+    claimed = [store.claim_next_job("worker", 60, max_per_profile=1) for _ in range(3)]
+
+    assert {job["id"] for job in claimed if job} == {first, other}
+    assert claimed[2] is None
+    assert store.get_job(second)["status"] == "queued"
+
+
+def test_claim_allows_up_to_cap(tmp_path):
+    store = make_store(tmp_path)
+    job_ids = {store.create_job({"profileName": "alice"}) for _ in range(3)}
+
+    claimed = [store.claim_next_job("worker", 60, max_per_profile=2) for _ in range(3)]
+
+    assert sum(job is not None for job in claimed) == 2
+    assert {job["id"] for job in claimed if job} < job_ids
+
+
+def test_claim_prefers_least_recently_served_profile(tmp_path):
+    store = make_store(tmp_path)
+    store.create_job({"profileName": "alice"})
+    store.create_job({"profileName": "alice"})
+    bob = store.create_job({"profileName": "bob"})
+
+    first = store.claim_next_job("worker", 60, max_per_profile=5)
+    second = store.claim_next_job("worker", 60, max_per_profile=5)
+
+    assert first["payload"]["profileName"] == "alice"
+    assert second["id"] == bob
+
+
+def test_expired_lease_is_requeued_and_old_owner_loses_it(tmp_path):
+    store = make_store(tmp_path)
+    job_id = store.create_job({})
+    assert store.claim_next_job("dead-worker", -1)["id"] == job_id
+
+    assert store.requeue_expired_leases() == 1
+    assert store.get_job(job_id)["status"] == "queued"
+
+    assert store.claim_next_job("new-worker", 60)["id"] == job_id
+    assert not store.renew_lease(job_id, "dead-worker", 60)
+    assert not store.release_job(job_id, "dead-worker")
+    assert store.renew_lease(job_id, "new-worker", 60, progress=50)
+
+
+def test_live_lease_is_not_requeued(tmp_path):
+    store = make_store(tmp_path)
+    job_id = store.create_job({})
+    store.claim_next_job("worker", 60)
+
+    assert store.requeue_expired_leases() == 0
+    assert store.get_job(job_id)["status"] == "running"
+
+
+def test_release_returns_job_to_queue(tmp_path):
+    store = make_store(tmp_path)
+    job_id = store.create_job({})
+    store.claim_next_job("worker", 60)
+
+    assert store.release_job(job_id, "worker")
+    job = store.get_job(job_id)
+    assert job["status"] == "queued"
+    assert job["progress"] == 0
+    assert store.claim_next_job("other", 60)["id"] == job_id
+
+
+def test_leaving_running_drops_the_lease(tmp_path):
+    store = make_store(tmp_path)
+    job_id = store.create_job({})
+    store.claim_next_job("worker", 60)
+
+    store.update_status(job_id, "completed", progress=100)
+
+    assert not store.renew_lease(job_id, "worker", 60)
+    assert store.requeue_expired_leases() == 0
@@ -0,0 +1,73 @@
+from modules.helpers import read_log_since, tail_log_lines
+
+
+def write_lines(path, count, start=0):
+    with path.open("a", encoding="utf-8") as file:
+        for number in range(start, start + count):
+            file.write(f"line {number}\n")
+
+
+def test_tail_returns_last_lines_across_blocks(tmp_path):
+    path = tmp_path / "bot.log"
+    write_lines(path, 500)
+
+    lines, offset = tail_log_lines(str(path), max_lines=3, block_size=16)
+
+    assert lines == ["line 497\n", "line 498\n", "line 499\n"]
+    assert offset == path.stat().st_size
+
+
+def test_tail_stops_before_partial_last_line(tmp_path):
+    path = tmp_path / "bot.log"
+    path.write_bytes(b"first\nsecond\nhalf")
+
+    lines, offset = tail_log_lines(str(path), max_lines=10)
+
+    assert lines == ["first\n", "second\n"]
+    assert offset == len(b"first\nsecond\n")
+
+
+def test_read_since_none_starts_at_end(tmp_path):
+    path = tmp_path / "bot.log"
+    write_lines(path, 5)
+
+    assert read_log_since(str(path), None) == ([], path.stat().st_size, False)
+
+
+def test_read_since_returns_only_appended_complete_lines(tmp_path):
+    path = tmp_path / "bot.log"
+    write_lines(path, 2)
+    _, offset = tail_log_lines(str(path))
+
+    with path.open("ab") as file:
+        file.write(b"new\npart")
+    lines, offset, truncated = read_log_since(str(path), offset)
+    assert (lines, truncated) == (["new\n"], False)
+
+    with path.open("ab") as file:
+        file.write(b"ial\n")
+    lines, offset, _ = read_log_since(str(path), offset)
+    assert lines == ["partial\n"]
+    assert read_log_since(str(path), offset) == ([], offset, False)
+
+
+def test_read_since_restarts_after_rotation(tmp_path):
+    path = tmp_path / "bot.log"
+    write_lines(path, 50)
+    offset = path.stat().st_size
+
+    path.write_text("fresh\n", encoding="utf-8")
+
+    lines, next_offset, truncated = read_log_since(str(path), offset)
+    assert (lines, next_offset, truncated) == (["fresh\n"], len(b"fresh\n"), False)
+
+
+def test_read_since_truncates_large_appends_to_last_lines(tmp_path):
+    path = tmp_path / "bot.log"
+    write_lines(path, 1000)
+
+    lines, offset, truncated = read_log_since(str(path), 0, max_bytes=100, max_lines=2)
+
+    assert truncated
+    assert lines == ["line 998\n", "line 999\n"]
+    assert offset == path.stat().st_size
@@ -0,0 +1,77 @@
+import gzip
+
+from modules import log_writer
+from modules.log_writer import BufferedLogWriter, open_log_writer
+
+
+def test_flush_writes_queued_text(tmp_path):
+    path = tmp_path / "logs" / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_interval=60)
+    writer.write("first\n")
+    writer.write("second\n")
+
+    assert writer.flush()
+    assert path.read_text(encoding="utf-8") == "first\nsecond\n"
+    writer.close()
+
+
+def test_close_flushes_and_ignores_later_writes(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_interval=60)
+    writer.write("kept\n")
+    writer.close()
+    writer.write("dropped\n")
+
+    assert path.read_text(encoding="utf-8") == "kept\n"
+    assert writer.flush()
+
+
+def test_rotation_compresses_and_keeps_backup_count(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), max_buffer_bytes=1, max_file_bytes=10, backup_count=2)
+    for number in range(4):
+        writer.write(f"entry {number:04}\n")
+        assert writer.flush()
+    writer.close()
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["log.txt.1.gz", "log.txt.2.gz"]
+    assert gzip.open(tmp_path / "log.txt.1.gz", "rt").read() == "entry 0003\n"
+    assert gzip.open(tmp_path / "log.txt.2.gz", "rt").read() == "entry 0002\n"
+
+
+def test_reopens_file_moved_away_by_another_process(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), max_buffer_bytes=1)
+    writer.write("before\n")
+    assert writer.flush()
+
+    path.rename(tmp_path / "log.txt.1")
+    writer.write("after\n")
+    assert writer.flush()
+    writer.close()
+
+    assert path.read_text(encoding="utf-8") == "after\n"
+
+
+def test_write_errors_are_kept_for_the_caller(tmp_path):
+    blocker = tmp_path / "not_a_folder"
+    blocker.write_text("", encoding="utf-8")
+    writer = BufferedLogWriter(str(blocker / "log.txt"), max_buffer_bytes=1)
+    writer.write("lost\n")
+    assert writer.flush()
+    writer.close()
+
+    assert isinstance(writer.take_error(), OSError)
+    assert writer.take_error() is None
+
+
+def test_open_log_writer_closes_at_exit(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(log_writer.atexit, "register", registered.append)
+
+    writer = open_log_writer(str(tmp_path / "log.txt"), flush_interval=60)
+    writer.write("pending\n")
+    assert registered == [writer.close]
+
+    registered[0]()
+    assert (tmp_path / "log.txt").read_text(encoding="utf-8") == "pending\n"
@@ -0,0 +1,47 @@
+import json
+
+from modules import progress
+from modules.progress import PROGRESS_PATH_ENV, ProgressTail
+
+
+def test_tail_keeps_partial_trailing_line_for_next_read(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    tail = ProgressTail(str(path))
+    assert tail.read_new() == []
+
+    path.write_bytes(b'{"applied": 1}\n{"applied"')
+    assert tail.read_new() == [{"applied": 1}]
+
+    with path.open("ab") as file:
+        file.write(b': 2}\n')
+    assert tail.read_new() == [{"applied": 2}]
+    assert tail.read_new() == []
+
+
+def test_tail_skips_malformed_and_non_object_lines(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    path.write_text('not json\n[1, 2]\n{"percent": 50}\n', encoding="utf-8")
+
+    assert ProgressTail(str(path)).read_new() == [{"percent": 50}]
+
+
+def test_report_progress_appends_json_lines(tmp_path, monkeypatch):
+    path = tmp_path / "progress.jsonl"
+    monkeypatch.setenv(PROGRESS_PATH_ENV, str(path))
+    monkeypatch.setattr(progress, "_progress_file", None)
+    monkeypatch.setattr(progress, "_progress_disabled", False)
+
+    progress.report_progress(applied=3, search_term="Python")
+    progress._progress_file.close()
+
+    assert [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] == [{"applied": 3, "search_term": "Python"}]
+
+
+def test_report_progress_is_a_no_op_without_a_path(monkeypatch):
+    monkeypatch.delenv(PROGRESS_PATH_ENV, raising=False)
+    monkeypatch.setattr(progress, "_progress_file", None)
+    monkeypatch.setattr(progress, "_progress_disabled", False)
+
+    progress.report_progress(applied=1)
+
+    assert progress._progress_disabled
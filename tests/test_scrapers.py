@@ -0,0 +1,15 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from modules.scrapers import parse_card_subtitle
+
+
+@pytest.mark.parametrize("subtitle, expected", [
+    ("Acme · Austin, TX (Hybrid)", ("Acme", "Austin, TX", "Hybrid")),
+    ("Acme Corp. · United States (Remote)", ("Acme Corp.", "United States", "Remote")),
+    ("Initech · Berlin (Office) (On-site)", ("Initech", "Berlin (Office)", "On-site")),
+    ("", ("", "", "")),
+])
+def test_parse_card_subtitle(subtitle, expected):
+    assert parse_card_subtitle(subtitle) == expected